@@ -0,0 +1,41 @@
+"""Generate score ids in the database
+
+Revision ID: 9919dc31dc39
+Revises: 918172c30568
+Create Date: 2026-10-16 16:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9919dc31dc39'
+down_revision: Union[str, None] = '918172c30568'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # gen_random_uuid() is built in since PostgreSQL 13 (no pgcrypto needed)
+    op.alter_column('evaluation_competency_scores', 'id',
+               existing_type=sa.UUID(),
+               server_default=sa.text('gen_random_uuid()'),
+               existing_nullable=False)
+    op.alter_column('user_skill_scores', 'id',
+               existing_type=sa.UUID(),
+               server_default=sa.text('gen_random_uuid()'),
+               existing_nullable=False)
+
+
+def downgrade() -> None:
+    op.alter_column('user_skill_scores', 'id',
+               existing_type=sa.UUID(),
+               server_default=None,
+               existing_nullable=False)
+    op.alter_column('evaluation_competency_scores', 'id',
+               existing_type=sa.UUID(),
+               server_default=None,
+               existing_nullable=False)
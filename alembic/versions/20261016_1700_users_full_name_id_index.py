@@ -0,0 +1,25 @@
+"""Index users by (full_name, id) for list ordering and keyset pagination
+
+Revision ID: a3c5e81f0b27
+Revises: 9919dc31dc39
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c5e81f0b27'
+down_revision: Union[str, None] = '9919dc31dc39'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_users_full_name_id', 'users', ['full_name', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_full_name_id', table_name='users')
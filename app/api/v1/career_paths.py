@@ -3,6 +3,7 @@ from typing import Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, status, Query, Body
 from pydantic import BaseModel, Field
+from app.core.responses import PydanticResponse
 from app.services.career_path_service import CareerPathService
 from app.services.dependencies import get_career_path_service
 
@@ -87,7 +88,7 @@ class GenerateCareerPathsRequest(BaseModel):
 async def generate_career_paths(
     data: GenerateCareerPathRequest,
     service: CareerPathService = Depends(get_career_path_service),
-) -> list[CareerPathResponse]:
+) -> PydanticResponse:
     """
     Generate AI Career Paths.
     Returns:
@@ -103,7 +104,7 @@ async def generate_career_paths(
         career_interests=data.career_interests,
         time_horizon_years=data.time_horizon_years,
     )
-    return paths
+    return PydanticResponse(paths, status_code=status.HTTP_201_CREATED)
 
 
 @router.post(
@@ -140,7 +141,7 @@ async def generate_career_paths_legacy(
     user_id: UUID,
     request: GenerateCareerPathsRequest = Body(...),
     service: CareerPathService = Depends(get_career_path_service),
-) -> list[CareerPathResponse]:
+) -> PydanticResponse:
     """
     Generate AI Career Paths.
     Returns:
@@ -156,7 +157,7 @@ async def generate_career_paths_legacy(
         career_interests=request.career_interests,
         time_horizon_years=request.time_horizon_years,
     )
-    return paths
+    return PydanticResponse(paths, status_code=status.HTTP_201_CREATED)
 
 
 @router.get(
@@ -181,7 +182,7 @@ async def generate_career_paths_legacy(
 async def get_recommended_career_paths(
     user_id: UUID,
     service: CareerPathService = Depends(get_career_path_service),
-) -> list[CareerPathResponse]:
+) -> PydanticResponse:
     """
     Get recommended career paths for a user.
     
@@ -193,7 +194,7 @@ async def get_recommended_career_paths(
         List of recommended career paths
     """
     paths = await service.get_recommended_paths(user_id)
-    return paths
+    return PydanticResponse(paths)
 
 
 @router.get(
@@ -222,14 +223,14 @@ async def get_career_paths_for_user(
         description="Filter by status: proposed, accepted, in_progress, completed, discarded",
     ),
     service: CareerPathService = Depends(get_career_path_service),
-) -> list[CareerPathResponse]:
+) -> PydanticResponse:
     """
     Get career paths for a user.
     Returns:
         List of career paths, optionally filtered by status.
     """
     paths = await service.get_paths_for_user(user_id, status=status)
-    return paths
+    return PydanticResponse(paths)
 
 
 @router.get(
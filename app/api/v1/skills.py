@@ -90,6 +90,9 @@ async def get_skill(
     - `global_only`: Only return global skills (default: false)
     - `limit`: Maximum results (default: 100, max: 1000)
     - `offset`: Pagination offset (default: 0)
+    - `after_id`: Keyset cursor, the id of the last skill of the previous page;
+      prefer it over large offsets. Unfiltered listings only: combining it
+      with a filter returns 422
     
     Results are ordered alphabetically by skill name.
     
@@ -105,6 +108,9 @@ async def list_skills(
     global_only: bool = Query(False, description="Only return global skills"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum results"),
     offset: int = Query(0, ge=0, description="Pagination offset"),
+    after_id: Optional[UUID] = Query(
+        None, description="Keyset cursor: id of the last item of the previous page"
+    ),
     service: SkillService = Depends(get_skill_service),
 ) -> list[SkillResponse]:
     """
@@ -112,6 +118,9 @@ async def list_skills(
     
     Returns:
         List of skills (can be empty)
+        
+    Raises:
+        422: after_id combined with a filter
     """
     return await service.list_skills(
         active_only=active_only,
@@ -119,6 +128,7 @@ async def list_skills(
         global_only=global_only,
         limit=limit,
         offset=offset,
+        after_id=after_id,
     )
 
 
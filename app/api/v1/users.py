@@ -89,6 +89,9 @@ async def get_user(
     - `manager_id`: Get direct reports of a manager
     - `limit`: Maximum results (default: 100, max: 1000)
     - `offset`: Pagination offset (default: 0)
+    - `after_id`: Keyset cursor, the id of the last user of the previous page;
+      prefer it over large offsets. Unfiltered listings only: combining it
+      with a filter returns 422
     
     Results are ordered alphabetically by full name.
     """,
@@ -99,6 +102,9 @@ async def list_users(
     manager_id: Optional[UUID] = Query(None, description="Filter by manager (direct reports)"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum results"),
     offset: int = Query(0, ge=0, description="Pagination offset"),
+    after_id: Optional[UUID] = Query(
+        None, description="Keyset cursor: id of the last item of the previous page"
+    ),
     service: UserService = Depends(get_user_service),
 ) -> list[UserResponse]:
     """
@@ -106,6 +112,9 @@ async def list_users(
     
     Returns:
         List of users (can be empty)
+        
+    Raises:
+        422: after_id combined with a filter
     """
     return await service.list_users(
         active_only=active_only,
@@ -113,6 +122,7 @@ async def list_users(
         manager_id=manager_id,
         limit=limit,
         offset=offset,
+        after_id=after_id,
     )
 
 
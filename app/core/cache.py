@@ -0,0 +1,48 @@
+"""Small in-process caches for rarely-changing reference data."""
+
+import time
+from typing import Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Keyed in-process cache whose entries expire after a fixed TTL.
+
+    Not shared between worker processes; values must be treated as
+    read-only by callers since the same object is handed out on every hit.
+    """
+
+    def __init__(self, ttl_seconds: float) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            ttl_seconds: Entry lifetime in seconds (0 disables caching)
+        """
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[K, tuple[float, V]] = {}
+
+    def get(self, key: K) -> Optional[V]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Store a value for ``ttl_seconds``."""
+        if self.ttl_seconds > 0:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def invalidate(self, key: Optional[K] = None) -> None:
+        """Drop one entry, or every entry when no key is given."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
@@ -73,6 +73,50 @@ class Settings(BaseSettings):
         alias="DB_ECHO",
         description="Log all SQL statements (use only in development/test)",
     )
+    db_pool_size: int = Field(
+        default=20,
+        ge=1,
+        le=200,
+        alias="DB_POOL_SIZE",
+        description="Persistent connections kept in the engine pool",
+    )
+    db_max_overflow: int = Field(
+        default=20,
+        ge=0,
+        le=200,
+        alias="DB_MAX_OVERFLOW",
+        description="Extra connections opened above DB_POOL_SIZE under load",
+    )
+    db_pool_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        alias="DB_POOL_TIMEOUT",
+        description="Seconds to wait for a free pooled connection",
+    )
+    db_pool_recycle: int = Field(
+        default=1800,
+        ge=-1,
+        alias="DB_POOL_RECYCLE",
+        description="Seconds after which a pooled connection is replaced (-1 disables)",
+    )
+
+    # -------------------------------------------------------------------------
+    # Caching
+    # -------------------------------------------------------------------------
+    role_catalog_cache_ttl: int = Field(
+        default=60,
+        ge=0,
+        le=3600,
+        alias="ROLE_CATALOG_CACHE_TTL",
+        description="Seconds to reuse the active role catalog in-process (0 disables)",
+    )
+    skill_id_cache_ttl: int = Field(
+        default=300,
+        ge=0,
+        le=3600,
+        alias="SKILL_ID_CACHE_TTL",
+        description="Seconds to reuse resolved active skill name -> id lookups (0 disables)",
+    )
 
     # -------------------------------------------------------------------------
     # AI Services
@@ -107,6 +151,13 @@ class Settings(BaseSettings):
         alias="AI_SERVICE_TIMEOUT",
         description="Timeout for AI HTTP calls in seconds",
     )
+    ai_service_keepalive_expiry: float = Field(
+        default=30.0,
+        ge=0.0,
+        le=300.0,
+        alias="AI_SERVICE_KEEPALIVE_EXPIRY",
+        description="Seconds an idle AI connection is kept open for reuse",
+    )
     ai_service_max_retries: int = Field(
         default=3,
         ge=0,
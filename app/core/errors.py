@@ -4,6 +4,8 @@ from typing import Any, Optional
 
 from app.core.error_constants import ERROR_CODES
 
+_NO_DEFINITION: dict[str, object] = {}
+
 
 class AppError(Exception):
     """Base application error."""
@@ -16,14 +18,20 @@ class AppError(Exception):
         details: Optional[dict[str, Any]] = None,
     ) -> None:
         """Initialize application error."""
-        definition = ERROR_CODES.get(code, {})
-        resolved_message = message or definition.get("message", "Application error")  # type: ignore[arg-type]
-        resolved_status = status_code or int(definition.get("status_code", 500))  # type: ignore[arg-type]
+        resolved_message = message
+        resolved_status = status_code
+        # Defaults are only looked up for what the caller did not provide
+        # (subclasses always pass status_code; services usually pass message)
+        if not resolved_message or not resolved_status:
+            definition = ERROR_CODES.get(code, _NO_DEFINITION)
+            resolved_message = resolved_message or definition.get("message", "Application error")  # type: ignore[assignment]
+            resolved_status = resolved_status or int(definition.get("status_code", 500))  # type: ignore[arg-type]
 
         super().__init__(resolved_message)
         self.message = resolved_message
         self.code = code
         self.status_code = resolved_status
+        # Stored by reference, never copied
         self.details = details or {}
 
 
@@ -0,0 +1,18 @@
+"""Custom HTTP response classes."""
+from typing import Any
+
+import pydantic_core
+from fastapi.responses import JSONResponse
+
+
+class PydanticResponse(JSONResponse):
+    """JSON response for content that is already validated Pydantic models.
+
+    Serializes models (or lists of models) directly with pydantic-core, so
+    routes returning it skip FastAPI's ``response_model`` re-validation and
+    ``jsonable_encoder`` pass. Keep ``response_model`` on the route decorator
+    for the OpenAPI schema.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return pydantic_core.to_json(content)
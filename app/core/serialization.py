@@ -0,0 +1,45 @@
+"""JSON serialization shared by the HTTP clients and the database engine."""
+
+from typing import Any
+
+import pydantic_core
+
+
+class RawJSON:
+    """Already-serialized JSON value, embedded verbatim by :func:`dumps`.
+
+    Lets a large, reused value (e.g. the organization structure sent to the
+    AI service) be encoded once and spliced into every payload that carries it.
+    """
+
+    __slots__ = ("json",)
+
+    def __init__(self, json: bytes) -> None:
+        self.json = json
+
+    @classmethod
+    def of(cls, value: Any) -> "RawJSON":
+        """Serialize ``value`` once and wrap the result."""
+        return cls(pydantic_core.to_json(value))
+
+
+def dumps(value: Any) -> bytes:
+    """Serialize ``value`` to JSON bytes with pydantic-core.
+
+    :class:`RawJSON` values (at any depth) are emitted as-is; they are
+    serialized as placeholder strings and substituted afterwards, so payloads
+    without fragments take the plain ``to_json`` path.
+    """
+    fragments: dict[bytes, bytes] = {}
+
+    def _fallback(obj: Any) -> str:
+        if isinstance(obj, RawJSON):
+            token = f"__raw_json_{len(fragments)}_{id(obj)}__"
+            fragments[f'"{token}"'.encode()] = obj.json
+            return token
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    data = pydantic_core.to_json(value, fallback=_fallback)
+    for placeholder, raw in fragments.items():
+        data = data.replace(placeholder, raw, 1)
+    return data
@@ -50,7 +50,9 @@ class CareerPath(Base):
     # Path Metadata
     path_name: Mapped[str] = mapped_column(String(200), nullable=False)
     recommended: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
-    feasibility_score: Mapped[Optional[float]] = mapped_column(Numeric(5, 4), nullable=True)
+    feasibility_score: Mapped[Optional[float]] = mapped_column(
+        Numeric(5, 4, asdecimal=False), nullable=True
+    )
     total_duration_months: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     # Path Status
@@ -8,7 +8,7 @@ from datetime import date, datetime, timezone
 from typing import Optional, TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import Boolean, Date, ForeignKey, String, func
+from sqlalchemy import Boolean, Date, ForeignKey, Index, String, func
 from sqlalchemy.dialects.postgresql import TIMESTAMP, UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -147,5 +147,10 @@ class User(Base):
         cascade="all, delete-orphan",
     )
 
+    # Serves the (full_name, id) ordering and keyset cursor of user lists
+    __table_args__ = (
+        Index("ix_users_full_name_id", "full_name", "id"),
+    )
+
     def __repr__(self) -> str:
         return f"<User(id={self.id}, email='{self.email}', full_name='{self.full_name}')>"
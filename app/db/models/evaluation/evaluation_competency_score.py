@@ -3,7 +3,7 @@ EvaluationCompetencyScore model for individual skill ratings within evaluations.
 """
 from datetime import datetime, timezone
 from typing import Optional, TYPE_CHECKING
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlalchemy import CheckConstraint, ForeignKey, Numeric, Text, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID, TIMESTAMP
@@ -28,10 +28,11 @@ class EvaluationCompetencyScore(Base):
     __tablename__ = "evaluation_competency_scores"
 
     # Primary Key
+    # Generated by Postgres so bulk inserts can omit it
     id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4
+        server_default=func.gen_random_uuid()
     )
 
     # Foreign Keys
@@ -49,7 +50,7 @@ class EvaluationCompetencyScore(Base):
     )
 
     # Score Data
-    score: Mapped[float] = mapped_column(Numeric(5, 2), nullable=False)
+    score: Mapped[float] = mapped_column(Numeric(5, 2, asdecimal=False), nullable=False)
     comments: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Timestamps
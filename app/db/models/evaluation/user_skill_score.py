@@ -3,7 +3,7 @@ UserSkillScore model for aggregated/consolidated skill profiles.
 """
 from datetime import datetime, timezone
 from typing import Optional, TYPE_CHECKING
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlalchemy import CheckConstraint, ForeignKey, Numeric, String, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID, TIMESTAMP
@@ -30,10 +30,11 @@ class UserSkillScore(Base):
     __tablename__ = "user_skill_scores"
 
     # Primary Key
+    # Generated by Postgres so bulk inserts can omit it
     id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4
+        server_default=func.gen_random_uuid()
     )
 
     # Foreign Keys
@@ -63,9 +64,10 @@ class UserSkillScore(Base):
     )  # 360_aggregated, self_only, manager_only
     
     # Aggregated Score Data
-    score: Mapped[float] = mapped_column(Numeric(5, 2), nullable=False)
+    # asdecimal=False: el driver entrega float directamente (sin Decimal)
+    score: Mapped[float] = mapped_column(Numeric(5, 2, asdecimal=False), nullable=False)
     confidence: Mapped[Optional[float]] = mapped_column(
-        Numeric(5, 4),
+        Numeric(5, 4, asdecimal=False),
         nullable=True
     )
     raw_stats: Mapped[Optional[dict]] = mapped_column(
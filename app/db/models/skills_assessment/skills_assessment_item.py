@@ -65,24 +65,25 @@ class SkillsAssessmentItem(Base):
     
     # Item Content
     label: Mapped[Optional[str]] = mapped_column(String(150), nullable=True)
+    # asdecimal=False: el driver entrega float directamente (sin Decimal)
     current_level: Mapped[Optional[float]] = mapped_column(
-        Numeric(5, 2),
+        Numeric(5, 2, asdecimal=False),
         nullable=True
     )
     target_level: Mapped[Optional[float]] = mapped_column(
-        Numeric(5, 2),
+        Numeric(5, 2, asdecimal=False),
         nullable=True
     )
     gap_score: Mapped[Optional[float]] = mapped_column(
-        Numeric(5, 2),
+        Numeric(5, 2, asdecimal=False),
         nullable=True
     )
-    score: Mapped[Optional[float]] = mapped_column(Numeric(5, 2), nullable=True)
+    score: Mapped[Optional[float]] = mapped_column(Numeric(5, 2, asdecimal=False), nullable=True)
     priority: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
 
     # 0–1 readiness percentage (internal representation)
     readiness_percentage: Mapped[Optional[float]] = mapped_column(
-        Numeric(5, 4),
+        Numeric(5, 4, asdecimal=False),
         nullable=True
     )
     evidence: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
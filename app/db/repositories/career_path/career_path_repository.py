@@ -1,10 +1,10 @@
 """
 Career Path repository for database operations.
 """
-from typing import Optional
+from typing import Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -22,9 +22,14 @@ class CareerPathRepository:
         """Create a new career path."""
         self.session.add(career_path)
         await self.session.flush()
-        await self.session.refresh(career_path)
         return career_path
 
+    async def create_bulk(self, career_paths: list[CareerPath]) -> list[CareerPath]:
+        """Create multiple career paths at once."""
+        self.session.add_all(career_paths)
+        await self.session.flush()
+        return career_paths
+
     async def get_by_id(
         self,
         path_id: UUID,
@@ -114,7 +119,6 @@ class CareerPathRepository:
     async def update(self, career_path: CareerPath) -> CareerPath:
         """Update an existing career path."""
         await self.session.flush()
-        await self.session.refresh(career_path)
         return career_path
 
     async def accept_path(self, path_id: UUID, user_id: UUID) -> Optional[CareerPath]:
@@ -167,10 +171,18 @@ class CareerPathStepRepository:
         """Create multiple career path steps at once."""
         self.session.add_all(steps)
         await self.session.flush()
-        for step in steps:
-            await self.session.refresh(step)
         return steps
 
+    async def insert_many(self, rows: list[dict]) -> None:
+        """
+        Insert many steps in a single executemany round-trip.
+        
+        Rows are plain column dicts (ids generated by the caller); nothing is
+        loaded back into the session.
+        """
+        if rows:
+            await self.session.execute(insert(CareerPathStep), rows)
+
     async def get_by_path_id(
         self,
         path_id: UUID,
@@ -196,6 +208,25 @@ class CareerPathStepRepository:
         return list(result.scalars().all())
 
 
+    async def get_by_path_ids(self, path_ids: Sequence[UUID]) -> list[CareerPathStep]:
+        """
+        Get the steps of several career paths in one query.
+        
+        Ordered by (career_path_id, step_number) so callers can group them;
+        development actions are not loaded.
+        """
+        if not path_ids:
+            return []
+
+        query = (
+            select(CareerPathStep)
+            .where(CareerPathStep.career_path_id.in_(list(path_ids)))
+            .order_by(CareerPathStep.career_path_id, CareerPathStep.step_number)
+        )
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+
 class DevelopmentActionRepository:
     """Repository for DevelopmentAction model operations."""
 
@@ -210,10 +241,18 @@ class DevelopmentActionRepository:
         """Create multiple development actions at once."""
         self.session.add_all(actions)
         await self.session.flush()
-        for action in actions:
-            await self.session.refresh(action)
         return actions
 
+    async def insert_many(self, rows: list[dict]) -> None:
+        """
+        Insert many development actions in a single executemany round-trip.
+        
+        Rows are plain column dicts (ids generated by the caller); nothing is
+        loaded back into the session.
+        """
+        if rows:
+            await self.session.execute(insert(DevelopmentAction), rows)
+
     async def get_by_step_id(
         self,
         step_id: UUID,
@@ -1,11 +1,13 @@
 """
 Role repository for database operations.
 """
-from typing import Optional
+from typing import Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Row, exists, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.db.models import Role
 
@@ -21,73 +23,133 @@ class RoleRepository:
         """Create a new role."""
         self.session.add(role)
         await self.session.flush()
-        await self.session.refresh(role)
         return role
 
-    async def get_by_id(self, role_id: UUID) -> Optional[Role]:
-        """Get role by ID."""
-        query = select(Role).where(Role.id == role_id)
-        result = await self.session.execute(query)
+    async def create_if_unique(self, values: dict) -> Optional[Role]:
+        """
+        Create a role unless its name is already taken, in one statement.
+        
+        INSERT ... ON CONFLICT (name) DO NOTHING RETURNING: no separate
+        get_by_name round-trip, and no race between the check and the insert.
+        
+        Returns:
+            Created role, or None if a role with this name already exists
+        """
+        stmt = (
+            insert(Role)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=[Role.name])
+            .returning(Role)
+        )
+        result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_by_id(self, role_id: UUID) -> Optional[Role]:
+        """Get role by ID (served from the session's identity map when already loaded)."""
+        return await self.session.get(Role, role_id)
+
     async def get_by_name(self, name: str) -> Optional[Role]:
         """Get role by name."""
         query = select(Role).where(Role.name == name)
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
-    async def get_all_active(
+    async def get_by_names(
         self,
-        limit: int = 100,
-        offset: int = 0,
+        names: Sequence[str],
+        *,
+        active_only: bool = True,
     ) -> list[Role]:
-        """Get all active roles with pagination."""
-        query = (
-            select(Role)
-            .where(Role.is_active == True)
-            .order_by(Role.name)
-            .limit(limit)
-            .offset(offset)
-        )
+        """Get all roles whose name is in the provided collection."""
+        if not names:
+            return []
+        unique_names = list(set(names))
+
+        query = select(Role).where(Role.name.in_(unique_names))
+        if active_only:
+            query = query.where(Role.is_active == True)
+        query = query.order_by(Role.name)
+
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
-    async def get_all(
+    async def get_all_active_catalog(
         self,
-        limit: int = 100,
-        offset: int = 0,
-    ) -> list[Role]:
-        """Get all roles (active and inactive) with pagination."""
+        limit: int = 1000,
+    ) -> Sequence[Row[tuple[UUID, str, Optional[str], Optional[str]]]]:
+        """
+        Get (id, name, job_family, seniority_level) rows for active roles.
+        
+        Selects columns instead of entities: plain rows, no ORM hydration or
+        identity-map bookkeeping. Rows support attribute access (row.name).
+        """
         query = (
-            select(Role)
+            select(Role.id, Role.name, Role.job_family, Role.seniority_level)
+            .where(Role.is_active == True)
             .order_by(Role.name)
             .limit(limit)
-            .offset(offset)
         )
         result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return result.all()
 
-    async def get_by_job_family(
+    async def list_roles(
         self,
-        job_family: str,
         active_only: bool = True,
+        job_family: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
     ) -> list[Role]:
-        """Get all roles in a job family."""
-        query = select(Role).where(Role.job_family == job_family)
+        """
+        List roles with optional filters and pagination.
         
+        Args:
+            active_only: Only return active roles
+            job_family: Filter by job family (ordered by seniority, then name)
+            limit: Maximum results
+            offset: Pagination offset
+        """
+        query = select(Role)
         if active_only:
             query = query.where(Role.is_active == True)
-        
-        query = query.order_by(Role.seniority_level, Role.name)
+        if job_family:
+            query = query.where(Role.job_family == job_family)
+            query = query.order_by(Role.seniority_level, Role.name)
+        else:
+            query = query.order_by(Role.name)
+
+        query = query.limit(limit).offset(offset)
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
     async def update(self, role: Role) -> Role:
         """Update an existing role."""
         await self.session.flush()
-        await self.session.refresh(role)
         return role
 
+    async def update_if_name_unique(self, role_id: UUID, values: dict) -> Optional[Role]:
+        """
+        Update a role, including a new ``values["name"]``, unless another role has that name.
+        
+        One conditional UPDATE ... WHERE NOT EXISTS (...) RETURNING; the
+        returned row also refreshes the role already loaded in the session.
+        
+        Returns:
+            Updated role, or None if the name is taken (or the role is gone)
+        """
+        other = aliased(Role)
+        stmt = (
+            update(Role)
+            .where(
+                Role.id == role_id,
+                ~exists().where(other.name == values["name"], other.id != role_id),
+            )
+            .values(**values)
+            .returning(Role)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
     async def delete(self, role: Role) -> None:
         """Delete a role (hard delete)."""
         await self.session.delete(role)
@@ -25,7 +25,6 @@ class RoleSkillRequirementRepository:
         """Create a new role skill requirement."""
         self.session.add(requirement)
         await self.session.flush()
-        await self.session.refresh(requirement)
         return requirement
 
     async def create_bulk(
@@ -35,8 +34,6 @@ class RoleSkillRequirementRepository:
         """Create multiple role skill requirements at once."""
         self.session.add_all(requirements)
         await self.session.flush()
-        for req in requirements:
-            await self.session.refresh(req)
         return requirements
 
     async def get_by_id(
@@ -118,7 +115,6 @@ class RoleSkillRequirementRepository:
     ) -> RoleSkillRequirement:
         """Update an existing role skill requirement."""
         await self.session.flush()
-        await self.session.refresh(requirement)
         return requirement
 
     async def delete_by_id(self, requirement_id: UUID) -> bool:
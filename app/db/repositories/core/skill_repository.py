@@ -6,11 +6,29 @@ async and operate within the provided `AsyncSession` transaction context.
 from typing import Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, exists, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, raiseload
 
 from app.db.models import Skill
 
+# Base for list queries: SkillResponse reads columns only, so relationships
+# are never loaded and any access raises instead of lazy-loading per row
+_LIST_SKILLS = select(Skill).options(raiseload("*"))
+
+
+def _after_skill(after_id: UUID) -> ColumnElement[bool]:
+    """Keyset condition: skills sorted after ``after_id`` by name (unique).
+
+    The cursor row is looked up in the same statement; an unknown id yields
+    an empty page.
+    """
+    cursor = aliased(Skill)
+    return Skill.name > (
+        select(cursor.name).where(cursor.id == after_id).scalar_subquery()
+    )
+
 
 class SkillRepository:
     """Repository for Skill model operations."""
@@ -23,15 +41,31 @@ class SkillRepository:
         """Create a new skill."""
         self.session.add(skill)
         await self.session.flush()
-        await self.session.refresh(skill)
         return skill
 
-    async def get_by_id(self, skill_id: UUID) -> Optional[Skill]:
-        """Get skill by ID."""
-        query = select(Skill).where(Skill.id == skill_id)
-        result = await self.session.execute(query)
+    async def create_if_unique(self, values: dict) -> Optional[Skill]:
+        """
+        Create a skill unless its name is already taken, in one statement.
+        
+        INSERT ... ON CONFLICT (name) DO NOTHING RETURNING: no separate
+        get_by_name round-trip, and no race between the check and the insert.
+        
+        Returns:
+            Created skill, or None if a skill with this name already exists
+        """
+        stmt = (
+            insert(Skill)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=[Skill.name])
+            .returning(Skill)
+        )
+        result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_by_id(self, skill_id: UUID) -> Optional[Skill]:
+        """Get skill by ID (served from the session's identity map when already loaded)."""
+        return await self.session.get(Skill, skill_id)
+
     async def get_by_name(self, name: str) -> Optional[Skill]:
         """Get skill by exact name."""
         query = select(Skill).where(Skill.name == name)
@@ -78,15 +112,45 @@ class SkillRepository:
 
 
 
+    async def get_names_by_ids(
+        self,
+        ids: Sequence[UUID],
+        *,
+        active_only: bool = True,
+    ) -> dict[UUID, str]:
+        """
+        Map skill ids to names.
+        
+        Selects the two columns only: no Skill entities are built for callers
+        that just need the names.
+        """
+        if not ids:
+            return {}
+
+        query = select(Skill.id, Skill.name).where(Skill.id.in_(list(set(ids))))
+        if active_only:
+            query = query.where(Skill.is_active == True)
+
+        result = await self.session.execute(query)
+        return dict(result.tuples().all())
+
     async def get_all_active(
         self,
         limit: int = 100,
         offset: int = 0,
+        after_id: Optional[UUID] = None,
     ) -> list[Skill]:
-        """Get all active skills with pagination."""
+        """
+        Get all active skills with pagination.
+        
+        ``after_id`` (last skill of the previous page) seeks through the
+        unique name index instead of scanning and discarding ``offset`` rows.
+        """
+        query = _LIST_SKILLS.where(Skill.is_active == True)
+        if after_id:
+            query = query.where(_after_skill(after_id))
         query = (
-            select(Skill)
-            .where(Skill.is_active == True)
+            query
             .order_by(Skill.name)
             .limit(limit)
             .offset(offset)
@@ -98,10 +162,14 @@ class SkillRepository:
         self,
         limit: int = 100,
         offset: int = 0,
+        after_id: Optional[UUID] = None,
     ) -> list[Skill]:
-        """Get all skills (active and inactive) with pagination."""
+        """Get all skills (active and inactive) with pagination (see get_all_active)."""
+        query = _LIST_SKILLS
+        if after_id:
+            query = query.where(_after_skill(after_id))
         query = (
-            select(Skill)
+            query
             .order_by(Skill.name)
             .limit(limit)
             .offset(offset)
@@ -117,7 +185,7 @@ class SkillRepository:
         active_only: bool = True,
     ) -> list[Skill]:
         """Get all skills in a specific category."""
-        query = select(Skill).where(Skill.category == category)
+        query = _LIST_SKILLS.where(Skill.category == category)
         
         if active_only:
             query = query.where(Skill.is_active == True)
@@ -130,7 +198,7 @@ class SkillRepository:
 
     async def get_global_skills(self, active_only: bool = True) -> list[Skill]:
         """Get all global skills."""
-        query = select(Skill).where(Skill.is_global == True)
+        query = _LIST_SKILLS.where(Skill.is_global == True)
         
         if active_only:
             query = query.where(Skill.is_active == True)
@@ -144,11 +212,35 @@ class SkillRepository:
     async def update(self, skill: Skill) -> Skill:
         """Update an existing skill."""
         await self.session.flush()
-        await self.session.refresh(skill)
         return skill
 
 
 
+    async def update_values(self, skill_id: UUID, values: dict) -> Optional[Skill]:
+        """
+        Update a skill in one UPDATE ... RETURNING, without loading it first.
+        
+        A ``values["name"]`` is only written if no other skill has that name
+        (WHERE NOT EXISTS in the same statement). The returned row also
+        refreshes the skill if it is already loaded in the session.
+        
+        Returns:
+            Updated skill, or None if the skill is gone or the name is taken
+        """
+        stmt = update(Skill).where(Skill.id == skill_id)
+        if "name" in values:
+            other = aliased(Skill)
+            stmt = stmt.where(
+                ~exists().where(other.name == values["name"], other.id != skill_id)
+            )
+        stmt = (
+            stmt.values(**values)
+            .returning(Skill)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
     async def delete(self, skill: Skill) -> None:
         """Delete a skill (hard delete)."""
         await self.session.delete(skill)
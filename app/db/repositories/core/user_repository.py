@@ -4,11 +4,31 @@ User repository for database operations.
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, exists, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, raiseload, selectinload
 
-from app.db.models import User
+from app.db.models import Role, User
+
+# Base for list queries: UserResponse reads role_id/manager_id columns, not
+# the relationships, so nothing is eager-loaded and any access raises instead
+# of lazy-loading per row
+_LIST_USERS = select(User).options(raiseload("*"))
+
+
+def _after_user(after_id: UUID) -> ColumnElement[bool]:
+    """Keyset condition: users sorted after ``after_id`` by (full_name, id).
+
+    The cursor row is looked up in the same statement; an unknown id yields
+    an empty page.
+    """
+    cursor = aliased(User)
+    return tuple_(User.full_name, User.id) > (
+        select(cursor.full_name, cursor.id)
+        .where(cursor.id == after_id)
+        .scalar_subquery()
+    )
 
 
 class UserRepository:
@@ -22,9 +42,47 @@ class UserRepository:
         """Create a new user."""
         self.session.add(user)
         await self.session.flush()
-        await self.session.refresh(user)
         return user
 
+    async def create_if_unique(self, values: dict) -> Optional[User]:
+        """
+        Create a user unless the email is already taken, in one statement.
+        
+        INSERT ... ON CONFLICT (email) DO NOTHING RETURNING: no separate
+        get_by_email round-trip, and no race between the check and the insert.
+        
+        Returns:
+            Created user, or None if a user with this email already exists
+        """
+        stmt = (
+            insert(User)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_reference_context(
+        self,
+        role_id: Optional[UUID],
+        manager_id: Optional[UUID],
+    ) -> tuple[bool, Optional[bool]]:
+        """
+        Check the role and manager a user points to in a single round-trip.
+        
+        Returns:
+            (role exists, manager is_active or None if the manager does not
+            exist). Values for a None id are meaningless and should be ignored.
+        """
+        query = select(
+            exists().where(Role.id == role_id),
+            select(User.is_active).where(User.id == manager_id).scalar_subquery(),
+        )
+        result = await self.session.execute(query)
+        role_exists, manager_is_active = result.one()
+        return role_exists, manager_is_active
+
     async def get_by_id(
         self,
         user_id: UUID,
@@ -37,18 +95,40 @@ class UserRepository:
             user_id: User UUID
             load_relationships: Whether to eager load role, manager, etc.
         """
-        query = select(User).where(User.id == user_id)
-        
-        if load_relationships:
-            query = query.options(
-                selectinload(User.role),
-                selectinload(User.manager),
-                selectinload(User.direct_reports),
-            )
-        
+        if not load_relationships:
+            # Identity map first; a SELECT is only issued on a miss
+            return await self.session.get(User, user_id)
+
+        query = select(User).where(User.id == user_id).options(
+            selectinload(User.role),
+            selectinload(User.manager),
+            selectinload(User.direct_reports),
+        )
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_by_id_with_role_name(
+        self, user_id: UUID
+    ) -> Optional[tuple[User, Optional[str]]]:
+        """
+        Get user by ID together with its role's name, in one query.
+
+        Many-to-one, so a LEFT OUTER JOIN adds at most one row's worth of
+        columns and saves the separate role lookup. The name is selected as a
+        plain column, so no partially loaded Role ends up in the identity map.
+
+        Returns:
+            (user, role name or None), or None if the user does not exist
+        """
+        query = (
+            select(User, Role.name)
+            .outerjoin(User.role)
+            .where(User.id == user_id)
+        )
+        result = await self.session.execute(query)
+        row = result.one_or_none()
+        return (row[0], row[1]) if row else None
+
     async def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email."""
         query = select(User).where(User.email == email)
@@ -59,12 +139,20 @@ class UserRepository:
         self,
         limit: int = 100,
         offset: int = 0,
+        after_id: Optional[UUID] = None,
     ) -> list[User]:
-        """Get all active users with pagination."""
+        """
+        Get all active users with pagination.
+        
+        ``after_id`` (last user of the previous page) seeks through the
+        (full_name, id) index instead of scanning and discarding ``offset`` rows.
+        """
+        query = _LIST_USERS.where(User.is_active == True)
+        if after_id:
+            query = query.where(_after_user(after_id))
         query = (
-            select(User)
-            .where(User.is_active == True)
-            .order_by(User.full_name)
+            query
+            .order_by(User.full_name, User.id)
             .limit(limit)
             .offset(offset)
         )
@@ -75,11 +163,15 @@ class UserRepository:
         self,
         limit: int = 100,
         offset: int = 0,
+        after_id: Optional[UUID] = None,
     ) -> list[User]:
-        """Get all users (active and inactive) with pagination."""
+        """Get all users (active and inactive) with pagination (see get_active_users)."""
+        query = _LIST_USERS
+        if after_id:
+            query = query.where(_after_user(after_id))
         query = (
-            select(User)
-            .order_by(User.full_name)
+            query
+            .order_by(User.full_name, User.id)
             .limit(limit)
             .offset(offset)
         )
@@ -92,7 +184,7 @@ class UserRepository:
         active_only: bool = True,
     ) -> list[User]:
         """Get all users with a specific role."""
-        query = select(User).where(User.role_id == role_id)
+        query = _LIST_USERS.where(User.role_id == role_id)
         
         if active_only:
             query = query.where(User.is_active == True)
@@ -107,7 +199,7 @@ class UserRepository:
         active_only: bool = True,
     ) -> list[User]:
         """Get all direct reports of a manager."""
-        query = select(User).where(User.manager_id == manager_id)
+        query = _LIST_USERS.where(User.manager_id == manager_id)
         
         if active_only:
             query = query.where(User.is_active == True)
@@ -119,9 +211,33 @@ class UserRepository:
     async def update(self, user: User) -> User:
         """Update an existing user."""
         await self.session.flush()
-        await self.session.refresh(user)
         return user
 
+    async def update_values(self, user_id: UUID, values: dict) -> Optional[User]:
+        """
+        Update a user in one UPDATE ... RETURNING, without loading it first.
+        
+        A ``values["email"]`` is only written if no other user has that email
+        (WHERE NOT EXISTS in the same statement). The returned row also
+        refreshes the user if it is already loaded in the session.
+        
+        Returns:
+            Updated user, or None if the user is gone or the email is taken
+        """
+        stmt = update(User).where(User.id == user_id)
+        if "email" in values:
+            other = aliased(User)
+            stmt = stmt.where(
+                ~exists().where(other.email == values["email"], other.id != user_id)
+            )
+        stmt = (
+            stmt.values(**values)
+            .returning(User)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
     async def delete(self, user: User) -> None:
         """Delete a user (hard delete)."""
         await self.session.delete(user)
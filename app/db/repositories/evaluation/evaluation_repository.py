@@ -1,20 +1,129 @@
 """
 Evaluation repository for database operations.
 """
-from typing import Optional
+from collections.abc import Collection
+from typing import Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import select, and_, delete
+from sqlalchemy import (
+    Delete,
+    Float,
+    Row,
+    select,
+    and_,
+    bindparam,
+    cast,
+    delete,
+    exists,
+    func,
+    literal,
+    not_,
+    null,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import Insert, aggregate_order_by, insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, raiseload, selectinload
 
 from app.db.models import (
     Evaluation,
     EvaluationCycle,
     EvaluationCompetencyScore,
+    User,
     UserSkillScore,
 )
 
+# Statements on the evaluation-processing / skill-profile paths, built once at
+# import; each call only binds its parameter values.
+_cycle_target = aliased(Evaluation)
+_SELECT_WITH_CYCLE_SIBLINGS = (
+    select(Evaluation)
+    .join(
+        _cycle_target,
+        and_(
+            _cycle_target.user_id == Evaluation.user_id,
+            _cycle_target.evaluation_cycle_id == Evaluation.evaluation_cycle_id,
+        ),
+    )
+    .where(_cycle_target.id == bindparam("evaluation_id"))
+    # Scores are not loaded: they are aggregated in SQL (see
+    # _SELECT_GROUPED_SUBMITTED_SCORES). Any relationship access raises.
+    # Add .unique() to the result only if a collection joinedload is added.
+    .options(raiseload("*"))
+    .order_by(Evaluation.created_at)
+)
+
+# Submitted scores of a user in a cycle, one row per (skill, relationship)
+# with that group's scores in evaluation order
+_SELECT_GROUPED_SUBMITTED_SCORES = (
+    select(
+        EvaluationCompetencyScore.skill_id,
+        Evaluation.evaluator_relationship,
+        func.array_agg(
+            aggregate_order_by(
+                cast(EvaluationCompetencyScore.score, Float),
+                Evaluation.created_at,
+            )
+        ).label("scores"),
+    )
+    .join(Evaluation, Evaluation.id == EvaluationCompetencyScore.evaluation_id)
+    .where(
+        Evaluation.user_id == bindparam("user_id"),
+        Evaluation.evaluation_cycle_id == bindparam("cycle_id"),
+        Evaluation.status == "submitted",
+    )
+    .group_by(EvaluationCompetencyScore.skill_id, Evaluation.evaluator_relationship)
+)
+
+_SELECT_USER_CYCLE_SKILL_SCORES = (
+    select(UserSkillScore)
+    .where(
+        UserSkillScore.user_id == bindparam("user_id"),
+        UserSkillScore.evaluation_cycle_id == bindparam("cycle_id"),
+    )
+    .order_by(UserSkillScore.score.desc())
+)
+_SELECT_USER_CYCLE_SKILL_SCORES_BY_SOURCE = _SELECT_USER_CYCLE_SKILL_SCORES.where(
+    UserSkillScore.source == bindparam("source")
+)
+
+
+def _stale_scores_delete(
+    user_id: UUID,
+    cycle_id: UUID,
+    source: str,
+    keep_skill_ids: Collection[UUID],
+) -> Delete:
+    """DELETE of a user's scores in a cycle except ``source`` rows for ``keep_skill_ids``."""
+    stmt = delete(UserSkillScore).where(
+        UserSkillScore.user_id == user_id,
+        UserSkillScore.evaluation_cycle_id == cycle_id,
+    )
+    if keep_skill_ids:
+        stmt = stmt.where(
+            not_(
+                and_(
+                    UserSkillScore.source == source,
+                    UserSkillScore.skill_id.in_(list(keep_skill_ids)),
+                )
+            )
+        )
+    return stmt
+
+
+def _on_score_conflict_update(stmt: Insert) -> Insert:
+    """Turn an INSERT of user skill scores into an upsert on uq_user_cycle_skill_source."""
+    return stmt.on_conflict_do_update(
+        constraint="uq_user_cycle_skill_source",
+        set_={
+            "score": stmt.excluded.score,
+            "confidence": stmt.excluded.confidence,
+            "raw_stats": stmt.excluded.raw_stats,
+            "updated_at": func.now(),
+        },
+    )
+
+
 class EvaluationCycleRepository:
     """Repository for EvaluationCycle model operations."""
 
@@ -26,7 +135,6 @@ class EvaluationCycleRepository:
         """Create a new evaluation cycle."""
         self.session.add(cycle)
         await self.session.flush()
-        await self.session.refresh(cycle)
         return cycle
 
     async def get_by_id(self, cycle_id: UUID) -> Optional[EvaluationCycle]:
@@ -35,36 +143,23 @@ class EvaluationCycleRepository:
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
-    async def get_active_cycles(self) -> list[EvaluationCycle]:
-        """Get all active evaluation cycles."""
-        query = (
-            select(EvaluationCycle)
-            .where(EvaluationCycle.status == "active")
-            .order_by(EvaluationCycle.start_date.desc())
-        )
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
-
-    async def get_by_status(self, status: str) -> list[EvaluationCycle]:
-        """Get evaluation cycles by status."""
-        query = (
-            select(EvaluationCycle)
-            .where(EvaluationCycle.status == status)
-            .order_by(EvaluationCycle.start_date.desc())
-        )
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
-
-    async def get_all(self) -> list[EvaluationCycle]:
-        """Get all evaluation cycles."""
-        query = select(EvaluationCycle).order_by(EvaluationCycle.start_date.desc())
+    async def list_cycles(self, status: Optional[str] = None) -> list[EvaluationCycle]:
+        """
+        List evaluation cycles, newest first.
+        
+        Args:
+            status: Filter by status (all cycles if None)
+        """
+        query = select(EvaluationCycle)
+        if status:
+            query = query.where(EvaluationCycle.status == status)
+        query = query.order_by(EvaluationCycle.start_date.desc())
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
     async def update(self, cycle: EvaluationCycle) -> EvaluationCycle:
         """Update an existing evaluation cycle."""
         await self.session.flush()
-        await self.session.refresh(cycle)
         return cycle
 
     async def delete(self, cycle_id: UUID) -> None:
@@ -84,9 +179,70 @@ class EvaluationRepository:
         """Create a new evaluation."""
         self.session.add(evaluation)
         await self.session.flush()
-        await self.session.refresh(evaluation)
         return evaluation
 
+    async def create_many(self, evaluations: Sequence[Evaluation]) -> None:
+        """
+        Create many evaluations with one flush.
+        
+        The ORM batches the rows into a single INSERT; timestamps have client
+        defaults, so nothing is refreshed afterwards.
+        """
+        self.session.add_all(evaluations)
+        await self.session.flush()
+
+    async def get_creation_context(
+        self,
+        user_id: UUID,
+        evaluator_id: UUID,
+        cycle_id: UUID,
+    ) -> tuple[bool, bool, Optional[str]]:
+        """
+        Check the prerequisites of a new evaluation in a single round-trip.
+        
+        Returns:
+            (user exists, evaluator exists, cycle status or None if the
+            cycle does not exist)
+        """
+        query = select(
+            exists().where(User.id == user_id),
+            exists().where(User.id == evaluator_id),
+            select(EvaluationCycle.status)
+            .where(EvaluationCycle.id == cycle_id)
+            .scalar_subquery(),
+        )
+        result = await self.session.execute(query)
+        user_exists, evaluator_exists, cycle_status = result.one()
+        return user_exists, evaluator_exists, cycle_status
+
+    async def get_creation_contexts(
+        self,
+        user_ids: Collection[UUID],
+        cycle_ids: Collection[UUID],
+    ) -> tuple[set[UUID], dict[UUID, str]]:
+        """
+        Batched get_creation_context: check the users (evaluated and
+        evaluators) and cycles of many new evaluations in a single round-trip.
+        
+        Returns:
+            (ids of the users that exist, status by id of the cycles that exist)
+        """
+        query = union_all(
+            select(literal("user"), User.id, null()).where(User.id.in_(user_ids)),
+            select(literal("cycle"), EvaluationCycle.id, EvaluationCycle.status).where(
+                EvaluationCycle.id.in_(cycle_ids)
+            ),
+        )
+        result = await self.session.execute(query)
+        existing_user_ids: set[UUID] = set()
+        cycle_statuses: dict[UUID, str] = {}
+        for kind, row_id, status in result:
+            if kind == "user":
+                existing_user_ids.add(row_id)
+            else:
+                cycle_statuses[row_id] = status
+        return existing_user_ids, cycle_statuses
+
     async def get_by_id(
         self,
         evaluation_id: UUID,
@@ -102,7 +258,12 @@ class EvaluationRepository:
         query = select(Evaluation).where(Evaluation.id == evaluation_id)
         
         if load_scores:
-            query = query.options(selectinload(Evaluation.competency_scores))
+            # Scores only (read as columns); other relationships raise
+            # instead of lazy-loading
+            query = query.options(
+                selectinload(Evaluation.competency_scores).raiseload("*"),
+                raiseload("*"),
+            )
         
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
@@ -132,6 +293,20 @@ class EvaluationRepository:
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def get_with_cycle_siblings(self, evaluation_id: UUID) -> list[Evaluation]:
+        """
+        Get an evaluation together with every evaluation of the same user in the same cycle.
+        
+        One SELECT (self-join on user/cycle, no prior get_by_id). Competency
+        scores are not loaded (use CompetencyScoreRepository.get_grouped_submitted
+        for aggregation); relationship access raises instead of lazy-loading.
+        Returns an empty list if the evaluation does not exist.
+        """
+        result = await self.session.execute(
+            _SELECT_WITH_CYCLE_SIBLINGS, {"evaluation_id": evaluation_id}
+        )
+        return list(result.scalars().all())
+
     async def get_by_evaluator_and_cycle(
         self,
         evaluator_id: UUID,
@@ -158,6 +333,20 @@ class EvaluationRepository:
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def exists_for_cycle(self, cycle_id: UUID) -> bool:
+        """Check whether a cycle has any evaluation (index probe, no rows loaded)."""
+        query = select(exists().where(Evaluation.evaluation_cycle_id == cycle_id))
+        result = await self.session.execute(query)
+        return result.scalar_one()
+
+    async def count_by_cycle(self, cycle_id: UUID) -> int:
+        """Count evaluations in a specific cycle."""
+        query = select(func.count(Evaluation.id)).where(
+            Evaluation.evaluation_cycle_id == cycle_id
+        )
+        result = await self.session.execute(query)
+        return result.scalar_one()
+
     async def list_evaluations(
         self,
         user_id: Optional[UUID] = None,
@@ -220,7 +409,6 @@ class EvaluationRepository:
     async def update(self, evaluation: Evaluation) -> Evaluation:
         """Update an existing evaluation."""
         await self.session.flush()
-        await self.session.refresh(evaluation)
         return evaluation
 
 
@@ -238,10 +426,37 @@ class CompetencyScoreRepository:
         """Create multiple competency scores at once."""
         self.session.add_all(scores)
         await self.session.flush()
-        for score in scores:
-            await self.session.refresh(score)
         return scores
 
+    async def insert_many(self, rows: list[dict]) -> None:
+        """
+        Insert many competency scores in a single executemany round-trip.
+        
+        Rows are plain column dicts (ids are generated by Postgres); nothing
+        is loaded back into the session.
+        """
+        if rows:
+            await self.session.execute(insert(EvaluationCompetencyScore), rows)
+
+    async def get_grouped_submitted(
+        self,
+        user_id: UUID,
+        cycle_id: UUID,
+    ) -> Sequence[Row[tuple[UUID, str, list[float]]]]:
+        """
+        Get a user's submitted scores in a cycle grouped by skill and evaluator relationship.
+        
+        Grouped in Postgres (GROUP BY skill_id, evaluator_relationship), so one
+        row per group is transferred and no ORM objects are built.
+        
+        Returns:
+            (skill_id, evaluator_relationship, scores) rows
+        """
+        result = await self.session.execute(
+            _SELECT_GROUPED_SUBMITTED_SCORES, {"user_id": user_id, "cycle_id": cycle_id}
+        )
+        return result.all()
+
     async def get_by_evaluation_id(
         self,
         evaluation_id: UUID,
@@ -270,10 +485,73 @@ class UserSkillScoreRepository:
         """Create multiple user skill scores at once."""
         self.session.add_all(scores)
         await self.session.flush()
-        for score in scores:
-            await self.session.refresh(score)
         return scores
 
+    async def upsert_bulk(self, rows: list[dict]) -> None:
+        """
+        Insert or update aggregated scores in one executemany statement.
+        
+        Rows are keyed by (user_id, evaluation_cycle_id, skill_id, source)
+        (constraint uq_user_cycle_skill_source): an existing row keeps its id
+        and created_at and gets the new score, confidence and raw_stats.
+        """
+        if not rows:
+            return
+        await self.session.execute(_on_score_conflict_update(insert(UserSkillScore)), rows)
+
+    async def replace_aggregated(
+        self,
+        user_id: UUID,
+        cycle_id: UUID,
+        source: str,
+        rows: list[dict],
+    ) -> None:
+        """
+        Make ``rows`` the user's only scores in a cycle, in one statement.
+        
+        Same effect as delete_stale (keeping the rows' skills) followed by
+        upsert_bulk, sent as a single round-trip:
+        WITH stale AS (DELETE ...) INSERT ... VALUES ... ON CONFLICT DO UPDATE.
+        The DELETE never touches the upserted rows, so both parts can share
+        the statement's snapshot.
+        """
+        stale = _stale_scores_delete(
+            user_id, cycle_id, source, [row["skill_id"] for row in rows]
+        )
+        if not rows:
+            await self.session.execute(stale)
+            return
+        # Python-side column defaults are not applied once a CTE is attached,
+        # so the NOT NULL timestamps are set explicitly (server clock, as in
+        # the ON CONFLICT update)
+        timestamps = {"created_at": func.now(), "updated_at": func.now()}
+        stmt = (
+            insert(UserSkillScore)
+            .values([{**row, **timestamps} for row in rows])
+            .add_cte(stale.cte("stale_scores"))
+        )
+        await self.session.execute(_on_score_conflict_update(stmt))
+
+    async def delete_stale(
+        self,
+        user_id: UUID,
+        cycle_id: UUID,
+        source: str,
+        keep_skill_ids: Collection[UUID],
+    ) -> int:
+        """
+        Delete a user's scores in a cycle except ``source`` rows for ``keep_skill_ids``.
+        
+        Used with upsert_bulk for re-aggregation: only rows that the new
+        aggregation no longer produces are removed.
+        
+        Returns:
+            Number of rows deleted
+        """
+        stmt = _stale_scores_delete(user_id, cycle_id, source, keep_skill_ids)
+        result = await self.session.execute(stmt)
+        return result.rowcount  # type: ignore[attr-defined]
+
     async def get_by_user_and_cycle(
         self,
         user_id: UUID,
@@ -288,18 +566,14 @@ class UserSkillScoreRepository:
             cycle_id: Evaluation cycle UUID
             source: Optional filter by source (360_aggregated, self_only, etc.)
         """
-        query = select(UserSkillScore).where(
-            and_(
-                UserSkillScore.user_id == user_id,
-                UserSkillScore.evaluation_cycle_id == cycle_id,
-            )
-        )
-        
+        params = {"user_id": user_id, "cycle_id": cycle_id}
         if source:
-            query = query.where(UserSkillScore.source == source)
+            query = _SELECT_USER_CYCLE_SKILL_SCORES_BY_SOURCE
+            params["source"] = source
+        else:
+            query = _SELECT_USER_CYCLE_SKILL_SCORES
         
-        query = query.order_by(UserSkillScore.score.desc())
-        result = await self.session.execute(query)
+        result = await self.session.execute(query, params)
         return list(result.scalars().all())
 
     async def delete_by_user_and_cycle(
@@ -30,14 +30,16 @@ class AICallsLogRepository:
         """Create a new AI call log entry."""
         self.session.add(log)
         await self.session.flush()
-        await self.session.refresh(log)
         return log
     
+    def add(self, log: AICallsLog) -> None:
+        """Stage a log entry; it is inserted on the next flush/commit (no refresh)."""
+        self.session.add(log)
+
     async def update(self, log: AICallsLog) -> AICallsLog:
         """Update existing AI call log entry."""
         # Basta con flush; el objeto ya está ligado a la sesión.
         await self.session.flush()
-        await self.session.refresh(log)
         return log
     
     async def get_by_id(self, log_id: UUID) -> Optional[AICallsLog]:
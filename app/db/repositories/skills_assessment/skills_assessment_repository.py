@@ -4,12 +4,21 @@ Skills Assessment repository for database operations.
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select, and_
+from sqlalchemy import and_, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import defer, joinedload
 
 from app.db.models import SkillsAssessment, SkillsAssessmentItem
 
+# Load an assessment together with its items in one query. The joined result
+# repeats the parent columns on every item row, so the raw AI request/response
+# JSONB (not read by any item-loading caller) is left out; accessing it raises.
+_WITH_ITEMS = (
+    joinedload(SkillsAssessment.items),
+    defer(SkillsAssessment.raw_request, raiseload=True),
+    defer(SkillsAssessment.raw_response, raiseload=True),
+)
+
 
 class SkillsAssessmentRepository:
     """Repository for SkillsAssessment model operations."""
@@ -22,7 +31,6 @@ class SkillsAssessmentRepository:
         """Create a new skills assessment."""
         self.session.add(assessment)
         await self.session.flush()
-        await self.session.refresh(assessment)
         return assessment
 
     async def get_by_id(
@@ -40,10 +48,12 @@ class SkillsAssessmentRepository:
         query = select(SkillsAssessment).where(SkillsAssessment.id == assessment_id)
         
         if load_items:
-            query = query.options(selectinload(SkillsAssessment.items))
+            # Items are joined in the same query; unique() collapses the
+            # one-row-per-item result back to the single assessment
+            query = query.options(*_WITH_ITEMS)
         
         result = await self.session.execute(query)
-        return result.scalar_one_or_none()
+        return result.unique().scalar_one_or_none()
 
     async def get_latest_by_user_id(
         self,
@@ -53,6 +63,10 @@ class SkillsAssessmentRepository:
         """
         Get latest completed skills assessment for a user.
         
+        With ``load_items`` the items come in the same round-trip: the
+        ORDER BY/LIMIT runs in a subquery and the items are LEFT JOINed to
+        the single assessment it returns.
+        
         Args:
             user_id: User UUID
             load_items: Whether to eager load assessment items
@@ -70,10 +84,10 @@ class SkillsAssessmentRepository:
         )
         
         if load_items:
-            query = query.options(selectinload(SkillsAssessment.items))
+            query = query.options(*_WITH_ITEMS)
         
         result = await self.session.execute(query)
-        return result.scalar_one_or_none()
+        return result.unique().scalar_one_or_none()
 
     async def get_by_user_id(
         self,
@@ -111,7 +125,6 @@ class SkillsAssessmentRepository:
     async def update(self, assessment: SkillsAssessment) -> SkillsAssessment:
         """Update an existing skills assessment."""
         await self.session.flush()
-        await self.session.refresh(assessment)
         return assessment
 
 
@@ -122,16 +135,15 @@ class SkillsAssessmentItemRepository:
         """Initialize repository with database session."""
         self.session = session
 
-    async def create_bulk(
-        self,
-        items: list[SkillsAssessmentItem],
-    ) -> list[SkillsAssessmentItem]:
-        """Create multiple assessment items at once."""
-        self.session.add_all(items)
-        await self.session.flush()
-        for item in items:
-            await self.session.refresh(item)
-        return items
+    async def insert_many(self, rows: list[dict]) -> None:
+        """
+        Insert many assessment items in a single executemany round-trip.
+        
+        Rows are plain attribute dicts with the same keys; nothing is loaded
+        back into the session.
+        """
+        if rows:
+            await self.session.execute(insert(SkillsAssessmentItem), rows)
 
     async def get_by_assessment_id(
         self,
@@ -1,26 +1,47 @@
 # app/db/session.py
 """Async database session configuration."""
 
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
+import pydantic_core
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import NullPool
 
 from app.core.config import get_settings
+from app.core.serialization import dumps
 
 settings = get_settings()
 
+
+
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON/JSONB column values with pydantic-core (Rust)."""
+    return dumps(value).decode()
+
+
 # Configuración básica del engine
+# JSON/JSONB (raw_request, raw_response, metadata...) se (de)serializa con
+# pydantic-core en lugar del módulo json estándar
 engine_kwargs: dict = {
     "echo": settings.db_echo,
+    "json_serializer": _json_serializer,
+    "json_deserializer": pydantic_core.from_json,
 }
 
 # En entorno de tests usamos NullPool para evitar conexiones persistentes
 if settings.is_test():
     engine_kwargs["poolclass"] = NullPool
 else:
-    # En dev/staging/prod dejamos que SQLAlchemy maneje el pool por defecto
-    engine_kwargs["pool_pre_ping"] = True
+    # En dev/staging/prod: un pool compartido por el proceso; cada request
+    # toma su propia conexión (una AsyncSession no admite operaciones
+    # concurrentes), así que el tamaño acota las requests simultáneas con BD
+    engine_kwargs.update(
+        pool_pre_ping=True,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+    )
 
 # Crear async engine
 engine = create_async_engine(
@@ -1,11 +1,11 @@
 """Domain entities for career path aggregate."""
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Sequence
 from uuid import UUID
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DevelopmentAction:
     """Domain value object for a development action.
     
@@ -32,7 +32,7 @@ class DevelopmentAction:
         return self.action_type == "mentoring"
 
 
-@dataclass
+@dataclass(slots=True)
 class CareerPathStep:
     """Domain entity for a career path step.
     
@@ -43,7 +43,7 @@ class CareerPathStep:
     step_name: Optional[str]
     description: Optional[str]
     duration_months: Optional[int]
-    actions: list[DevelopmentAction] = field(default_factory=list)
+    actions: Sequence[DevelopmentAction] = ()
     
     def total_effort_hours(self) -> int:
         """Calculate total estimated effort hours for all actions."""
@@ -61,7 +61,7 @@ class CareerPathStep:
         return [action for action in self.actions if action.action_type == action_type]
 
 
-@dataclass
+@dataclass(slots=True)
 class CareerPathEntity:
     """Domain entity for career path.
     
@@ -75,7 +75,7 @@ class CareerPathEntity:
     feasibility_score: float
     total_duration_months: Optional[int]
     status: str  # draft, proposed, accepted, rejected
-    steps: list[CareerPathStep] = field(default_factory=list)
+    steps: Sequence[CareerPathStep] = ()
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     
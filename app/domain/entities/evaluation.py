@@ -1,11 +1,11 @@
 """Domain entities for evaluation aggregate."""
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Sequence
 from uuid import UUID
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompetencyScore:
     """Domain value object for a competency score.
     
@@ -30,7 +30,7 @@ class CompetencyScore:
         return self.score <= 5.0
 
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationEntity:
     """Domain entity for evaluation (360° feedback).
     
@@ -43,7 +43,7 @@ class EvaluationEntity:
     evaluator_id: UUID
     evaluator_relationship: str
     status: str
-    competency_scores: list[CompetencyScore] = field(default_factory=list)
+    competency_scores: Sequence[CompetencyScore] = ()
     submitted_at: Optional[datetime] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
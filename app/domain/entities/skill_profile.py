@@ -1,11 +1,17 @@
 """Domain entities for skill profile aggregate."""
 from dataclasses import dataclass, field
 from datetime import datetime
+from operator import attrgetter
+from statistics import fmean
 from typing import Optional
 from uuid import UUID
 
+# Extractores de columnas numéricas para los agregados del perfil
+_get_score = attrgetter("score")
+_get_confidence = attrgetter("confidence")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class UserSkillScore:
     """Domain value object for an aggregated skill score.
     
@@ -37,7 +43,7 @@ class UserSkillScore:
         return self.score < 6.0
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillProfile:
     """Domain entity for aggregated skill profile.
     
@@ -62,13 +68,13 @@ class SkillProfile:
         """Calculate average score across all skills."""
         if not self.skills:
             return 0.0
-        return sum(s.score for s in self.skills) / len(self.skills)
+        return fmean(map(_get_score, self.skills))
     
     def average_confidence(self) -> float:
         """Calculate average confidence across all skills."""
         if not self.skills:
             return 0.0
-        return sum(s.confidence for s in self.skills) / len(self.skills)
+        return fmean(map(_get_confidence, self.skills))
     
     def get_strengths(self, threshold: float = 8.0) -> list[UserSkillScore]:
         """Get skills above threshold (strengths)."""
@@ -9,7 +9,7 @@ This module contains business rules for 360° evaluations:
 IMPORTANT: This module uses domain entities (pure Python) instead of ORM models.
 No dependencies on SQLAlchemy or frameworks.
 """
-from typing import Optional, Sequence
+from typing import Iterable, Optional, Sequence
 from uuid import UUID
 
 # Use domain entities for rich business logic
@@ -138,7 +138,45 @@ def aggregate_competency_scores(
             
             scores_by_skill[skill_id][rel].append(score)
     
-    # Aggregate statistics for each skill
+    return _summarize_scores_by_skill(scores_by_skill)
+
+
+def aggregate_grouped_competency_scores(
+    groups: Iterable[tuple[UUID, str, Sequence[float]]],
+) -> dict[UUID, dict]:
+    """
+    Aggregate scores already grouped by (skill, evaluator relationship).
+    
+    Same result as aggregate_competency_scores, for callers that fetch the
+    submitted scores pre-grouped (e.g. by a GROUP BY query) instead of as
+    evaluation entities.
+    
+    Args:
+        groups: (skill_id, evaluator_relationship, scores) per group
+        
+    Returns:
+        Dictionary mapping skill_id to aggregated statistics (see
+        aggregate_competency_scores)
+    """
+    scores_by_skill: dict[UUID, dict[str, list[float]]] = {}
+    
+    for skill_id, rel, scores in groups:
+        if skill_id not in scores_by_skill:
+            scores_by_skill[skill_id] = {
+                "self": [],
+                "peer": [],
+                "manager": [],
+                "direct_report": [],
+            }
+        scores_by_skill[skill_id][rel].extend(scores)
+    
+    return _summarize_scores_by_skill(scores_by_skill)
+
+
+def _summarize_scores_by_skill(
+    scores_by_skill: dict[UUID, dict[str, list[float]]],
+) -> dict[UUID, dict]:
+    """Compute the per-skill statistics from scores collected by relationship."""
     aggregated = {}
     
     for skill_id, scores_by_rel in scores_by_skill.items():
@@ -148,24 +186,28 @@ def aggregate_competency_scores(
         manager_scores = scores_by_rel["manager"]
         direct_report_scores = scores_by_rel["direct_report"]
         
-        self_avg = sum(self_scores) / len(self_scores) if self_scores else None
-        peer_avg = sum(peer_scores) / len(peer_scores) if peer_scores else None
-        manager_avg = sum(manager_scores) / len(manager_scores) if manager_scores else None
-        direct_report_avg = (
-            sum(direct_report_scores) / len(direct_report_scores)
-            if direct_report_scores
-            else None
-        )
+        # Cada lista se suma una sola vez; el promedio global se deriva de
+        # esas sumas en lugar de concatenar las cuatro listas y volver a sumar.
+        self_sum, n_self = sum(self_scores), len(self_scores)
+        peer_sum, n_peer = sum(peer_scores), len(peer_scores)
+        manager_sum, n_manager = sum(manager_scores), len(manager_scores)
+        direct_report_sum, n_direct_report = sum(direct_report_scores), len(direct_report_scores)
+        
+        self_avg = self_sum / n_self if n_self else None
+        peer_avg = peer_sum / n_peer if n_peer else None
+        manager_avg = manager_sum / n_manager if n_manager else None
+        direct_report_avg = direct_report_sum / n_direct_report if n_direct_report else None
         
         # Calculate overall average (from all submitted scores)
-        all_scores = (
-            self_scores + peer_scores + manager_scores + direct_report_scores
+        total_n = n_self + n_peer + n_manager + n_direct_report
+        overall_avg = (
+            (self_sum + peer_sum + manager_sum + direct_report_sum) / total_n
+            if total_n
+            else 0.0
         )
-        overall_avg = sum(all_scores) / len(all_scores) if all_scores else 0.0
         
         # Calculate confidence (simple heuristic: based on total number of scores)
         # More sophisticated: could use variance, but this is a start
-        total_n = len(all_scores)
         if total_n >= 5:
             confidence = 0.9
         elif total_n >= 3:
@@ -185,10 +227,10 @@ def aggregate_competency_scores(
             "peer_avg": peer_avg,
             "manager_avg": manager_avg,
             "direct_report_avg": direct_report_avg,
-            "n_self": len(self_scores),
-            "n_peer": len(peer_scores),
-            "n_manager": len(manager_scores),
-            "n_direct_report": len(direct_report_scores),
+            "n_self": n_self,
+            "n_peer": n_peer,
+            "n_manager": n_manager,
+            "n_direct_report": n_direct_report,
         }
         
         aggregated[skill_id] = {
@@ -197,10 +239,10 @@ def aggregate_competency_scores(
             "peer_avg": peer_avg,
             "manager_avg": manager_avg,
             "direct_report_avg": direct_report_avg,
-            "n_self": len(self_scores),
-            "n_peer": len(peer_scores),
-            "n_manager": len(manager_scores),
-            "n_direct_report": len(direct_report_scores),
+            "n_self": n_self,
+            "n_peer": n_peer,
+            "n_manager": n_manager,
+            "n_direct_report": n_direct_report,
             "confidence": confidence,
             "raw_stats": raw_stats,
         }
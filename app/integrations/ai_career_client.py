@@ -6,8 +6,10 @@ from uuid import UUID, uuid4
 
 import httpx
 import asyncio
+import pydantic_core
 from app.core.config import get_settings
 from app.core.errors import AIServiceError
+from app.core.serialization import dumps
 from app.core.logging import get_logger
 from app.integrations.base_ai_client import BaseAIClient
 from app.integrations.circuit_breaker import with_circuit_breaker
@@ -75,15 +77,20 @@ class AICareerClient(BaseAIClient):
     ) -> Dict[str, Any]:
 
         try:
+            # Encode/decode with pydantic-core: faster than httpx's stdlib json
+            # and parses the raw bytes without a text decode step
             response = await self.client.post(
                 "/",
-                json={
-                    "skills": skills_data,
-                    "profile": user_profile,
-                },
+                content=dumps(
+                    {
+                        "skills": skills_data,
+                        "profile": user_profile,
+                    }
+                ),
+                headers={"Content-Type": "application/json"},
             )
             response.raise_for_status()
-            return response.json()
+            return pydantic_core.from_json(response.content)
         except httpx.HTTPStatusError as e:
             status = e.response.status_code if e.response is not None else None
             logger.error("AI Career service returned error: %s", e)
@@ -4,9 +4,11 @@ from typing import Any, Dict
 from uuid import UUID
 
 import httpx
+import pydantic_core
 
 from app.core.config import get_settings
 from app.core.errors import AIServiceError
+from app.core.serialization import dumps
 from app.core.logging import get_logger
 from app.integrations.base_ai_client import BaseAIClient
 from app.integrations.retry import with_retry
@@ -87,12 +89,14 @@ class AISkillsClient(BaseAIClient):
         }
 
         try:
+            # Same pydantic-core encode/decode path as the AI Career client
             response = await self.client.post(
                 "",
-                json=payload,
+                content=dumps(payload),
+                headers={"Content-Type": "application/json"},
             )
             response.raise_for_status()
-            return response.json()
+            return pydantic_core.from_json(response.content)
         
         except httpx.HTTPStatusError as e:
             status = e.response.status_code if e.response is not None else None
@@ -32,6 +32,12 @@ class HTTPClient:
                 base_url=self.base_url,
                 timeout=self.timeout,
                 headers=self.headers,
+                # Idle connections outlive the gap between AI calls, so a
+                # long-lived client skips the TCP/TLS handshake on reuse
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    keepalive_expiry=settings.ai_service_keepalive_expiry,
+                ),
             )
         return self._client
 
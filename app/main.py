@@ -10,6 +10,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import get_settings
 from app.core.logging import setup_logging, get_logger
 from app.core.errors import AppError
+from app.services.dependencies import close_ai_clients
 from app.api.v1 import (
     evaluations,
     evaluation_cycles,
@@ -46,6 +47,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     
     # Shutdown
     logger.info(f"Shutting down {settings.app_name}")
+    await close_ai_clients()
 
 
 # Create FastAPI application
@@ -16,6 +16,12 @@ from app.schemas.career_path.career_path import (
     CareerPathWithSteps,
     CareerPathSummary,
     AcceptCareerPathRequest,
+    # AI service payload
+    AICompetencyData,
+    AIStepData,
+    AIPathData,
+    AICareerPathsResult,
+    ai_career_paths_result_adapter,
 )
 
 __all__ = [
@@ -34,4 +40,10 @@ __all__ = [
     "CareerPathWithSteps",
     "CareerPathSummary",
     "AcceptCareerPathRequest",
+    # AI service payload
+    "AICompetencyData",
+    "AIStepData",
+    "AIPathData",
+    "AICareerPathsResult",
+    "ai_career_paths_result_adapter",
 ]
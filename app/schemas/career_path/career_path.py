@@ -1,11 +1,13 @@
 """
 Career Path schemas aligned with schema.md.
 """
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, Any
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 # Development Action Schemas
@@ -320,3 +322,47 @@ class AcceptCareerPathRequest(BaseModel):
         None,
         description="Optional notes or commitment statement from user"
     )
+
+
+# AI Career Path service payload
+# Slotted dataclasses (not models): parsed once per AI response in pydantic-core
+# and only read by the service, which then uses attribute access instead of
+# chained dict.get() calls. Unknown keys are ignored, so only the fields the
+# service reads are declared (e.g. competency levels are not validated).
+@dataclass(slots=True)
+class AICompetencyData:
+    """Competency required by a step, with suggested development actions."""
+
+    name: Optional[str] = None
+    development_actions: Sequence[str] = ()
+
+
+@dataclass(slots=True)
+class AIStepData:
+    """Step of an AI-generated career path."""
+
+    step_number: Optional[int] = None
+    target_role: Optional[str] = None
+    duration_months: Optional[int] = None
+    required_competencies: Sequence[AICompetencyData] = ()
+
+
+@dataclass(slots=True)
+class AIPathData:
+    """Career path alternative generated by the AI."""
+
+    path_name: Optional[str] = None
+    recommended: bool = False
+    feasibility_score: Optional[float] = None
+    total_duration_months: Optional[int] = None
+    steps: Sequence[AIStepData] = ()
+
+
+@dataclass(slots=True)
+class AICareerPathsResult:
+    """Parsed AI Career Path service response."""
+
+    generated_paths: Sequence[AIPathData] = ()
+
+
+ai_career_paths_result_adapter = TypeAdapter(AICareerPathsResult)
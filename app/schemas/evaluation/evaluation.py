@@ -2,14 +2,46 @@
 Evaluation schemas aligned with schema.md.
 """
 from datetime import date, datetime
-from typing import Optional, Protocol, Sequence
+from operator import attrgetter
+from statistics import fmean
+from typing import Annotated, Literal, Optional, Protocol, Sequence
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation
+
+# Tipos restringidos compartidos: las restricciones se declaran una vez y se
+# reutilizan en todos los modelos (cada campo solo añade su descripción).
+Score = Annotated[float, Field(ge=0.0, le=10.0)]
+Confidence = Annotated[float, Field(ge=0.0, le=1.0)]
+Status30 = Annotated[str, Field(max_length=30)]
+
+# Conjuntos cerrados de valores: pydantic-core los valida por lookup y el
+# OpenAPI los publica como enum.
+EvaluatorRelationship = Literal["self", "peer", "manager", "direct_report"]
+EvaluationStatus = Literal["pending", "submitted", "cancelled"]
+ScoreSource = Literal[
+    "360_aggregated",
+    "self_only",
+    "peer_only",
+    "manager_only",
+    "direct_report_only",
+]
+
+_get_score = attrgetter("score")
+
+class _DeferredSchema(BaseModel):
+    """Base for this module's schemas.
+    
+    ``defer_build`` postpones core-schema/validator construction until the first
+    validation, so importing the module (workers, scripts, CLI) stays cheap and
+    only the models actually used pay the build cost once per process.
+    """
+    
+    model_config = ConfigDict(defer_build=True)
 
 
 # Evaluation Cycle Schemas
-class EvaluationCycleBase(BaseModel):
+class EvaluationCycleBase(_DeferredSchema):
     """Base Evaluation Cycle schema.
     
     Represents a campaign/period for conducting 360° evaluations.
@@ -28,11 +60,7 @@ class EvaluationCycleBase(BaseModel):
     )
     start_date: date = Field(..., description="Cycle start date")
     end_date: date = Field(..., description="Cycle end date")
-    status: str = Field(
-        ...,
-        max_length=30,
-        description="Cycle status: 'draft', 'active', 'closed'"
-    )
+    status: Status30 = Field(..., description="Cycle status: 'draft', 'active', 'closed'")
 
 
 class EvaluationCycleCreate(EvaluationCycleBase):
@@ -47,14 +75,14 @@ class EvaluationCycleCreate(EvaluationCycleBase):
     )
 
 
-class EvaluationCycleUpdate(BaseModel):
+class EvaluationCycleUpdate(_DeferredSchema):
     """Schema for updating an evaluation cycle."""
     
     name: Optional[str] = Field(None, min_length=1, max_length=200)
     description: Optional[str] = None
     start_date: Optional[date] = None
     end_date: Optional[date] = None
-    status: Optional[str] = Field(None, max_length=30)
+    status: Optional[Status30] = None
 
 
 class EvaluationCycleResponse(EvaluationCycleBase):
@@ -72,7 +100,7 @@ class EvaluationCycleResponse(EvaluationCycleBase):
 
 
 # Competency Score Schemas
-class CompetencyScoreBase(BaseModel):
+class CompetencyScoreBase(_DeferredSchema):
     """Base Competency Score schema.
     
     Represents an individual skill rating within a 360° evaluation.
@@ -83,10 +111,8 @@ class CompetencyScoreBase(BaseModel):
         ...,
         description="Name of the competency/skill being evaluated"
     )
-    score: float = Field(
+    score: Score = Field(
         ...,
-        ge=0.0,
-        le=10.0,
         description="Competency score on 0-10 scale (0=no evidence, 10=mastery)"
     )
     comments: Optional[str] = Field(
@@ -101,7 +127,7 @@ class CompetencyScoreCreate(CompetencyScoreBase):
 
 
 
-class CompetencyScoreResponse(BaseModel):
+class CompetencyScoreResponse(_DeferredSchema):
     """Competency Score response schema.
     
     Individual skill rating within a 360° evaluation, including full metadata.
@@ -112,12 +138,7 @@ class CompetencyScoreResponse(BaseModel):
     id: UUID = Field(..., description="Unique score identifier")
     evaluation_id: UUID = Field(..., description="Parent evaluation ID")
     skill_id: UUID = Field(..., description="Skill/competency being rated")
-    score: float = Field(
-        ...,
-        ge=0.0,
-        le=10.0,
-        description="Competency score on 0-10 scale"
-    )
+    score: Score = Field(..., description="Competency score on 0-10 scale")
     comments: Optional[str] = Field(
         None,
         description="Evaluator's qualitative feedback"
@@ -127,15 +148,14 @@ class CompetencyScoreResponse(BaseModel):
 
 
 # Evaluation Schemas
-class EvaluationBase(BaseModel):
+class EvaluationBase(_DeferredSchema):
     """Base Evaluation schema.
     
     Represents a single 360° evaluation: one evaluator assessing one user.
     """
     
-    evaluator_relationship: str = Field(
+    evaluator_relationship: EvaluatorRelationship = Field(
         ...,
-        max_length=30,
         description="Relationship type: 'self', 'peer', 'manager', 'direct_report'"
     )
 
@@ -165,10 +185,10 @@ class EvaluationCreate(EvaluationBase):
     )
 
 
-class EvaluationUpdate(BaseModel):
+class EvaluationUpdate(_DeferredSchema):
     """Schema for updating an evaluation."""
     
-    status: Optional[str] = Field(None, max_length=30)  # pending, submitted, cancelled
+    status: Optional[EvaluationStatus] = None
 
 
 class EvaluationResponse(EvaluationBase):
@@ -183,7 +203,7 @@ class EvaluationResponse(EvaluationBase):
     user_id: UUID = Field(..., description="User being evaluated")
     evaluation_cycle_id: UUID = Field(..., description="Evaluation cycle ID")
     evaluator_id: UUID = Field(..., description="Evaluator user ID")
-    status: str = Field(
+    status: EvaluationStatus = Field(
         ...,
         description="Evaluation status: 'pending', 'submitted', 'cancelled'"
     )
@@ -195,21 +215,43 @@ class EvaluationResponse(EvaluationBase):
     updated_at: datetime = Field(..., description="Timestamp of last update")
 
 
-class EvaluationWithScores(EvaluationResponse):
+class EvaluationWithScores(_DeferredSchema):
     """Evaluation response with competency scores included.
     
     Expands the evaluation with full nested competency score details.
     Useful for displaying complete evaluation results.
     """
     
+    # Declarado plano (mismos campos que EvaluationResponse) en lugar de heredar:
+    # la lista de scores es el único esquema compuesto.
+    model_config = ConfigDict(from_attributes=True)
+    
+    evaluator_relationship: EvaluatorRelationship = Field(
+        ...,
+        description="Relationship type: 'self', 'peer', 'manager', 'direct_report'"
+    )
+    id: UUID = Field(..., description="Unique evaluation identifier")
+    user_id: UUID = Field(..., description="User being evaluated")
+    evaluation_cycle_id: UUID = Field(..., description="Evaluation cycle ID")
+    evaluator_id: UUID = Field(..., description="Evaluator user ID")
+    status: EvaluationStatus = Field(
+        ...,
+        description="Evaluation status: 'pending', 'submitted', 'cancelled'"
+    )
+    submitted_at: Optional[datetime] = Field(
+        None,
+        description="Timestamp when evaluation was submitted (null if pending)"
+    )
+    created_at: datetime = Field(..., description="Timestamp when evaluation was created")
+    updated_at: datetime = Field(..., description="Timestamp of last update")
     competency_scores: list[CompetencyScoreResponse] = Field(
-        default_factory=list,
+        ...,
         description="All competency scores for this evaluation"
     )
 
 
 # User Skill Score Schemas (Aggregated Profile)
-class UserSkillScoreResponse(BaseModel):
+class UserSkillScoreResponse(_DeferredSchema):
     """User Skill Score response schema (aggregated from 360°).
     
     Consolidated skill profile derived from multiple evaluations.
@@ -222,23 +264,18 @@ class UserSkillScoreResponse(BaseModel):
     user_id: UUID = Field(..., description="User being assessed")
     evaluation_cycle_id: UUID = Field(..., description="Evaluation cycle this score belongs to")
     skill_id: UUID = Field(..., description="Skill/competency being scored")
-    source: str = Field(
+    source: ScoreSource = Field(
         ...,
         description="Aggregation source: '360_aggregated', 'self_only', 'manager_only', etc."
     )
-    score: float = Field(
-        ...,
-        ge=0.0,
-        le=10.0,
-        description="Aggregated skill score on 0-10 scale"
-    )
-    confidence: Optional[float] = Field(
+    score: Score = Field(..., description="Aggregated skill score on 0-10 scale")
+    confidence: Optional[Confidence] = Field(
         None,
-        ge=0.0,
-        le=1.0,
         description="Statistical confidence in the aggregated score (0-1 range)"
     )
-    raw_stats: Optional[dict] = Field(
+    # Viene de la columna JSONB (ya es JSON válido): se omite el recorrido
+    # de validación del dict en cada fila.
+    raw_stats: Optional[SkipValidation[dict]] = Field(
         None,
         description="Raw statistical data: {mean, std, n, etc.}"
     )
@@ -246,7 +283,7 @@ class UserSkillScoreResponse(BaseModel):
     updated_at: datetime
 
 
-class UserSkillProfile(BaseModel):
+class UserSkillProfile(_DeferredSchema):
     """Aggregated skill profile for a user in a cycle.
     
     Consolidated view of all skill scores for a user in an evaluation cycle.
@@ -256,7 +293,7 @@ class UserSkillProfile(BaseModel):
     user_id: UUID = Field(..., description="User this profile belongs to")
     evaluation_cycle_id: UUID = Field(..., description="Evaluation cycle")
     skill_scores: list[UserSkillScoreResponse] = Field(
-        default_factory=list,
+        ...,
         description="All aggregated skill scores for this user/cycle"
     )
     
@@ -270,4 +307,4 @@ class UserSkillProfile(BaseModel):
         """Average score across all skills. Not so relevant if because maybe the competency set is not comparable."""
         if not self.skill_scores:
             return None
-        return sum(s.score for s in self.skill_scores) / len(self.skill_scores)
+        return fmean(map(_get_score, self.skill_scores))
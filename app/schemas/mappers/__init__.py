@@ -23,9 +23,34 @@ Usage:
     response = EvaluationMapper.orm_to_response(orm_instance)
 """
 
-from app.schemas.mappers.evaluation_mapper import EvaluationMapper
-from app.schemas.mappers.skill_profile_mapper import SkillProfileMapper
-from app.schemas.mappers.career_path_mapper import CareerPathMapper
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.schemas.mappers.evaluation_mapper import EvaluationMapper
+    from app.schemas.mappers.skill_profile_mapper import SkillProfileMapper
+    from app.schemas.mappers.career_path_mapper import CareerPathMapper
+
+# Carga diferida (PEP 562): cada mapper importa sus modelos ORM y schemas solo
+# cuando se usa por primera vez.
+_LAZY_MAPPERS = {
+    "EvaluationMapper": "app.schemas.mappers.evaluation_mapper",
+    "SkillProfileMapper": "app.schemas.mappers.skill_profile_mapper",
+    "CareerPathMapper": "app.schemas.mappers.career_path_mapper",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_MAPPERS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_MAPPERS])
 
 __all__ = [
     "EvaluationMapper",
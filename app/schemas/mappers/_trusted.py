@@ -0,0 +1,60 @@
+"""Construction of response models from trusted, already-valid data.
+
+Used by the mappers for rows read from our own database (or just written by
+a service), where a second validation pass adds cost but no safety.
+"""
+from collections.abc import Callable, Set
+from functools import cache
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def construct_trusted(model_cls: type[ModelT], values: dict, fields_set: Set[str]) -> ModelT:
+    """Build a model instance from an already-complete, trusted ``values`` dict.
+
+    Same result as ``model_construct`` but skips its per-field default/alias
+    loop: ``values`` must contain every declared field (no extras, no
+    private attributes).
+    """
+    instance = model_cls.__new__(model_cls)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(fields_set))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+@cache
+def orm_field_sources(model_cls: type[BaseModel]) -> tuple[tuple[str, str], ...]:
+    """(field name, ORM attribute) pairs for a ``from_attributes`` model.
+
+    A string ``validation_alias`` names the ORM attribute (e.g. ``metadata``
+    is read from ``step_metadata``); otherwise the field name is used.
+    """
+    return tuple(
+        (name, field.validation_alias if isinstance(field.validation_alias, str) else name)
+        for name, field in model_cls.model_fields.items()
+    )
+
+
+def construct_from_orm(
+    model_cls: type[ModelT],
+    orm: Any,
+    nested: dict[str, Callable[[Any], BaseModel]] | None = None,
+) -> ModelT:
+    """Build ``model_cls`` from ORM attributes without validation.
+
+    Args:
+        model_cls: Response model to build
+        orm: Loaded ORM instance (all read attributes must be loaded)
+        nested: Field name -> converter for list relationships whose items
+            must themselves be built as response models
+    """
+    values = {name: getattr(orm, attr) for name, attr in orm_field_sources(model_cls)}
+    if nested:
+        for name, convert in nested.items():
+            values[name] = [convert(child) for child in values[name] or ()]
+    return construct_trusted(model_cls, values, values.keys())
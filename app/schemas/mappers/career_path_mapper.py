@@ -1,4 +1,8 @@
 """Mapper for Career Path aggregate (ORM ↔ Entity ↔ Schema)."""
+from itertools import starmap
+from operator import attrgetter
+from typing import Sequence
+
 from app.db.models.career_path.career_path import CareerPath as CareerPathORM
 from app.db.models.career_path.career_path_step import CareerPathStep as CareerPathStepORM
 from app.db.models.career_path.development_action import DevelopmentAction as DevelopmentActionORM
@@ -12,7 +16,81 @@ from app.schemas.career_path.career_path import (
     CareerPathWithSteps,
     CareerPathStepResponse,
     DevelopmentActionResponse,
+    CareerPathStepWithActions,
+)
+from app.schemas.mappers._trusted import construct_from_orm
+
+# Extractores construidos una sola vez (orden = campos posicionales de cada entidad).
+_ACTION_FIELDS = attrgetter(
+    "action_type",
+    "title",
+    "skill_id",
+    "description",
+    "provider",
+    "url",
+    "estimated_effort_hours",
+)
+_STEP_FIELDS = attrgetter(
+    "step_number",
+    "target_role_id",
+    "step_name",
+    "description",
+    "duration_months",
 )
+_PATH_HEAD_FIELDS = attrgetter("id", "user_id", "skills_assessment_id", "path_name")
+_PATH_TAIL_FIELDS = attrgetter("total_duration_months", "status")
+_TIMESTAMP_FIELDS = attrgetter("created_at", "updated_at")
+
+# Colección vacía compartida para relaciones sin filas (sin alocar una lista por fila)
+_EMPTY: tuple = ()
+
+
+# Helpers a nivel de módulo: map()/starmap() iteran en C y evitan el lookup
+# del staticmethod en cada elemento. Los globales usados por fila se enlazan
+# como argumentos por defecto (LOAD_FAST en lugar de LOAD_GLOBAL).
+def _actions_to_entities(
+    actions, _action=DevelopmentAction, _fields=_ACTION_FIELDS
+) -> Sequence[DevelopmentAction]:
+    if not actions:
+        return _EMPTY
+    return list(starmap(_action, map(_fields, actions)))
+
+
+def _step_to_entity(
+    step: CareerPathStepORM,
+    _step=CareerPathStep,
+    _fields=_STEP_FIELDS,
+    _actions=_actions_to_entities,
+) -> CareerPathStep:
+    return _step(*_fields(step), _actions(step.development_actions))
+
+
+def _path_to_entity(orm: CareerPathORM) -> CareerPathEntity:
+    steps = orm.steps
+    return CareerPathEntity(
+        *_PATH_HEAD_FIELDS(orm),
+        orm.recommended or False,
+        orm.feasibility_score or 0.0,
+        *_PATH_TAIL_FIELDS(orm),
+        list(map(_step_to_entity, steps)) if steps else _EMPTY,
+        *_TIMESTAMP_FIELDS(orm),
+    )
+
+
+# Respuestas construidas sin revalidar: los ORMs vienen de nuestra propia BD
+# (o acaban de ser escritos por el servicio) y ya cumplen los invariantes.
+def _action_to_response(orm: DevelopmentActionORM) -> DevelopmentActionResponse:
+    return construct_from_orm(DevelopmentActionResponse, orm)
+
+
+def _step_to_response(orm: CareerPathStepORM) -> CareerPathStepWithActions:
+    return construct_from_orm(
+        CareerPathStepWithActions, orm, {"development_actions": _action_to_response}
+    )
+
+
+def _path_to_response(orm: CareerPathORM) -> CareerPathResponse:
+    return construct_from_orm(CareerPathResponse, orm)
 
 
 class CareerPathMapper:
@@ -28,15 +106,7 @@ class CareerPathMapper:
         Returns:
             DevelopmentAction: Domain value object
         """
-        return DevelopmentAction(
-            action_type=orm.action_type,
-            title=orm.title,
-            skill_id=orm.skill_id,
-            description=orm.description,
-            provider=orm.provider,
-            url=orm.url,
-            estimated_effort_hours=orm.estimated_effort_hours,
-        )
+        return DevelopmentAction(*_ACTION_FIELDS(orm))
     
     @staticmethod
     def career_path_step_orm_to_entity(orm: CareerPathStepORM) -> CareerPathStep:
@@ -48,17 +118,7 @@ class CareerPathMapper:
         Returns:
             CareerPathStep: Domain entity
         """
-        return CareerPathStep(
-            step_number=orm.step_number,
-            target_role_id=orm.target_role_id,
-            step_name=orm.step_name,
-            description=orm.description,
-            duration_months=orm.duration_months,
-            actions=[
-                CareerPathMapper.development_action_orm_to_entity(action)
-                for action in (orm.development_actions or [])
-            ],
-        )
+        return _step_to_entity(orm)
     
     @staticmethod
     def orm_to_entity(orm: CareerPathORM) -> CareerPathEntity:
@@ -70,37 +130,34 @@ class CareerPathMapper:
         Returns:
             CareerPathEntity: Domain entity
         """
-        return CareerPathEntity(
-            id=orm.id,
-            user_id=orm.user_id,
-            skills_assessment_id=orm.skills_assessment_id,
-            path_name=orm.path_name,
-            recommended=orm.recommended or False,
-            feasibility_score=float(orm.feasibility_score) if orm.feasibility_score else 0.0,
-            total_duration_months=orm.total_duration_months,
-            status=orm.status,
-            steps=[
-                CareerPathMapper.career_path_step_orm_to_entity(step)
-                for step in (orm.steps or [])
-            ],
-            created_at=orm.created_at,
-            updated_at=orm.updated_at,
-        )
+        return _path_to_entity(orm)
     
     @staticmethod
     def orm_to_response(orm: CareerPathORM, include_steps: bool = False) -> CareerPathResponse | CareerPathWithSteps:
-        """Direct ORM to API Response (using Pydantic from_attributes).
+        """Direct ORM to API Response for trusted rows (no re-validation).
         
         Args:
-            orm: SQLAlchemy ORM instance
+            orm: SQLAlchemy ORM instance (steps/actions loaded if include_steps)
             include_steps: Whether to include steps
             
         Returns:
             CareerPathResponse or CareerPathWithSteps
         """
         if include_steps:
-            return CareerPathWithSteps.model_validate(orm)
-        return CareerPathResponse.model_validate(orm)
+            return construct_from_orm(CareerPathWithSteps, orm, {"steps": _step_to_response})
+        return _path_to_response(orm)
+    
+    @staticmethod
+    def orms_to_responses(orms: Sequence[CareerPathORM]) -> list[CareerPathResponse]:
+        """Bulk ORM to API Response for trusted rows (no re-validation).
+        
+        Args:
+            orms: List of ORM instances
+            
+        Returns:
+            List of CareerPathResponse
+        """
+        return list(map(_path_to_response, orms))
     
     @staticmethod
     def orms_to_entities(orms: list[CareerPathORM]) -> list[CareerPathEntity]:
@@ -112,4 +169,4 @@ class CareerPathMapper:
         Returns:
             List of domain entities
         """
-        return [CareerPathMapper.orm_to_entity(orm) for orm in orms]
+        return list(map(_path_to_entity, orms))
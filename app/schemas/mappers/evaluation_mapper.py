@@ -1,4 +1,6 @@
 """Mapper for Evaluation aggregate (ORM ↔ Entity ↔ Schema)."""
+from itertools import starmap
+from operator import attrgetter
 from typing import Optional
 from uuid import UUID
 
@@ -7,12 +9,67 @@ from app.db.models.evaluation.evaluation_competency_score import (
     EvaluationCompetencyScore as CompetencyScoreORM
 )
 from app.domain.entities.evaluation import EvaluationEntity, CompetencyScore
+from app.schemas.mappers._trusted import construct_trusted
 from app.schemas.evaluation.evaluation import (
     EvaluationResponse,
     EvaluationWithScores,
     CompetencyScoreResponse,
 )
 
+# Extractores construidos una sola vez: un attrgetter obtiene todas las
+# columnas en una llamada en C en lugar de un LOAD_ATTR por campo.
+# El orden coincide con los campos posicionales de EvaluationEntity.
+_EVAL_HEAD_FIELDS = attrgetter(
+    "id",
+    "user_id",
+    "evaluation_cycle_id",
+    "evaluator_id",
+    "evaluator_relationship",
+    "status",
+)
+_EVAL_TAIL_FIELDS = attrgetter("submitted_at", "created_at", "updated_at")
+_SCORE_FIELDS = attrgetter("skill_id", "score", "comments")
+
+# Colección vacía compartida para evaluaciones sin scores cargados
+_EMPTY: tuple = ()
+
+# Campos de EvaluationResponse (todos presentes en EvaluationEntity) leídos del
+# entity en una sola llamada; el fields_set se calcula una vez.
+_RESPONSE_FIELD_NAMES = tuple(EvaluationResponse.model_fields)
+_RESPONSE_FIELDS_SET = frozenset(_RESPONSE_FIELD_NAMES)
+_WITH_SCORES_FIELDS_SET = _RESPONSE_FIELDS_SET | {"competency_scores"}
+_ENTITY_RESPONSE_VALUES = attrgetter(*_RESPONSE_FIELD_NAMES)
+
+
+# Helper a nivel de módulo: map()/starmap() iteran en C y evitan el lookup del
+# staticmethod por elemento. Los globales del bucle se enlazan como argumentos
+# por defecto (LOAD_FAST en lugar de LOAD_GLOBAL por fila).
+def _orm_to_entity(
+    orm: EvaluationORM,
+    _entity=EvaluationEntity,
+    _score=CompetencyScore,
+    _head=_EVAL_HEAD_FIELDS,
+    _tail=_EVAL_TAIL_FIELDS,
+    _score_fields=_SCORE_FIELDS,
+) -> EvaluationEntity:
+    scores = orm.competency_scores
+    return _entity(
+        *_head(orm),
+        list(starmap(_score, map(_score_fields, scores))) if scores else _EMPTY,
+        *_tail(orm),
+    )
+
+
+def _orm_to_entity_without_scores(
+    orm: EvaluationORM,
+    _entity=EvaluationEntity,
+    _head=_EVAL_HEAD_FIELDS,
+    _tail=_EVAL_TAIL_FIELDS,
+    _empty=_EMPTY,
+) -> EvaluationEntity:
+    # No accede a orm.competency_scores (puede no estar cargado)
+    return _entity(*_head(orm), _empty, *_tail(orm))
+
 
 class EvaluationMapper:
     """Bidirectional mapping between ORM, Entity, and Schema layers."""
@@ -27,25 +84,7 @@ class EvaluationMapper:
         Returns:
             EvaluationEntity: Rich domain model with business logic
         """
-        return EvaluationEntity(
-            id=orm.id,
-            user_id=orm.user_id,
-            evaluation_cycle_id=orm.evaluation_cycle_id,
-            evaluator_id=orm.evaluator_id,
-            evaluator_relationship=orm.evaluator_relationship,
-            status=orm.status,
-            competency_scores=[
-                CompetencyScore(
-                    skill_id=score.skill_id,
-                    score=float(score.score),  # Ensure float (may be Decimal)
-                    comments=score.comments
-                )
-                for score in (orm.competency_scores or [])
-            ],
-            submitted_at=orm.submitted_at,
-            created_at=orm.created_at,
-            updated_at=orm.updated_at,
-        )
+        return _orm_to_entity(orm)
     
     @staticmethod
     def entity_to_response(
@@ -61,28 +100,17 @@ class EvaluationMapper:
         Returns:
             EvaluationResponse or EvaluationWithScores
         """
-        base_data = {
-            "id": entity.id,
-            "user_id": entity.user_id,
-            "evaluation_cycle_id": entity.evaluation_cycle_id,
-            "evaluator_id": entity.evaluator_id,
-            "evaluator_relationship": entity.evaluator_relationship,
-            "status": entity.status,
-            "submitted_at": entity.submitted_at,
-            "created_at": entity.created_at or None,
-            "updated_at": entity.updated_at or None,
-        }
+        # El entity ya fue validado en el dominio: se construye sin revalidar.
+        base_data = dict(zip(_RESPONSE_FIELD_NAMES, _ENTITY_RESPONSE_VALUES(entity)))
         
         if include_scores:
             # Note: CompetencyScoreResponse needs id, evaluation_id, created_at, updated_at
             # which are not in the entity. This is a limitation of the current approach.
             # For now, we'll use the ORM-to-response shortcut for full details.
-            return EvaluationWithScores(
-                **base_data,
-                competency_scores=[]  # Would need ORM data for complete info
-            )
+            base_data["competency_scores"] = []  # Would need ORM data for complete info
+            return construct_trusted(EvaluationWithScores, base_data, _WITH_SCORES_FIELDS_SET)
         
-        return EvaluationResponse(**base_data)
+        return construct_trusted(EvaluationResponse, base_data, _RESPONSE_FIELDS_SET)
     
     @staticmethod
     def orm_to_response(
@@ -106,13 +134,20 @@ class EvaluationMapper:
         return EvaluationResponse.model_validate(orm)
     
     @staticmethod
-    def orms_to_entities(orms: list[EvaluationORM]) -> list[EvaluationEntity]:
+    def orms_to_entities(
+        orms: list[EvaluationORM],
+        include_scores: bool = True,
+    ) -> list[EvaluationEntity]:
         """Bulk convert ORM list to Entity list.
         
         Args:
             orms: List of ORM instances
+            include_scores: Whether to map competency scores; when False the
+                relationship is never accessed, so it need not be loaded
             
         Returns:
             List of domain entities
         """
-        return [EvaluationMapper.orm_to_entity(orm) for orm in orms]
+        if include_scores:
+            return list(map(_orm_to_entity, orms))
+        return list(map(_orm_to_entity_without_scores, orms))
@@ -22,8 +22,8 @@ class SkillProfileMapper:
         """
         return UserSkillScore(
             skill_id=orm.skill_id,
-            score=float(orm.score),
-            confidence=float(orm.confidence) if orm.confidence else 0.0,
+            score=orm.score,
+            confidence=orm.confidence or 0.0,
             source=orm.source,
             raw_stats=orm.raw_stats or {},
         )
@@ -84,14 +84,22 @@ class SkillProfileMapper:
         user_id = first.user_id
         cycle_id = first.evaluation_cycle_id
         
-        skills = [SkillProfileMapper.orm_to_skill_score(orm) for orm in orms]
+        # Una sola pasada: value objects + updated_at más reciente
+        to_skill_score = SkillProfileMapper.orm_to_skill_score
+        skills = []
+        max_updated = None
+        for orm in orms:
+            skills.append(to_skill_score(orm))
+            updated = orm.updated_at
+            if updated is not None and (max_updated is None or updated > max_updated):
+                max_updated = updated
         
         return SkillProfile(
             user_id=user_id,
             cycle_id=cycle_id,
             skills=skills,
             created_at=first.created_at,
-            updated_at=max(orm.updated_at for orm in orms) if orms else None,
+            updated_at=max_updated,
         )
     
     @staticmethod
@@ -100,18 +108,17 @@ class SkillProfileMapper:
         
         Args:
             profile: Domain entity
-            orms: Original ORMs (for metadata)
+            orms: Original ORMs (for metadata), in the same order used to
+                build the profile via ``orms_to_profile``
             
         Returns:
             UserSkillProfileSchema
         """
-        # Create mapping from skill_id to ORM for metadata lookup
-        orm_map = {orm.skill_id: orm for orm in orms}
-        
+        # orms_to_profile preserva el orden de los ORMs: se emparejan por posición
+        # (strict=True detecta listas desalineadas en lugar de truncar en silencio)
         skill_scores = [
-            SkillProfileMapper.skill_score_to_response(skill, orm_map[skill.skill_id])
-            for skill in profile.skills
-            if skill.skill_id in orm_map
+            SkillProfileMapper.skill_score_to_response(skill, orm)
+            for skill, orm in zip(profile.skills, orms, strict=True)
         ]
         
         return UserSkillProfileSchema(
@@ -2,10 +2,15 @@
 Skills Assessment schemas aligned with schema.md.
 """
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation
+
+# Tipos estrictos para los items: los valores llegan ya tipados desde el ORM
+# (Numeric con asdecimal=False) o el servicio, así que pydantic-core no
+# necesita la ruta de coerción (p. ej. str -> float). Los int se aceptan.
+Level = Annotated[float, Field(strict=True, ge=0.0, le=10.0)]
 
 
 # Assessment Item Schemas
@@ -19,58 +24,57 @@ class SkillsAssessmentItemBase(BaseModel):
     
     item_type: str = Field(
         ...,
+        strict=True,
         max_length=50,
         description="Item classification: 'strength', 'growth_area', 'hidden_talent', 'role_readiness'"
     )
     label: Optional[str] = Field(
         None,
+        strict=True,
         max_length=150,
         description="Custom label if skill/role is not in catalog"
     )
-    current_level: Optional[float] = Field(
+    current_level: Optional[Level] = Field(
         None,
-        ge=0.0,
-        le=10.0,
         description="Current skill proficiency level (0-10 scale)"
     )
-    target_level: Optional[float] = Field(
+    target_level: Optional[Level] = Field(
         None,
-        ge=0.0,
-        le=10.0,
         description="Target/required skill level for development (0-10 scale)"
     )
-    gap_score: Optional[float] = Field(
+    gap_score: Optional[Level] = Field(
         None,
-        ge=0.0,
-        le=10.0,
         description="Gap between current and target level (0-10 scale)"
     )
-    score: Optional[float] = Field(
+    score: Optional[Level] = Field(
         None,
-        ge=0.0,
-        le=10.0,
         description="General score/rating for this item (0-10 scale)"
     )
     priority: Optional[str] = Field(
         None,
+        strict=True,
         max_length=50,
         description="Development priority: 'Alta', 'Media', 'Baja'"
     )
     readiness_percentage: Optional[float] = Field(
         None,
+        strict=True,
         ge=0.0,
         le=100.0,
         description="Role readiness percentage (0-100, converted from internal 0-1 range)"
     )
     evidence: Optional[str] = Field(
         None,
+        strict=True,
         description="AI-generated evidence or rationale for this assessment"
     )
     metadata: Optional[dict] = Field(
         None,
         description="Additional metadata from AI analysis",
-        validation_alias="item_metadata",  # Maps from DB model attribute
-        serialization_alias="metadata"     # Serializes as 'metadata' in response
+        # Read from the ORM attribute; serialized under the field name.
+        # No serialization_alias: it would only repeat the field name and
+        # add alias handling to every dump of high-fanout item lists.
+        validation_alias="item_metadata",
     )
 
 
@@ -160,11 +164,13 @@ class SkillsAssessmentUpdate(BaseModel):
         max_length=50,
         description="AI model version"
     )
-    raw_request: Optional[dict] = Field(
+    # Payloads opacos del servicio de IA (ya son JSON válido): se guardan tal
+    # cual en JSONB, sin recorrer el dict para validarlo.
+    raw_request: Optional[SkipValidation[dict]] = Field(
         None,
         description="Raw AI request payload (for debugging/audit)"
     )
-    raw_response: Optional[dict] = Field(
+    raw_response: Optional[SkipValidation[dict]] = Field(
         None,
         description="Raw AI response payload"
     )
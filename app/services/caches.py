@@ -0,0 +1,19 @@
+"""Process-wide caches shared by services.
+
+Entries hold plain Python data derived from the database (never ORM
+instances, which are bound to a request session).
+"""
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+
+settings = get_settings()
+
+# Active role catalog for career path generation:
+# "active" -> catalog (organization_structure, plain and serialized, + name/id indexes)
+# Invalidated by RoleService on every role write.
+role_catalog_cache: TTLCache = TTLCache(ttl_seconds=settings.role_catalog_cache_ttl)
+
+# Active skill ids used to resolve evaluation competencies:
+# skill name -> skill id (only names found in the catalog are stored)
+# Invalidated by SkillService on every skill write.
+skill_id_cache: TTLCache = TTLCache(ttl_seconds=settings.skill_id_cache_ttl)
@@ -1,14 +1,17 @@
 """Career path service: build payloads, call AI client and persist results."""
-from datetime import datetime, timezone
-from typing import Optional
+import asyncio
+import time
+from collections.abc import Sequence
+from typing import NamedTuple, Optional
 from uuid import UUID, uuid4
 
+from sqlalchemy import Row
+
 from app.core.errors import NotFoundError, ExternalServiceError as ServiceError, ValidationError, ConflictError
 from app.core.logging import get_logger
+from app.core.serialization import RawJSON
 from app.db.models import (
     CareerPath,
-    CareerPathStep,
-    DevelopmentAction,
     AICallsLog,
 )
 from app.db.unit_of_work import UnitOfWork
@@ -16,12 +19,90 @@ from app.schemas.career_path.career_path import (
     CareerPathResponse,
     CareerPathWithSteps,
     CareerPathStepResponse,
+    ai_career_paths_result_adapter,
 )
 from app.schemas.mappers.career_path_mapper import CareerPathMapper
 from app.integrations.ai_career_client import AICareerClient
+from app.services.caches import role_catalog_cache
+from app.utils.ids import uuid4_batch
 
 logger = get_logger(__name__)
 
+# Action type keywords (ES/EN) by casefolded word: titles are classified with
+# one dict lookup per word. When several types appear, the lowest rank wins.
+# Matching is case-insensitive and whole-word: "Coursera" is not a course,
+# while hyphenated compounds ("Curso-taller") are matched by their parts.
+_ACTION_TYPE_KEYWORDS = {
+    "curso": "course",
+    "cursos": "course",
+    "course": "course",
+    "courses": "course",
+    "proyecto": "project",
+    "proyectos": "project",
+    "project": "project",
+    "projects": "project",
+    "mentoría": "mentoring",
+    "mentoria": "mentoring",
+    "mentoring": "mentoring",
+    "shadowing": "shadowing",
+    "certificación": "certification",
+    "certificacion": "certification",
+    "certificaciones": "certification",
+    "certification": "certification",
+    "certifications": "certification",
+}
+_ACTION_TYPE_RANK = {
+    action_type: rank
+    for rank, action_type in enumerate(
+        ("course", "project", "mentoring", "shadowing", "certification")
+    )
+}
+_WORD_PUNCTUATION = ":;,.()[]\"'¿?¡!"
+
+
+def _classify_action_type(title: str) -> str:
+    """Infer the development action type from its title (simple heuristic).
+
+    Whole, case-insensitive keywords only (see _ACTION_TYPE_KEYWORDS);
+    returns "other" when no keyword appears.
+    """
+    found = "other"
+    for word in title.casefold().replace("-", " ").split():
+        action_type = _ACTION_TYPE_KEYWORDS.get(word.strip(_WORD_PUNCTUATION))
+        if action_type is not None and (
+            found == "other" or _ACTION_TYPE_RANK[action_type] < _ACTION_TYPE_RANK[found]
+        ):
+            found = action_type
+    return found
+
+
+class _RoleCatalog(NamedTuple):
+    """Active role catalog cached across requests (read-only)."""
+
+    organization_structure: list[dict]  # AI payload entries (logged as-is)
+    organization_structure_json: RawJSON  # Same entries, serialized for the HTTP body
+    names_by_id: dict[UUID, str]
+    ids_by_name: dict[str, UUID]
+
+
+def _build_role_catalog(roles: Sequence[Row]) -> _RoleCatalog:
+    """Build the role catalog (plain CPU work, safe to run in a worker thread)."""
+    organization_structure = [
+        {
+            "role_id": str(role.id),
+            "role_name": role.name,
+            "job_family": role.job_family,  # e.g., "Engineering", "Sales", "Management"
+            "seniority_level": role.seniority_level,  # e.g., "Junior", "Senior", "Lead"
+        }
+        for role in roles
+    ]
+    return _RoleCatalog(
+        organization_structure=organization_structure,
+        organization_structure_json=RawJSON.of(organization_structure),
+        names_by_id={role.id: role.name for role in roles},
+        ids_by_name={role.name: role.id for role in roles},
+    )
+
 
 class CareerPathService:
     """Orchestrates career-path generation and management."""
@@ -86,24 +167,25 @@ class CareerPathService:
                     "Please complete 360° evaluation and skills assessment first."
                 )
         
-        # Determine current position from user's role
+        # Build organization structure (available roles), reused across
+        # requests for the cache TTL since the catalog rarely changes. The AI
+        # request body splices in the pre-serialized copy; the logged
+        # request_payload keeps the plain entries so any JSONB serializer can
+        # write it.
+        role_catalog = await self._get_role_catalog()
+        organization_structure = role_catalog.organization_structure
+        role_names_by_id = role_catalog.names_by_id
+        
+        # Determine current position from user's role: only an inactive or
+        # unlisted role needs its own query
         current_position = "Unknown"
         if user.role_id:
-            role = await self.uow.roles.get_by_id(user.role_id)
-            if role:
-                current_position = role.name
-        
-        # Build organization structure (available roles)
-        all_roles = await self.uow.roles.get_all_active(limit=1000)  # Get all active roles
-        organization_structure = [
-            {
-                "role_id": str(role.id),
-                "role_name": role.name,
-                "job_family": role.job_family,  # e.g., "Engineering", "Sales", "Management"
-                "seniority_level": role.seniority_level,  # e.g., "Junior", "Senior", "Lead"
-            }
-            for role in all_roles
-        ]
+            role_name = role_names_by_id.get(user.role_id)
+            if role_name is None:
+                role = await self.uow.roles.get_by_id(user.role_id)
+                role_name = role.name if role else None
+            if role_name:
+                current_position = role_name
         
         # Prepare request payload for AI
         request_payload = {
@@ -116,10 +198,11 @@ class CareerPathService:
         }
         
         logger.info(
-            f"Built career path payload with {len(organization_structure)} available roles"
+            f"Built career path payload with {len(role_names_by_id)} available roles"
         )
         
-        # Create AI call log entry (pre-call)
+        # AI call log entry: inserted once, with its final status, after the
+        # call (no pre-call commit and no later UPDATE of the row)
         ai_log = AICallsLog(
             id=uuid4(),
             service_name="career_paths",
@@ -127,14 +210,11 @@ class CareerPathService:
             skills_assessment_id=assessment.id,
             evaluation_cycle_id=assessment.evaluation_cycle_id,
             request_payload=request_payload,
-            status="pending",  # Will update after call completes
         )
-        created_log = await self.uow.ai_calls_log.create(ai_log)
-        await self.uow.commit()
         
         # Call AI Career Path service
         try:
-            start_time = datetime.now(timezone.utc)
+            start_time = time.perf_counter()
             
             # Call the AI service client (handles HTTP, retries, circuit breaker)
             ai_response = await self.ai_career_client.generate_career_paths(
@@ -146,25 +226,27 @@ class CareerPathService:
                 user_profile={
                     "user_id": str(user_id),
                     "current_position": current_position,
-                    "organization_structure": organization_structure,
+                    "organization_structure": role_catalog.organization_structure_json,
                 },
             )
+            # Parse the fields we read into typed structs in one pass; a
+            # malformed response is handled like any other AI failure
+            ai_result = ai_career_paths_result_adapter.validate_python(ai_response)
             
-            end_time = datetime.now(timezone.utc)
-            latency_ms = int((end_time - start_time).total_seconds() * 1000)
+            latency_ms = int((time.perf_counter() - start_time) * 1000)
             
             logger.info(
                 f"AI Career Path generation succeeded (latency: {latency_ms}ms)"
             )
             
         except Exception as e:
-            # Handle AI service errors: update log and re-raise as ServiceError
+            # Handle AI service errors: write log and re-raise as ServiceError
             logger.error(f"AI Career Path generation failed: {e}")
             
-            # Update AI log with error details for monitoring and debugging
-            created_log.status = "error"
-            created_log.error_message = str(e)
-            await self.uow.ai_calls_log.update(created_log)
+            # Write AI log with error details for monitoring and debugging
+            ai_log.status = "error"
+            ai_log.error_message = str(e)
+            self.uow.ai_calls_log.add(ai_log)
             await self.uow.commit()
             
             # Raise ServiceError to be handled by the API layer
@@ -176,120 +258,129 @@ class CareerPathService:
         
         # Persist AI response: career paths, steps and actions
         created_paths = []
+        generated_paths = ai_result.generated_paths
+        
+        # Resolve every role/skill name referenced by the AI in two IN queries
+        # (instead of one lookup per step and per competency)
+        role_names = {
+            step_data.target_role
+            for path_data in generated_paths
+            for step_data in path_data.steps
+            if step_data.target_role
+        }
+        skill_names = {
+            competency.name
+            for path_data in generated_paths
+            for step_data in path_data.steps
+            for competency in step_data.required_competencies
+            if competency.name
+        }
+        # Names in the cached active catalog are resolved in memory; only the
+        # rest (inactive or unknown roles) are queried
+        role_ids_by_name = {
+            name: role_catalog.ids_by_name[name]
+            for name in role_names
+            if name in role_catalog.ids_by_name
+        }
+        unresolved_role_names = role_names.difference(role_ids_by_name)
+        if unresolved_role_names:
+            role_ids_by_name.update(
+                (role.name, role.id)
+                for role in await self.uow.roles.get_by_names(
+                    list(unresolved_role_names), active_only=False
+                )
+            )
+        skill_ids_by_name = {
+            skill.name: skill.id
+            for skill in await self.uow.skills.get_by_names(list(skill_names), active_only=False)
+        }
+        
+        # Build every path, step and action row up front: IDs are generated
+        # client-side, so children can reference parents before any write and
+        # each table is written in a single round-trip. All IDs come from one
+        # batch (a single urandom read instead of one per row).
+        id_count = len(generated_paths) + sum(
+            1 + sum(len(competency.development_actions) for competency in step_data.required_competencies)
+            for path_data in generated_paths
+            for step_data in path_data.steps
+        )
+        new_ids = iter(uuid4_batch(id_count))
+        step_rows: list[dict] = []
+        action_rows: list[dict] = []
         
         # Process each generated path from AI response
         # Typically the AI returns 2-4 alternative paths
-        for path_data in ai_response.get("generated_paths", []):
+        for path_data in generated_paths:
             # Create top-level career_path record
             career_path = CareerPath(
-                id=uuid4(),
+                id=next(new_ids),
                 user_id=user_id,
                 skills_assessment_id=assessment.id,  # Links to the assessment this is based on
-                path_name=path_data.get("path_name"),  # e.g., "Regional Leadership Track"
-                recommended=path_data.get("recommended", False),  # AI's top pick
-                feasibility_score=path_data.get("feasibility_score"),  # Range: 0.0-1.0
-                total_duration_months=path_data.get("total_duration_months"),  # e.g., 24 months
+                path_name=path_data.path_name,  # e.g., "Regional Leadership Track"
+                recommended=path_data.recommended,  # AI's top pick
+                feasibility_score=path_data.feasibility_score,  # Range: 0.0-1.0
+                total_duration_months=path_data.total_duration_months,  # e.g., 24 months
                 status="proposed",  # Initial status as per flows.md: user hasn't accepted yet
             )
+            created_paths.append(career_path)
             
-            created_path = await self.uow.career_paths.create(career_path)
-            
-            # Create steps for the path
-            steps_data = path_data.get("steps", [])
-            created_steps = []
-            
-            for step_data in steps_data:
+            for step_data in path_data.steps:
                 # Resolve optional role link by name
-                target_role_id = None
-                target_role_name = step_data.get("target_role")  # e.g., "Senior Manager"
-                
-                if target_role_name:
-                    role = await self.uow.roles.get_by_name(target_role_name)
-                    if role:
-                        target_role_id = role.id
-                    # Note: If role not found, we still create the step but without role link
-                    # This handles cases where AI suggests roles not in our catalog
-                
-                # Create step record (may be created without role link)
-                step = CareerPathStep(
-                    id=uuid4(),
-                    career_path_id=created_path.id,
-                    step_number=step_data.get("step_number"),  # Sequential: 1, 2, 3...
-                    target_role_id=target_role_id,  # FK to roles table (nullable)
-                    description=f"Progress to {target_role_name}",
-                    duration_months=step_data.get("duration_months"),  # How long this step takes
-                )
-                created_steps.append(step)
-            
-            # Bulk create steps for efficiency
-            if created_steps:
-                await self.uow.career_path_steps.create_bulk(created_steps)
-                logger.info(
-                    f"Created {len(created_steps)} steps for path {created_path.id}"
+                target_role_name = step_data.target_role  # e.g., "Senior Manager"
+                # Note: If role not found, we still create the step but without role link
+                # This handles cases where AI suggests roles not in our catalog
+                step_id = next(new_ids)
+                step_rows.append(
+                    {
+                        "id": step_id,
+                        "career_path_id": career_path.id,
+                        "step_number": step_data.step_number,  # Sequential: 1, 2, 3...
+                        "target_role_id": role_ids_by_name.get(target_role_name),  # nullable FK
+                        "description": f"Progress to {target_role_name}",
+                        "duration_months": step_data.duration_months,
+                    }
                 )
-            
-            # Create development actions for each step
-            for step, step_data in zip(created_steps, steps_data):
-                actions = []
                 
                 # Process required_competencies and their development_actions
                 # The AI identifies skills needed for each step and suggests actions
-                for competency in step_data.get("required_competencies", []):
-                    skill_name = competency.get("name")  # e.g., "Strategic Thinking"
-                    
+                for competency in step_data.required_competencies:
                     # Resolve skill_id from our skills catalog
-                    skill_id = None
-                    if skill_name:
-                        skill = await self.uow.skills.get_by_name(skill_name)
-                        if skill:
-                            skill_id = skill.id
+                    skill_id = skill_ids_by_name.get(competency.name)
                     
-                    # Create development actions for this skill
-                    for action_title in competency.get("development_actions", []):
-                        # Parse action type from title (simple heuristic)
-                        # In production, the AI might provide structured action_type
-                        action_type = "other"
-                        if "Curso" in action_title or "Course" in action_title:
-                            action_type = "course"
-                        elif "Proyecto" in action_title or "Project" in action_title:
-                            action_type = "project"
-                        elif "Mentoría" in action_title or "Mentoring" in action_title:
-                            action_type = "mentoring"
-                        elif "Shadowing" in action_title:
-                            action_type = "shadowing"
-                        elif "Certificación" in action_title or "Certification" in action_title:
-                            action_type = "certification"
-                        
-                        # Create development action record
-                        action = DevelopmentAction(
-                            id=uuid4(),
-                            career_path_step_id=step.id,
-                            skill_id=skill_id,  # Links to skill being developed
-                            action_type=action_type,  # course/project/mentoring/etc.
-                            title=action_title,  # e.g., "Advanced Strategy Course"
+                    for action_title in competency.development_actions:
+                        action_rows.append(
+                            {
+                                "id": next(new_ids),
+                                "career_path_step_id": step_id,
+                                "skill_id": skill_id,  # Links to skill being developed
+                                # Parse action type from title (simple heuristic)
+                                # In production, the AI might provide structured action_type
+                                "action_type": _classify_action_type(action_title),
+                                "title": action_title,  # e.g., "Advanced Strategy Course"
+                            }
                         )
-                        actions.append(action)
-                
-                # Bulk insert actions
-                if actions:
-                    await self.uow.development_actions.create_bulk(actions)
-                    logger.info(
-                        f"Created {len(actions)} development actions for step {step.id}"
-                    )
-            
-            created_paths.append(created_path)
         
-        # Update AI log with success and commit
+        # Parents first: paths (refreshed for the response), then steps, then actions
         if created_paths:
-            created_log.career_path_id = created_paths[0].id
+            await self.uow.career_paths.create_bulk(created_paths)
+        await self.uow.career_path_steps.insert_many(step_rows)
+        await self.uow.development_actions.insert_many(action_rows)
+        logger.info(
+            f"Persisted {len(created_paths)} paths, {len(step_rows)} steps and "
+            f"{len(action_rows)} development actions"
+        )
         
-        created_log.status = "success"
-        created_log.response_payload = ai_response
-        created_log.latency_ms = latency_ms
-        await self.uow.ai_calls_log.update(created_log)
+        # Write AI log with success; inserted by the commit below
+        if created_paths:
+            ai_log.career_path_id = created_paths[0].id
+        
+        ai_log.status = "success"
+        ai_log.response_payload = ai_response
+        ai_log.latency_ms = latency_ms
+        self.uow.ai_calls_log.add(ai_log)
         
         # Commit transaction
-        # All changes (paths + steps + actions + log update) are atomic
+        # All changes (paths + steps + actions + log) are atomic
         # If anything fails, the entire operation is rolled back
         await self.uow.commit()
         
@@ -297,7 +388,23 @@ class CareerPathService:
             f"Successfully created {len(created_paths)} career paths for user {user_id}"
         )
         
-        return [CareerPathMapper.orm_to_response(path) for path in created_paths]
+        return CareerPathMapper.orms_to_responses(created_paths)
+
+    async def _get_role_catalog(self) -> _RoleCatalog:
+        """
+        Get the active role catalog as an AI payload fragment plus name indexes.
+        
+        Returns:
+            Shared, cached catalog: callers must not mutate it.
+        """
+        catalog = role_catalog_cache.get("active")
+        if catalog is None:
+            # Get all active roles as (id, name, job_family, seniority_level) rows
+            all_roles = await self.uow.roles.get_all_active_catalog(limit=1000)
+            # Up to 1000 dicts plus serialization: keep it off the event loop
+            catalog = await asyncio.to_thread(_build_role_catalog, all_roles)
+            role_catalog_cache.set("active", catalog)
+        return catalog
 
     async def get_paths_for_user(
         self,
@@ -323,7 +430,7 @@ class CareerPathService:
             status=status,
         )
         
-        return [CareerPathMapper.orm_to_response(path) for path in paths]
+        return CareerPathMapper.orms_to_responses(paths)
 
     async def get_path_detail(
         self,
@@ -354,7 +461,7 @@ class CareerPathService:
         if not path:
             raise NotFoundError(f"Career path {path_id} not found")
         
-        return CareerPathWithSteps.model_validate(path)
+        return CareerPathMapper.orm_to_response(path, include_steps=True)
 
     async def accept_path(
         self,
@@ -413,7 +520,8 @@ class CareerPathService:
             f"Career path {path_id} accepted by user {user_id}"
         )
         
-        return CareerPathMapper.orm_to_response(accepted_path)
+        # Status transitions just changed the row: validate the public result
+        return CareerPathResponse.model_validate(accepted_path)
 
     async def get_recommended_paths(
         self,
@@ -435,4 +543,4 @@ class CareerPathService:
             user_id=user_id,
         )
         
-        return [CareerPathMapper.orm_to_response(path) for path in paths]
+        return CareerPathMapper.orms_to_responses(paths)
@@ -1,6 +1,6 @@
 """DI dependencies for services and AI clients."""
 
-from typing import AsyncGenerator
+from functools import lru_cache
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -22,20 +22,32 @@ async def get_uow(session: AsyncSession = Depends(get_db)) -> UnitOfWork:
     return UnitOfWork(session)
 
 
-async def get_ai_skills_client() -> AsyncGenerator[AISkillsClient, None]:
-    client = AISkillsClient()
-    try:
-        yield client
-    finally:
-        await client.close()
+# AI clients are shared by the whole process (one connection pool each, kept
+# warm across requests) and closed on shutdown by close_ai_clients()
+@lru_cache(maxsize=1)
+def shared_ai_skills_client() -> AISkillsClient:
+    return AISkillsClient()
 
 
-async def get_ai_career_client() -> AsyncGenerator[AICareerClient, None]:
-    client = AICareerClient()
-    try:
-        yield client
-    finally:
-        await client.close()
+@lru_cache(maxsize=1)
+def shared_ai_career_client() -> AICareerClient:
+    return AICareerClient()
+
+
+async def close_ai_clients() -> None:
+    """Close the shared AI clients (if they were created)."""
+    for factory in (shared_ai_skills_client, shared_ai_career_client):
+        if factory.cache_info().currsize:
+            await factory().close()
+            factory.cache_clear()
+
+
+async def get_ai_skills_client() -> AISkillsClient:
+    return shared_ai_skills_client()
+
+
+async def get_ai_career_client() -> AICareerClient:
+    return shared_ai_career_client()
 
 
 async def get_evaluation_service(
@@ -4,6 +4,8 @@ Evaluation Cycle service for business logic orchestration.
 from typing import Optional
 from uuid import UUID
 
+from pydantic import ConfigDict, TypeAdapter
+
 from app.core.errors import NotFoundError, ValidationError
 from app.core.logging import get_logger
 from app.db.models.evaluation import EvaluationCycle
@@ -13,9 +15,19 @@ from app.schemas.evaluation.evaluation import (
     EvaluationCycleUpdate,
     EvaluationCycleResponse,
 )
+from app.utils.orm import apply_changes
 
 logger = get_logger(__name__)
 
+_CYCLE_STATUSES = ("draft", "active", "closed")
+_VALID_CYCLE_STATUSES: frozenset[str] = frozenset(_CYCLE_STATUSES)
+_VALID_CYCLE_STATUSES_STR = ", ".join(_CYCLE_STATUSES)
+
+# Built lazily, like the schemas themselves (see _DeferredSchema)
+_CYCLE_LIST_ADAPTER = TypeAdapter(
+    list[EvaluationCycleResponse], config=ConfigDict(defer_build=True)
+)
+
 
 class EvaluationCycleService:
     """Service for evaluation cycle operations."""
@@ -47,11 +59,10 @@ class EvaluationCycleService:
             )
 
         # Validate status
-        valid_statuses = {"draft", "active", "closed"}
-        if data.status not in valid_statuses:
+        if data.status not in _VALID_CYCLE_STATUSES:
             raise ValidationError(
-                message=f"Invalid status. Must be one of: {', '.join(valid_statuses)}",
-                details={"status": data.status, "valid_statuses": list(valid_statuses)},
+                message=f"Invalid status. Must be one of: {_VALID_CYCLE_STATUSES_STR}",
+                details={"status": data.status, "valid_statuses": list(_CYCLE_STATUSES)},
             )
 
         # Create cycle
@@ -108,14 +119,9 @@ class EvaluationCycleService:
         Returns:
             List of cycles
         """
-        if status == "active":
-            cycles = await self.uow.evaluation_cycles.get_active_cycles()
-        elif status:
-            cycles = await self.uow.evaluation_cycles.get_by_status(status)
-        else:
-            cycles = await self.uow.evaluation_cycles.get_all()
+        cycles = await self.uow.evaluation_cycles.list_cycles(status=status)
 
-        return [EvaluationCycleResponse.model_validate(c) for c in cycles]
+        return _CYCLE_LIST_ADAPTER.validate_python(cycles, from_attributes=True)
 
     async def update_cycle(
         self, cycle_id: UUID, data: EvaluationCycleUpdate
@@ -156,19 +162,16 @@ class EvaluationCycleService:
 
         # Validate status
         if "status" in update_dict:
-            valid_statuses = {"draft", "active", "closed"}
-            if update_dict["status"] not in valid_statuses:
+            if update_dict["status"] not in _VALID_CYCLE_STATUSES:
                 raise ValidationError(
-                    message=f"Invalid status. Must be one of: {', '.join(valid_statuses)}",
+                    message=f"Invalid status. Must be one of: {_VALID_CYCLE_STATUSES_STR}",
                     details={
                         "status": update_dict["status"],
-                        "valid_statuses": list(valid_statuses),
+                        "valid_statuses": list(_CYCLE_STATUSES),
                     },
                 )
 
-        # Apply updates
-        for key, value in update_dict.items():
-            setattr(cycle, key, value)
+        apply_changes(cycle, update_dict)
 
         updated_cycle = await self.uow.evaluation_cycles.update(cycle)
         await self.uow.session.commit()
@@ -199,14 +202,13 @@ class EvaluationCycleService:
                 details={"cycle_id": str(cycle_id)},
             )
 
-        # Check for associated evaluations
-        evaluations = await self.uow.evaluations.get_by_cycle(cycle_id)
-        if evaluations:
+        # Check for associated evaluations (count only needed for the error)
+        if await self.uow.evaluations.exists_for_cycle(cycle_id):
             raise ValidationError(
                 message="Cannot delete cycle with associated evaluations",
                 details={
                     "cycle_id": str(cycle_id),
-                    "evaluation_count": len(evaluations),
+                    "evaluation_count": await self.uow.evaluations.count_by_cycle(cycle_id),
                 },
             )
 
@@ -1,30 +1,49 @@
 """Evaluation service: create evaluations, aggregate scores and orchestrate AI flows."""
+import asyncio
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Optional, Sequence
 from uuid import UUID, uuid4
 
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from pydantic import ConfigDict, TypeAdapter
 
 from app.core.errors import NotFoundError, ValidationError, ConflictError
 from app.core.logging import get_logger
-from app.db.models import Evaluation, EvaluationCompetencyScore, UserSkillScore
+from app.db.models import Evaluation
 from app.db.unit_of_work import UnitOfWork
 from app.schemas.evaluation.evaluation import (
     EvaluationCreate,
     EvaluationResponse,
     EvaluationWithScores,
     UserSkillProfile,
+    UserSkillScoreResponse,
 )
 from app.schemas.mappers.evaluation_mapper import EvaluationMapper
 from app.domain.evaluation_logic import (
     is_cycle_complete_for_user,
-    aggregate_competency_scores,
+    aggregate_grouped_competency_scores,
 )
 from app.integrations.ai_skills_client import AISkillsClient
+from app.services.caches import skill_id_cache
+from app.utils.ids import uuid4_batch
 
 logger = get_logger(__name__)
 
+# Built lazily, like the schemas themselves (see _DeferredSchema)
+_SKILL_SCORE_LIST_ADAPTER = TypeAdapter(
+    list[UserSkillScoreResponse], config=ConfigDict(defer_build=True)
+)
+_EVALUATION_LIST_ADAPTER = TypeAdapter(
+    list[EvaluationResponse], config=ConfigDict(defer_build=True)
+)
+
+# Pages larger than this are converted off the event loop
+_THREADED_CONVERSION_MIN_ROWS = 32
+
+
+def _evaluations_to_responses(evaluations: Sequence[Evaluation]) -> list[EvaluationResponse]:
+    """Validate loaded evaluations (column attributes only, no lazy loads) into responses."""
+    return _EVALUATION_LIST_ADAPTER.validate_python(evaluations, from_attributes=True)
+
 
 class EvaluationService:
 
@@ -49,26 +68,14 @@ class EvaluationService:
             f"(relationship: {data.evaluator_relationship})"
         )
         
-        user = await self.uow.users.get_by_id(data.user_id)
+        await self._check_creation_context(data)
 
-        if not user:
-            raise NotFoundError(f"User {data.user_id} not found")
-        
-        evaluator = await self.uow.users.get_by_id(data.evaluator_id)
-
-        if not evaluator:
-            raise NotFoundError(f"Evaluator {data.evaluator_id} not found")
-        
-        cycle = await self.uow.evaluation_cycles.get_by_id(data.evaluation_cycle_id)
+        # Resolve competencies before writing anything so an unknown name
+        # fails without inserting the evaluation
+        skill_ids = await self._resolve_competencies(
+            {c.competency_name for c in data.competencies}
+        )
 
-        if not cycle:
-            raise NotFoundError(f"Evaluation cycle {data.evaluation_cycle_id} not found")
-        
-        if cycle.status != "active":
-            raise ValidationError(
-                f"Cannot create evaluation: cycle is not active (current status: {cycle.status})"
-            )
-        
         # Create evaluation record with status='submitted'
         evaluation = Evaluation(
             id=uuid4(),
@@ -82,29 +89,18 @@ class EvaluationService:
         
         created_evaluation = await self.uow.evaluations.create(evaluation)
         
-        # Create competency scores
-        competency_names = {c.competency_name for c in data.competencies}
-        skills = await self.uow.skills.get_by_names(list(competency_names))
-        name_to_skill = {s.name: s for s in skills}
-
-        missing = competency_names - set(name_to_skill.keys())
-        if missing:
-            raise ValidationError(
-                f"Invalid competencies: {sorted(missing)} not found in skills catalog"
-            )
-
-        competency_scores = []
-        for comp_data in data.competencies:
-            skill = name_to_skill[comp_data.competency_name]
-            comp_score = EvaluationCompetencyScore(
-                id=uuid4(),
-                evaluation_id=created_evaluation.id,
-                skill_id=skill.id,
-                score=comp_data.score,
-                comments=comp_data.comments,
-            )
-            competency_scores.append(comp_score)
-        await self.uow.competency_scores.create_bulk(competency_scores)
+        # All scores in one INSERT round-trip, committed with the evaluation
+        # (score ids are assigned by Postgres)
+        competency_scores = [
+            {
+                "evaluation_id": created_evaluation.id,
+                "skill_id": skill_ids[comp_data.competency_name],
+                "score": comp_data.score,
+                "comments": comp_data.comments,
+            }
+            for comp_data in data.competencies
+        ]
+        await self.uow.competency_scores.insert_many(competency_scores)
         await self.uow.commit()
         
         logger.info(
@@ -115,6 +111,72 @@ class EvaluationService:
         # Use mapper to convert ORM model to API response schema
         return EvaluationMapper.orm_to_response(created_evaluation)
 
+    async def create_evaluations_bulk(
+        self,
+        items: Sequence[EvaluationCreate],
+    ) -> list[EvaluationResponse]:
+        """Create several 360° evaluations and their competency scores at once.
+
+        Same checks as create_evaluation, all run before anything is written;
+        then the evaluations go in one batched INSERT, every score in one
+        executemany, and everything is committed together.
+
+        Raises NotFoundError/ValidationError on invalid input.
+        """
+        # Every user, evaluator and cycle of the batch is checked in one query
+        # (a 360° batch shares the user and cycle, so the ids dedupe well)
+        existing_user_ids, cycle_statuses = await self.uow.evaluations.get_creation_contexts(
+            {data.user_id for data in items} | {data.evaluator_id for data in items},
+            {data.evaluation_cycle_id for data in items},
+        )
+        for data in items:
+            self._validate_creation_context(
+                data,
+                user_exists=data.user_id in existing_user_ids,
+                evaluator_exists=data.evaluator_id in existing_user_ids,
+                cycle_status=cycle_statuses.get(data.evaluation_cycle_id),
+            )
+
+        skill_ids = await self._resolve_competencies(
+            {c.competency_name for data in items for c in data.competencies}
+        )
+
+        submitted_at = datetime.now(timezone.utc)
+        evaluations = [
+            Evaluation(
+                id=evaluation_id,
+                user_id=data.user_id,
+                evaluation_cycle_id=data.evaluation_cycle_id,
+                evaluator_id=data.evaluator_id,
+                evaluator_relationship=data.evaluator_relationship,
+                status="submitted",
+                submitted_at=submitted_at,
+            )
+            for evaluation_id, data in zip(uuid4_batch(len(items)), items)
+        ]
+        await self.uow.evaluations.create_many(evaluations)
+
+        competency_scores = [
+            {
+                "evaluation_id": evaluation.id,
+                "skill_id": skill_ids[comp_data.competency_name],
+                "score": comp_data.score,
+                "comments": comp_data.comments,
+            }
+            for evaluation, data in zip(evaluations, items)
+            for comp_data in data.competencies
+        ]
+        await self.uow.competency_scores.insert_many(competency_scores)
+        await self.uow.commit()
+
+        logger.info(
+            "Created %d evaluations with %d competency scores",
+            len(evaluations),
+            len(competency_scores),
+        )
+
+        return [EvaluationMapper.orm_to_response(evaluation) for evaluation in evaluations]
+
     async def get_evaluation(
         self,
         evaluation_id: UUID,
@@ -169,15 +231,25 @@ class EvaluationService:
             offset=offset,
         )
         
-        return [EvaluationMapper.orm_to_response(e) for e in evaluations]
+        # Pure CPU work: for large pages run it in a worker thread so other
+        # requests keep being served meanwhile
+        if len(evaluations) > _THREADED_CONVERSION_MIN_ROWS:
+            return await asyncio.to_thread(_evaluations_to_responses, evaluations)
+        return _evaluations_to_responses(evaluations)
 
 
     async def process_evaluation(self, evaluation_id: UUID) -> dict:
         """Process an evaluation: check completeness, aggregate scores and prepare for AI flows."""
         logger.info(f"Processing evaluation {evaluation_id}")
 
-        # Retrieve the evaluation
-        evaluation = await self.uow.evaluations.get_by_id(evaluation_id)
+        # Retrieve the evaluation and all evaluations for its user in its cycle
+        # in one query (scores are only needed, and aggregated in SQL, below)
+        user_evaluations_orm = await self.uow.evaluations.get_with_cycle_siblings(
+            evaluation_id
+        )
+        evaluation = next(
+            (e for e in user_evaluations_orm if e.id == evaluation_id), None
+        )
         if not evaluation:
             raise NotFoundError(f"Evaluation {evaluation_id} not found")
         
@@ -186,14 +258,10 @@ class EvaluationService:
         
         logger.info(f"Processing evaluation for user {user_id} in cycle {cycle_id}")
 
-        # Load all evaluations for user in cycle
-        user_evaluations_orm = await self.uow.evaluations.get_by_user_and_cycle(
-            user_id=user_id,
-            cycle_id=cycle_id,
-        )
-        
         # Convert ORM models to domain entities
-        user_evaluations = [EvaluationMapper.orm_to_entity(e) for e in user_evaluations_orm]
+        user_evaluations = EvaluationMapper.orms_to_entities(
+            user_evaluations_orm, include_scores=False
+        )
         
         # Check if cycle is complete using domain logic
         is_complete, reason = is_cycle_complete_for_user(user_evaluations)
@@ -230,78 +298,133 @@ class EvaluationService:
             "message": "Evaluation processed. Ready for Skills Assessment.",
         }
 
-    async def _aggregate_user_skill_scores(self, user_id: UUID, cycle_id: UUID) -> None:
-        """Aggregate evaluation scores into `user_skill_scores` (delete then insert)."""
-        logger.info(
-            f"Aggregating skill scores for user {user_id} in cycle {cycle_id}"
+    async def _check_creation_context(self, data: EvaluationCreate) -> None:
+        """Validate the user, evaluator and cycle of a new evaluation.
+
+        Raises NotFoundError if any of them is missing, ValidationError if the
+        cycle is not active.
+        """
+        # User, evaluator and cycle are checked in one query (one round-trip
+        # instead of three; only existence and the cycle status are needed)
+        user_exists, evaluator_exists, cycle_status = (
+            await self.uow.evaluations.get_creation_context(
+                data.user_id,
+                data.evaluator_id,
+                data.evaluation_cycle_id,
+            )
         )
+        self._validate_creation_context(
+            data,
+            user_exists=user_exists,
+            evaluator_exists=evaluator_exists,
+            cycle_status=cycle_status,
+        )
+
+    def _validate_creation_context(
+        self,
+        data: EvaluationCreate,
+        *,
+        user_exists: bool,
+        evaluator_exists: bool,
+        cycle_status: Optional[str],
+    ) -> None:
+        """Raise for a missing user, evaluator or cycle, or an inactive cycle."""
+        if not user_exists:
+            raise NotFoundError(f"User {data.user_id} not found")
+
+        if not evaluator_exists:
+            raise NotFoundError(f"Evaluator {data.evaluator_id} not found")
+
+        if cycle_status is None:
+            raise NotFoundError(f"Evaluation cycle {data.evaluation_cycle_id} not found")
         
-        # Use domain logic to aggregate competency scores
-        stmt = (
-            select(Evaluation)
-            .where(
-                Evaluation.user_id == user_id,
-                Evaluation.evaluation_cycle_id == cycle_id,
-                Evaluation.status == "submitted",
+        if cycle_status != "active":
+            raise ValidationError(
+                f"Cannot create evaluation: cycle is not active (current status: {cycle_status})"
             )
-            .options(
-                selectinload(Evaluation.competency_scores)
+
+    async def _resolve_competencies(self, competency_names: set[str]) -> dict[str, UUID]:
+        """Map competency names to skill ids, raising ValidationError for unknown names."""
+        # The dict doubles as the set of known names
+        skill_ids = await self._resolve_skill_ids(competency_names)
+        if len(skill_ids) != len(competency_names):
+            missing = competency_names.difference(skill_ids)
+            raise ValidationError(
+                f"Invalid competencies: {sorted(missing)} not found in skills catalog"
             )
-        )
-        # Use the UnitOfWork's session to execute the query
-        session = self.uow.session
+        return skill_ids
 
-        result = await session.execute(stmt)
-        evaluations_orm = result.scalars().unique().all()
-        
-        # Convert ORM models to domain entities
-        evaluations = [EvaluationMapper.orm_to_entity(e) for e in evaluations_orm]
+    async def _resolve_skill_ids(self, names: set[str]) -> dict[str, UUID]:
+        """Map competency names to active skill ids.
 
-        aggregated = aggregate_competency_scores(evaluations)
-        
-        # Step 3.2: Delete old user_skill_scores for this user/cycle
-        # This ensures we don't have stale data from previous aggregations
-        # Important: This is done in the same transaction as the insert below
-        # so we never have an inconsistent state
-        deleted_count = await self.uow.user_skill_scores.delete_by_user_and_cycle(
-            user_id=user_id,
-            cycle_id=cycle_id,
+        Names already resolved are served from ``skill_id_cache``; the rest
+        are fetched in one query and cached. Unknown names are left out of the
+        result (and never cached) so the caller can report them.
+        """
+        skill_ids: dict[str, UUID] = {}
+        unresolved: list[str] = []
+        for name in names:
+            skill_id = skill_id_cache.get(name)
+            if skill_id is None:
+                unresolved.append(name)
+            else:
+                skill_ids[name] = skill_id
+
+        if unresolved:
+            for skill in await self.uow.skills.get_by_names(unresolved):
+                skill_ids[skill.name] = skill.id
+                skill_id_cache.set(skill.name, skill.id)
+
+        return skill_ids
+
+    async def _aggregate_user_skill_scores(self, user_id: UUID, cycle_id: UUID) -> None:
+        """Aggregate evaluation scores into `user_skill_scores` (delete stale rows, then upsert)."""
+        logger.info(
+            f"Aggregating skill scores for user {user_id} in cycle {cycle_id}"
         )
         
-        logger.info(
-            f"Deleted {deleted_count} old skill scores for user {user_id}"
+        # Submitted scores come pre-grouped by (skill, relationship) from SQL;
+        # domain logic computes the per-skill statistics. With no submitted
+        # scores there is nothing to aggregate and the replace below reduces
+        # to the single DELETE that clears any stale rows
+        groups = await self.uow.competency_scores.get_grouped_submitted(
+            user_id, cycle_id
         )
+        aggregated = aggregate_grouped_competency_scores(groups) if groups else {}
         
-        # Step 3.3: Create new user_skill_scores
+        # Step 3.2: Build the user_skill_scores rows
         # Each skill gets one consolidated record with:
         # - score: overall average across all evaluator relationships (0.0-10.0)
         # - confidence: measure of how reliable the score is (0.0-1.0)
         # - raw_stats: JSONB with detailed breakdown by relationship
-        new_scores = []
-        
-        for skill_id, stats in aggregated.items():
-            user_skill_score = UserSkillScore(
-                id=uuid4(),
-                user_id=user_id,
-                evaluation_cycle_id=cycle_id,
-                skill_id=skill_id,
-                source="360_aggregated",  # Indicates this comes from 360° evaluations
-                score=stats["overall_avg"],  # Weighted average across all relationships
-                confidence=stats["confidence"],  # Range: 0.0-1.0, higher with more evaluations
-                raw_stats=stats["raw_stats"],  # JSONB: {self_avg, peer_avg, manager_avg, etc.}
-            )
-            new_scores.append(user_skill_score)
-        
-        # Step 3.4: Bulk insert new scores
-        # Bulk operation is more efficient than individual inserts
-        if new_scores:
-            await self.uow.user_skill_scores.create_bulk(new_scores)
-            logger.info(
-                f"Created {len(new_scores)} aggregated skill scores for user {user_id}"
-            )
+        rows = [
+            {
+                "user_id": user_id,
+                "evaluation_cycle_id": cycle_id,
+                "skill_id": skill_id,
+                "source": "360_aggregated",  # Indicates this comes from 360° evaluations
+                "score": stats["overall_avg"],  # Weighted average across all relationships
+                "confidence": stats["confidence"],  # Range: 0.0-1.0, higher with more evaluations
+                "raw_stats": stats["raw_stats"],  # JSONB: {self_avg, peer_avg, manager_avg, etc.}
+            }
+            for skill_id, stats in aggregated.items()
+        ]
+        
+        # Step 3.3: Replace the user's scores in one statement: delete rows this
+        # aggregation no longer produces (skills nobody rated anymore, other
+        # sources) and upsert the rest, so re-rated skills are updated in place
+        await self.uow.user_skill_scores.replace_aggregated(
+            user_id=user_id,
+            cycle_id=cycle_id,
+            source="360_aggregated",
+            rows=rows,
+        )
+        logger.info(
+            f"Replaced aggregated skill scores for user {user_id} with {len(rows)} rows"
+        )
         
-        # Transaction will be committed by caller
-        # This ensures atomicity: delete + insert happen together or not at all
+        # Transaction will be committed by caller, together with the rest of
+        # process_evaluation's work
 
     async def get_user_skill_profile(
         self,
@@ -322,10 +445,10 @@ class EvaluationService:
             )
         
         # Convert ORM models to Pydantic response schemas
-        from app.schemas.evaluation.evaluation import UserSkillScoreResponse
-        
         return UserSkillProfile(
             user_id=user_id,
             evaluation_cycle_id=cycle_id,
-            skill_scores=[UserSkillScoreResponse.model_validate(s) for s in scores],
+            skill_scores=_SKILL_SCORE_LIST_ADAPTER.validate_python(
+                scores, from_attributes=True
+            ),
         )
@@ -4,14 +4,19 @@ Role service for business logic orchestration.
 from typing import Optional
 from uuid import UUID
 
+from pydantic import TypeAdapter
+
 from app.core.errors import NotFoundError, ValidationError, ConflictError
 from app.core.logging import get_logger
-from app.db.models.core import Role
 from app.db.unit_of_work import UnitOfWork
 from app.schemas.core.role import RoleCreate, RoleUpdate, RoleResponse
+from app.services.caches import role_catalog_cache
+from app.utils.orm import apply_changes
 
 logger = get_logger(__name__)
 
+_ROLE_LIST_ADAPTER = TypeAdapter(list[RoleResponse])
+
 
 class RoleService:
     """Service for role operations."""
@@ -33,30 +38,30 @@ class RoleService:
         Raises:
             ConflictError: If role name already exists
         """
-        # Check name uniqueness
-        existing_role = await self.uow.roles.get_by_name(data.name)
-        if existing_role:
+        # Create role; the name uniqueness check is part of the INSERT
+        created_role = await self.uow.roles.create_if_unique(
+            {
+                "name": data.name,
+                "job_family": data.job_family,
+                "seniority_level": data.seniority_level,
+                "description": data.description,
+                "is_active": data.is_active,
+            }
+        )
+        if created_role is None:
             raise ConflictError(
                 message="Role with this name already exists",
                 details={"name": data.name},
             )
 
-        # Create role
-        role = Role(
-            name=data.name,
-            job_family=data.job_family,
-            seniority_level=data.seniority_level,
-            description=data.description,
-            is_active=data.is_active,
-        )
-
-        created_role = await self.uow.roles.create(role)
         await self.uow.session.commit()
+        role_catalog_cache.invalidate()
 
         logger.info(
-            f"Created role: {created_role.name}",
+            "Created role: %s",
+            created_role.name,
             extra={
-                "role_id": str(created_role.id),
+                "role_id": created_role.id,
                 "job_family": created_role.job_family,
                 "seniority_level": created_role.seniority_level,
             },
@@ -105,15 +110,14 @@ class RoleService:
         Returns:
             List of roles
         """
-        # Apply specific filters
-        if job_family:
-            roles = await self.uow.roles.get_by_job_family(job_family, active_only=active_only)
-        elif active_only:
-            roles = await self.uow.roles.get_all_active(limit=limit, offset=offset)
-        else:
-            roles = await self.uow.roles.get_all(limit=limit, offset=offset)
+        roles = await self.uow.roles.list_roles(
+            active_only=active_only,
+            job_family=job_family,
+            limit=limit,
+            offset=offset,
+        )
 
-        return [RoleResponse.model_validate(r) for r in roles]
+        return _ROLE_LIST_ADAPTER.validate_python(roles, from_attributes=True)
 
     async def update_role(self, role_id: UUID, data: RoleUpdate) -> RoleResponse:
         """
@@ -141,25 +145,25 @@ class RoleService:
         # Update fields
         update_dict = data.model_dump(exclude_unset=True)
 
-        # Validate name uniqueness
         if "name" in update_dict and update_dict["name"] != role.name:
-            existing_role = await self.uow.roles.get_by_name(update_dict["name"])
-            if existing_role:
+            # Rename: uniqueness check and update in one conditional UPDATE
+            updated_role = await self.uow.roles.update_if_name_unique(role_id, update_dict)
+            if updated_role is None:
                 raise ConflictError(
                     message="Role with this name already exists",
                     details={"name": update_dict["name"]},
                 )
+        else:
+            apply_changes(role, update_dict)
 
-        # Apply updates
-        for key, value in update_dict.items():
-            setattr(role, key, value)
-
-        updated_role = await self.uow.roles.update(role)
+            updated_role = await self.uow.roles.update(role)
         await self.uow.session.commit()
+        role_catalog_cache.invalidate()
 
         logger.info(
-            f"Updated role: {updated_role.name}",
-            extra={"role_id": str(role_id), "updated_fields": list(update_dict.keys())},
+            "Updated role: %s",
+            updated_role.name,
+            extra={"role_id": role_id, "updated_fields": list(update_dict)},
         )
 
         return RoleResponse.model_validate(updated_role)
@@ -187,10 +191,12 @@ class RoleService:
         role.is_active = False
         updated_role = await self.uow.roles.update(role)
         await self.uow.session.commit()
+        role_catalog_cache.invalidate()
 
         logger.info(
-            f"Deactivated role: {updated_role.name}",
-            extra={"role_id": str(role_id)},
+            "Deactivated role: %s",
+            updated_role.name,
+            extra={"role_id": role_id},
         )
 
         return RoleResponse.model_validate(updated_role)
@@ -4,14 +4,21 @@ Skill service for business logic orchestration.
 from typing import Optional
 from uuid import UUID
 
+from pydantic import TypeAdapter
+
 from app.core.errors import NotFoundError, ValidationError, ConflictError
 from app.core.logging import get_logger
-from app.db.models.core import Skill
 from app.db.unit_of_work import UnitOfWork
 from app.schemas.core.skill import SkillCreate, SkillUpdate, SkillResponse
+from app.services.caches import skill_id_cache
 
 logger = get_logger(__name__)
 
+_SKILL_LIST_ADAPTER = TypeAdapter(list[SkillResponse])
+
+# Offsets past this scan and discard that many rows; keyset (after_id) should be used
+_DEEP_OFFSET_WARNING = 1000
+
 
 class SkillService:
     """Service for skill operations."""
@@ -33,31 +40,31 @@ class SkillService:
         Raises:
             ConflictError: If skill name already exists
         """
-        # Check name uniqueness
-        existing_skill = await self.uow.skills.get_by_name(data.name)
-        if existing_skill:
+        # Create skill; the name uniqueness check is part of the INSERT
+        created_skill = await self.uow.skills.create_if_unique(
+            {
+                "name": data.name,
+                "category": data.category,
+                "description": data.description,
+                "behavioral_indicators": data.behavioral_indicators,
+                "is_global": data.is_global,
+                "is_active": data.is_active,
+            }
+        )
+        if created_skill is None:
             raise ConflictError(
                 message="Skill with this name already exists",
                 details={"name": data.name},
             )
 
-        # Create skill
-        skill = Skill(
-            name=data.name,
-            category=data.category,
-            description=data.description,
-            behavioral_indicators=data.behavioral_indicators,
-            is_global=data.is_global,
-            is_active=data.is_active,
-        )
-
-        created_skill = await self.uow.skills.create(skill)
         await self.uow.session.commit()
+        skill_id_cache.invalidate()
 
         logger.info(
-            f"Created skill: {created_skill.name}",
+            "Created skill: %s",
+            created_skill.name,
             extra={
-                "skill_id": str(created_skill.id),
+                "skill_id": created_skill.id,
                 "category": created_skill.category,
             },
         )
@@ -93,6 +100,7 @@ class SkillService:
         global_only: bool = False,
         limit: int = 100,
         offset: int = 0,
+        after_id: Optional[UUID] = None,
     ) -> list[SkillResponse]:
         """
         List skills with optional filters.
@@ -103,21 +111,42 @@ class SkillService:
             global_only: Only return global skills
             limit: Maximum results
             offset: Pagination offset
+            after_id: Keyset cursor (id of the last item of the previous page)
 
         Returns:
             List of skills
+
+        Raises:
+            ValidationError: If after_id is combined with category or global_only
         """
+        # Filtered listings are not paginated: a cursor would be ignored and
+        # silently return the first page again
+        if after_id and (category or global_only):
+            raise ValidationError(
+                message="after_id cannot be combined with category or global_only",
+                details={"after_id": str(after_id)},
+            )
+
+        if offset > _DEEP_OFFSET_WARNING:
+            logger.warning(
+                "Deep offset pagination on skills (offset=%d); use after_id instead", offset
+            )
+
         # Apply specific filters
         if category:
             skills = await self.uow.skills.get_by_category(category, active_only=active_only)
         elif global_only:
             skills = await self.uow.skills.get_global_skills(active_only=active_only)
         elif active_only:
-            skills = await self.uow.skills.get_all_active(limit=limit, offset=offset)
+            skills = await self.uow.skills.get_all_active(
+                limit=limit, offset=offset, after_id=after_id
+            )
         else:
-            skills = await self.uow.skills.get_all(limit=limit, offset=offset)
+            skills = await self.uow.skills.get_all(
+                limit=limit, offset=offset, after_id=after_id
+            )
 
-        return [SkillResponse.model_validate(s) for s in skills]
+        return _SKILL_LIST_ADAPTER.validate_python(skills, from_attributes=True)
 
     async def update_skill(self, skill_id: UUID, data: SkillUpdate) -> SkillResponse:
         """
@@ -134,36 +163,31 @@ class SkillService:
             NotFoundError: If skill not found
             ConflictError: If name already exists
         """
-        # Get existing skill
-        skill = await self.uow.skills.get_by_id(skill_id)
-        if not skill:
-            raise NotFoundError(
-                message="Skill not found",
-                details={"skill_id": str(skill_id)},
-            )
-
-        # Update fields
         update_dict = data.model_dump(exclude_unset=True)
-
-        # Validate name uniqueness
-        if "name" in update_dict and update_dict["name"] != skill.name:
-            existing_skill = await self.uow.skills.get_by_name(update_dict["name"])
-            if existing_skill:
-                raise ConflictError(
-                    message="Skill with this name already exists",
-                    details={"name": update_dict["name"]},
+        if not update_dict:
+            return await self.get_skill(skill_id)
+
+        # Existence, name uniqueness and the write in one conditional UPDATE
+        updated_skill = await self.uow.skills.update_values(skill_id, update_dict)
+        if updated_skill is None:
+            # Failure path only: tell a missing skill from a taken name
+            if await self.uow.skills.get_by_id(skill_id) is None:
+                raise NotFoundError(
+                    message="Skill not found",
+                    details={"skill_id": str(skill_id)},
                 )
+            raise ConflictError(
+                message="Skill with this name already exists",
+                details={"name": update_dict["name"]},
+            )
 
-        # Apply updates
-        for key, value in update_dict.items():
-            setattr(skill, key, value)
-
-        updated_skill = await self.uow.skills.update(skill)
         await self.uow.session.commit()
+        skill_id_cache.invalidate()
 
         logger.info(
-            f"Updated skill: {updated_skill.name}",
-            extra={"skill_id": str(skill_id), "updated_fields": list(update_dict.keys())},
+            "Updated skill: %s",
+            updated_skill.name,
+            extra={"skill_id": skill_id, "updated_fields": list(update_dict)},
         )
 
         return SkillResponse.model_validate(updated_skill)
@@ -191,10 +215,12 @@ class SkillService:
         skill.is_active = False
         updated_skill = await self.uow.skills.update(skill)
         await self.uow.session.commit()
+        skill_id_cache.invalidate()
 
         logger.info(
-            f"Deactivated skill: {updated_skill.name}",
-            extra={"skill_id": str(skill_id)},
+            "Deactivated skill: %s",
+            updated_skill.name,
+            extra={"skill_id": skill_id},
         )
 
         return SkillResponse.model_validate(updated_skill)
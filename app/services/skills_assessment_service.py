@@ -7,13 +7,14 @@ This service orchestrates:
 - Persisting assessment results and items
 - Querying latest assessment (Flow 3)
 """
+import time
 from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID, uuid4
 
 from app.core.errors import NotFoundError, ExternalServiceError as ServiceError
 from app.core.logging import get_logger
-from app.db.models import SkillsAssessment, SkillsAssessmentItem, AICallsLog
+from app.db.models import SkillsAssessment, AICallsLog
 from app.db.unit_of_work import UnitOfWork
 from app.schemas.skills_assessment.skills_assessment import (
     SkillsAssessmentResponse,
@@ -21,10 +22,76 @@ from app.schemas.skills_assessment.skills_assessment import (
 )
 from app.schemas.mappers.skill_profile_mapper import SkillProfileMapper
 from app.integrations.ai_skills_client import AISkillsClient
+from app.utils.ids import uuid4_batch
 
 logger = get_logger(__name__)
 
 
+# Columns every `skills_assessment_items` row carries, so the whole batch
+# has the same keys and goes out as one executemany
+_ITEM_DEFAULTS: dict = {
+    "label": None,
+    "score": None,
+    "gap_score": None,
+    "priority": None,
+    "readiness_percentage": None,
+    "evidence": None,
+    "item_metadata": None,
+}
+
+
+def _strength_fields(strength: dict) -> dict:
+    return {
+        "item_type": "strength",
+        "label": strength.get("skill"),
+        "score": strength.get("score"),
+        "evidence": strength.get("evidence"),
+        "item_metadata": {
+            "proficiency_level": strength.get("proficiency_level"),
+        },
+    }
+
+
+def _growth_area_fields(growth_area: dict) -> dict:
+    return {
+        "item_type": "growth_area",
+        "label": growth_area.get("skill"),
+        "gap_score": growth_area.get("gap_score"),
+        "priority": growth_area.get("priority"),
+        "evidence": (
+            f"Current: {growth_area.get('current_level')}, "
+            f"Target: {growth_area.get('target_level')}"
+        ),
+        "item_metadata": {
+            "current_level": growth_area.get("current_level"),
+            "target_level": growth_area.get("target_level"),
+        },
+    }
+
+
+def _hidden_talent_fields(talent: dict) -> dict:
+    return {
+        "item_type": "hidden_talent",
+        "label": talent.get("skill"),
+        "score": talent.get("potential_score"),
+        "evidence": talent.get("evidence"),
+    }
+
+
+def _role_readiness_fields(readiness: dict) -> dict:
+    # The AI reports 0–100; items store readiness as a 0–1 fraction
+    readiness_pct = readiness.get("readiness_percentage")
+    normalized = float(readiness_pct) / 100.0 if readiness_pct is not None else None
+    return {
+        "item_type": "role_readiness",
+        "label": readiness.get("role"),
+        "readiness_percentage": normalized,
+        "item_metadata": {
+            "missing_competencies": readiness.get("missing_competencies", []),
+        },
+    }
+
+
 class SkillsAssessmentService:
     """
     Service for AI Skills Assessment operations.
@@ -61,10 +128,10 @@ class SkillsAssessmentService:
         Process:
         1. Retrieve user_skill_scores for user in cycle
         2. Build evaluation_data payload for AI
-        3. Create AI call log entry
+        3. Prepare AI call log entry
         4. Call AI service
         5. Persist skills_assessments and skills_assessment_items
-        6. Update AI call log with result
+        6. Write AI call log with result (same commit as step 5)
         
         Args:
             user_id: User UUID
@@ -78,14 +145,16 @@ class SkillsAssessmentService:
             ServiceError: If AI service fails
         """
         logger.info(
-            f"Generating skills assessment for user {user_id} in cycle {cycle_id}"
+            "Generating skills assessment for user %s in cycle %s", user_id, cycle_id
         )
         
         # Step 4.1: Verify user exists
         # We need a valid user before proceeding with assessment generation
-        user = await self.uow.users.get_by_id(user_id)
-        if not user:
+        # (its role comes in the same query for current_position below)
+        user_with_role = await self.uow.users.get_by_id_with_role_name(user_id)
+        if not user_with_role:
             raise NotFoundError(f"User {user_id} not found")
+        _, role_name = user_with_role
         
         # Step 4.2: Retrieve user_skill_scores (aggregated from 360°)
         # These scores were created by the evaluation aggregation step
@@ -115,36 +184,29 @@ class SkillsAssessmentService:
         # - direct_report_scores: List of individual direct report scores
         # This rich structure allows the AI to detect patterns and discrepancies
         # Batch-resolve all skill names by IDs to avoid N queries
-        competencies_payload = []
         skill_ids = [s.skill_id for s in skill_profile.skills]
-        skills = await self.uow.skills.get_by_ids(skill_ids)
-        id_to_skill = {s.id: s for s in skills}
+        id_to_name = await self.uow.skills.get_names_by_ids(skill_ids)
 
+        if len(id_to_name) < len(skill_ids):
+            for missing_id in set(skill_ids).difference(id_to_name):
+                logger.warning("Skill %s not found, skipping", missing_id)
 
-        for user_skill in skill_profile.skills:
-            skill = id_to_skill.get(user_skill.skill_id)
-            if not skill:
-                logger.warning(f"Skill {user_skill.skill_id} not found, skipping")
-                continue
-
-            raw_stats = user_skill.raw_stats
-            competency_data = {
-                "name": skill.name,
-                "self_score": raw_stats.get("self_avg"),
+        competencies_payload = [
+            {
+                "name": id_to_name[user_skill.skill_id],
+                "self_score": (raw_stats := user_skill.raw_stats).get("self_avg"),
                 "peer_scores": raw_stats.get("peer_scores", []),
                 "manager_score": raw_stats.get("manager_avg"),
                 "direct_report_scores": raw_stats.get("direct_report_scores", []),
             }
-            competencies_payload.append(competency_data)
+            for user_skill in skill_profile.skills
+            if user_skill.skill_id in id_to_name
+        ]
         
         # Step 4.4: Get user position and experience
         # The AI uses this context to provide more relevant assessments
         # Derive current_position from user's role
-        current_position = "Unknown"
-        if user.role_id:
-            role = await self.uow.roles.get_by_id(user.role_id)
-            if role:
-                current_position = role.name
+        current_position = role_name or "Unknown"
         
         # Calculate years_experience (placeholder logic)
         # In production, this could be calculated from hire_date or employment history
@@ -164,12 +226,12 @@ class SkillsAssessmentService:
         }
         
         logger.info(
-            f"Built assessment payload with {len(competencies_payload)} competencies"
+            "Built assessment payload with %d competencies", len(competencies_payload)
         )
         
-        # Step 5.1: Create AI call log entry (before calling service)
-        # This provides full traceability of AI service calls
-        # Useful for debugging, monitoring, and cost tracking
+        # Step 5.1: AI call log entry (traceability, debugging, cost tracking):
+        # inserted once, with its final status, after the call (no pre-call
+        # commit and no later UPDATE of the row)
         ai_log = AICallsLog(
             service_name="skills_assessment",
             user_id=user_id,
@@ -177,16 +239,13 @@ class SkillsAssessmentService:
             skills_assessment_id=None,
             career_path_id=None,
             request_payload=request_payload,
-            status="pending",  # estado inicial
         )
-        created_log = await self.uow.ai_calls_log.create(ai_log)
-        await self.uow.commit()
         
         # Step 5.2: Call AI Skills Assessment service
         # This is the external ML service that analyzes the 360° feedback
         # It returns insights on strengths, growth areas, hidden talents, and role readiness
         try:
-            start_time = datetime.now(timezone.utc)
+            start_time = time.perf_counter()
             
             # Call the AI service client (handles HTTP, retries, circuit breaker)
             ai_response = await self.ai_skills_client.assess_skills(
@@ -196,20 +255,19 @@ class SkillsAssessmentService:
                 years_experience=years_experience,
             )
             
-            end_time = datetime.now(timezone.utc)
-            latency_ms = int((end_time - start_time).total_seconds() * 1000) # aproximado en ms
+            latency_ms = int((time.perf_counter() - start_time) * 1000)
             
             logger.info(
-                f"AI Skills Assessment succeeded (latency: {latency_ms}ms)"
+                "AI Skills Assessment succeeded (latency: %dms)", latency_ms
             )
             
         except Exception as e:
-            logger.error(f"AI Skills Assessment failed: {e}")
+            logger.error("AI Skills Assessment failed: %s", e)
 
-            # Update AI log with error details
-            created_log.status = "error"
-            created_log.error_message = str(e)
-            await self.uow.ai_calls_log.update(created_log)
+            # Write AI log with error details
+            ai_log.status = "error"
+            ai_log.error_message = str(e)
+            self.uow.ai_calls_log.add(ai_log)
             await self.uow.commit()
 
             raise ServiceError(
@@ -241,101 +299,48 @@ class SkillsAssessmentService:
         # - hidden_talents: Skills with potential identified from qualitative feedback
         # - readiness_for_roles: Assessment of fit for different career paths
         # We normalize these into skills_assessment_items for consistent querying
-        items: list[SkillsAssessmentItem] = []
-        
-        
         skills_profile = ai_response.get("skills_profile", {})
+        sections = (
+            (skills_profile.get("strengths", []), _strength_fields),
+            (skills_profile.get("growth_areas", []), _growth_area_fields),
+            (skills_profile.get("hidden_talents", []), _hidden_talent_fields),
+            (ai_response.get("readiness_for_roles", []), _role_readiness_fields),
+        )
 
-        # Strengths
-        for strength in skills_profile.get("strengths", []):
-            item = SkillsAssessmentItem(
-                id=uuid4(),
-                skills_assessment_id=created_assessment.id,
-                item_type="strength",
-                label=strength.get("skill"),
-                score=strength.get("score"),
-                evidence=strength.get("evidence"),
-                metadata={
-                    "proficiency_level": strength.get("proficiency_level"),
-                },
-            )
-            items.append(item)
-
-        # Growth areas
-        for growth_area in skills_profile.get("growth_areas", []):
-            item = SkillsAssessmentItem(
-                id=uuid4(),
-                skills_assessment_id=created_assessment.id,
-                item_type="growth_area",
-                label=growth_area.get("skill"),
-                gap_score=growth_area.get("gap_score"),
-                priority=growth_area.get("priority"),
-                evidence=(
-                    f"Current: {growth_area.get('current_level')}, "
-                    f"Target: {growth_area.get('target_level')}"
-                ),
-                metadata={
-                    "current_level": growth_area.get("current_level"),
-                    "target_level": growth_area.get("target_level"),
-                },
-            )
-            items.append(item)
-
-        # Hidden talents
-        for talent in skills_profile.get("hidden_talents", []):
-            item = SkillsAssessmentItem(
-                id=uuid4(),
-                skills_assessment_id=created_assessment.id,
-                item_type="hidden_talent",
-                label=talent.get("skill"),
-                score=talent.get("potential_score"),
-                evidence=talent.get("evidence"),
-            )
-            items.append(item)
-
-        # Role readiness
-        for readiness in ai_response.get("readiness_for_roles", []):
-            readiness_pct = readiness.get("readiness_percentage")
-            normalized = (
-                float(readiness_pct) / 1.0 if readiness_pct is not None else None
-            )
-            # O si quieres 0–1: float(readiness_pct)/100.0
-            normalized = (
-                float(readiness_pct) / 100.0 if readiness_pct is not None else None
-            )
-
-            item = SkillsAssessmentItem(
-                id=uuid4(),
-                skills_assessment_id=created_assessment.id,
-                item_type="role_readiness",
-                label=readiness.get("role"),
-                readiness_percentage=normalized,
-                evidence=None,
-                metadata={
-                    "missing_competencies": readiness.get(
-                        "missing_competencies", []
-                    ),
-                },
-            )
-            items.append(item)
+        # One pass over all sections; ids come from a single batch (one
+        # urandom read instead of one per item)
+        new_ids = iter(uuid4_batch(sum(len(entries) for entries, _ in sections)))
+        items: list[dict] = [
+            {
+                **_ITEM_DEFAULTS,
+                **fields(entry),
+                "id": next(new_ids),
+                "skills_assessment_id": created_assessment.id,
+            }
+            for entries, fields in sections
+            for entry in entries
+        ]
 
         if items:
-            await self.uow.skills_assessment_items.create_bulk(items)
+            await self.uow.skills_assessment_items.insert_many(items)
             logger.info(
-                f"Created {len(items)} assessment items for assessment {created_assessment.id}"
+                "Created %d assessment items for assessment %s",
+                len(items),
+                created_assessment.id,
             )
 
-        # Step 5.5: Update AI call log with success
-        created_log.status = "success"
-        created_log.skills_assessment_id = created_assessment.id
-        created_log.response_payload = ai_response
-        created_log.latency_ms = latency_ms
-        await self.uow.ai_calls_log.update(created_log)
+        # Step 5.5: Write AI call log with success; inserted by the commit
+        # below, atomically with the assessment and its items
+        ai_log.status = "success"
+        ai_log.skills_assessment_id = created_assessment.id
+        ai_log.response_payload = ai_response
+        ai_log.latency_ms = latency_ms
+        self.uow.ai_calls_log.add(ai_log)
 
         await self.uow.commit()
 
         logger.info(
-            f"Successfully created skills assessment {created_assessment.id}"
+            "Successfully created skills assessment %s", created_assessment.id
         )
 
         return SkillsAssessmentResponse.model_validate(created_assessment)
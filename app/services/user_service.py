@@ -4,9 +4,10 @@ User service for business logic orchestration.
 from typing import Optional
 from uuid import UUID
 
+from pydantic import TypeAdapter
+
 from app.core.errors import NotFoundError, ValidationError, ConflictError
 from app.core.logging import get_logger
-from app.db.models.core import User
 from app.db.unit_of_work import UnitOfWork
 from app.schemas.core.user import (
     UserCreate,
@@ -16,6 +17,11 @@ from app.schemas.core.user import (
 
 logger = get_logger(__name__)
 
+_USER_LIST_ADAPTER = TypeAdapter(list[UserResponse])
+
+# Offsets past this scan and discard that many rows; keyset (after_id) should be used
+_DEEP_OFFSET_WARNING = 1000
+
 
 class UserService:
     """Service for user operations."""
@@ -39,53 +45,51 @@ class UserService:
             NotFoundError: If role_id or manager_id not found
             ValidationError: If validation fails
         """
-        # Check email uniqueness
-        existing_user = await self.uow.users.get_by_email(data.email)
-        if existing_user:
-            raise ConflictError(
-                message="User with this email already exists",
-                details={"email": data.email},
+        # Validate role and manager together in one query
+        if data.role_id or data.manager_id:
+            role_exists, manager_is_active = await self.uow.users.get_reference_context(
+                data.role_id, data.manager_id
             )
-
-        # Validate role exists
-        if data.role_id:
-            role = await self.uow.roles.get_by_id(data.role_id)
-            if not role:
+            if data.role_id and not role_exists:
                 raise NotFoundError(
                     message="Role not found",
                     details={"role_id": str(data.role_id)},
                 )
-
-        # Validate manager exists
-        if data.manager_id:
-            manager = await self.uow.users.get_by_id(data.manager_id)
-            if not manager:
-                raise NotFoundError(
-                    message="Manager not found",
-                    details={"manager_id": str(data.manager_id)},
-                )
-            if not manager.is_active:
-                raise ValidationError(
-                    message="Manager must be an active user",
-                    details={"manager_id": str(data.manager_id)},
-                )
-
-        # Create user
-        user = User(
-            email=data.email,
-            full_name=data.full_name,
-            role_id=data.role_id,
-            manager_id=data.manager_id,
-            hire_date=data.hire_date,
-            is_active=data.is_active,
+            if data.manager_id:
+                if manager_is_active is None:
+                    raise NotFoundError(
+                        message="Manager not found",
+                        details={"manager_id": str(data.manager_id)},
+                    )
+                if not manager_is_active:
+                    raise ValidationError(
+                        message="Manager must be an active user",
+                        details={"manager_id": str(data.manager_id)},
+                    )
+
+        # Create user; the email uniqueness check is part of the INSERT
+        created_user = await self.uow.users.create_if_unique(
+            {
+                "email": data.email,
+                "full_name": data.full_name,
+                "role_id": data.role_id,
+                "manager_id": data.manager_id,
+                "hire_date": data.hire_date,
+                "is_active": data.is_active,
+            }
         )
+        if created_user is None:
+            raise ConflictError(
+                message="User with this email already exists",
+                details={"email": data.email},
+            )
 
-        created_user = await self.uow.users.create(user)
         await self.uow.session.commit()
 
         logger.info(
-            f"Created user: {created_user.full_name}",
-            extra={"user_id": str(created_user.id), "email": created_user.email},
+            "Created user: %s",
+            created_user.full_name,
+            extra={"user_id": created_user.id, "email": created_user.email},
         )
 
         return UserResponse.model_validate(created_user)
@@ -119,6 +123,7 @@ class UserService:
         manager_id: Optional[UUID] = None,
         limit: int = 100,
         offset: int = 0,
+        after_id: Optional[UUID] = None,
     ) -> list[UserResponse]:
         """
         List users with optional filters.
@@ -129,10 +134,27 @@ class UserService:
             manager_id: Filter by manager (direct reports)
             limit: Maximum results
             offset: Pagination offset
+            after_id: Keyset cursor (id of the last item of the previous page)
 
         Returns:
             List of users
+
+        Raises:
+            ValidationError: If after_id is combined with role_id or manager_id
         """
+        # Filtered listings are not paginated: a cursor would be ignored and
+        # silently return the first page again
+        if after_id and (role_id or manager_id):
+            raise ValidationError(
+                message="after_id cannot be combined with role_id or manager_id",
+                details={"after_id": str(after_id)},
+            )
+
+        if offset > _DEEP_OFFSET_WARNING:
+            logger.warning(
+                "Deep offset pagination on users (offset=%d); use after_id instead", offset
+            )
+
         # Apply specific filters
         if role_id:
             users = await self.uow.users.get_by_role_id(role_id, active_only=active_only)
@@ -141,11 +163,15 @@ class UserService:
                 manager_id, active_only=active_only
             )
         elif active_only:
-            users = await self.uow.users.get_active_users(limit=limit, offset=offset)
+            users = await self.uow.users.get_active_users(
+                limit=limit, offset=offset, after_id=after_id
+            )
         else:
-            users = await self.uow.users.get_all(limit=limit, offset=offset)
+            users = await self.uow.users.get_all(
+                limit=limit, offset=offset, after_id=after_id
+            )
 
-        return [UserResponse.model_validate(u) for u in users]
+        return _USER_LIST_ADAPTER.validate_python(users, from_attributes=True)
 
     async def update_user(self, user_id: UUID, data: UserUpdate) -> UserResponse:
         """
@@ -163,69 +189,73 @@ class UserService:
             ConflictError: If email already exists
             ValidationError: If validation fails
         """
-        # Get existing user
-        user = await self.uow.users.get_by_id(user_id)
-        if not user:
-            raise NotFoundError(
-                message="User not found",
+        update_dict = data.model_dump(exclude_unset=True)
+        if not update_dict:
+            return await self.get_user(user_id)
+
+        role_id = update_dict.get("role_id")
+        manager_id = update_dict.get("manager_id")
+
+        # Prevent self-reference and validate role and manager together in
+        # one query; a missing user is reported before any of these
+        reference_error = None
+        if manager_id == user_id:
+            reference_error = ValidationError(
+                message="User cannot be their own manager",
                 details={"user_id": str(user_id)},
             )
-
-        # Update fields
-        update_dict = data.model_dump(exclude_unset=True)
-
-        # Validate email uniqueness
-        if "email" in update_dict and update_dict["email"] != user.email:
-            existing_user = await self.uow.users.get_by_email(update_dict["email"])
-            if existing_user:
-                raise ConflictError(
-                    message="User with this email already exists",
-                    details={"email": update_dict["email"]},
-                )
-
-        # Validate role exists
-        if "role_id" in update_dict and update_dict["role_id"]:
-            role = await self.uow.roles.get_by_id(update_dict["role_id"])
-            if not role:
-                raise NotFoundError(
+        elif role_id or manager_id:
+            role_exists, manager_is_active = await self.uow.users.get_reference_context(
+                role_id, manager_id
+            )
+            if role_id and not role_exists:
+                reference_error = NotFoundError(
                     message="Role not found",
-                    details={"role_id": str(update_dict["role_id"])},
-                )
-
-        # Validate manager exists and prevent self-reference
-        if "manager_id" in update_dict and update_dict["manager_id"]:
-            if update_dict["manager_id"] == user_id:
-                raise ValidationError(
-                    message="User cannot be their own manager",
-                    details={"user_id": str(user_id)},
+                    details={"role_id": str(role_id)},
                 )
-
-            manager = await self.uow.users.get_by_id(update_dict["manager_id"])
-            if not manager:
-                raise NotFoundError(
+            elif manager_id and manager_is_active is None:
+                reference_error = NotFoundError(
                     message="Manager not found",
-                    details={"manager_id": str(update_dict["manager_id"])},
+                    details={"manager_id": str(manager_id)},
                 )
-            if not manager.is_active:
-                raise ValidationError(
+            elif manager_id and not manager_is_active:
+                reference_error = ValidationError(
                     message="Manager must be an active user",
-                    details={"manager_id": str(update_dict["manager_id"])},
+                    details={"manager_id": str(manager_id)},
                 )
+        if reference_error is not None:
+            # Failure path only: one lookup to tell a missing user apart
+            await self._ensure_user_exists(user_id)
+            raise reference_error
+
+        # Existence, email uniqueness and the write in one conditional UPDATE
+        updated_user = await self.uow.users.update_values(user_id, update_dict)
+        if updated_user is None:
+            # Failure path only: tell a missing user from a taken email
+            await self._ensure_user_exists(user_id)
+            raise ConflictError(
+                message="User with this email already exists",
+                details={"email": update_dict["email"]},
+            )
 
-        # Apply updates
-        for key, value in update_dict.items():
-            setattr(user, key, value)
-
-        updated_user = await self.uow.users.update(user)
         await self.uow.session.commit()
 
         logger.info(
-            f"Updated user: {updated_user.full_name}",
-            extra={"user_id": str(user_id), "updated_fields": list(update_dict.keys())},
+            "Updated user: %s",
+            updated_user.full_name,
+            extra={"user_id": user_id, "updated_fields": list(update_dict)},
         )
 
         return UserResponse.model_validate(updated_user)
 
+    async def _ensure_user_exists(self, user_id: UUID) -> None:
+        """Raise NotFoundError if the user does not exist."""
+        if await self.uow.users.get_by_id(user_id) is None:
+            raise NotFoundError(
+                message="User not found",
+                details={"user_id": str(user_id)},
+            )
+
     async def deactivate_user(self, user_id: UUID) -> UserResponse:
         """
         Deactivate user (soft delete).
@@ -251,8 +281,9 @@ class UserService:
         await self.uow.session.commit()
 
         logger.info(
-            f"Deactivated user: {updated_user.full_name}",
-            extra={"user_id": str(user_id)},
+            "Deactivated user: %s",
+            updated_user.full_name,
+            extra={"user_id": user_id},
         )
 
         return UserResponse.model_validate(updated_user)
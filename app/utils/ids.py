@@ -0,0 +1,14 @@
+"""Identifier helpers."""
+
+import os
+from uuid import UUID
+
+
+def uuid4_batch(count: int) -> list[UUID]:
+    """Generate ``count`` random (version 4) UUIDs from one ``os.urandom`` call.
+
+    Equivalent to ``[uuid4() for _ in range(count)]`` but reads the random
+    bytes for the whole batch with a single syscall.
+    """
+    buffer = os.urandom(16 * count)
+    return [UUID(bytes=buffer[i : i + 16], version=4) for i in range(0, 16 * count, 16)]
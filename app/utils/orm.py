@@ -0,0 +1,14 @@
+"""ORM instance helpers."""
+
+from typing import Any, Mapping
+
+
+def apply_changes(instance: Any, values: Mapping[str, Any]) -> None:
+    """Set each attribute of ``instance`` whose value differs from ``values``.
+
+    Unchanged values are skipped so they neither mark the attribute dirty nor
+    end up in the UPDATE's SET clause.
+    """
+    for key, value in values.items():
+        if getattr(instance, key) != value:
+            setattr(instance, key, value)
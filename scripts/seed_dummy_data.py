@@ -3,11 +3,17 @@
 import argparse
 import asyncio
 from datetime import date, datetime, timedelta, timezone
-from typing import Sequence
+from typing import Optional, Sequence
 
-from uuid import uuid4
+from uuid import UUID, uuid4
 
-from app.db.session import AsyncSessionLocal
+from sqlalchemy import func, or_, select, union_all
+from sqlalchemy.dialects.postgresql import insert
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.config import get_settings
+from app.db.session import engine_kwargs
 from app.db.unit_of_work import UnitOfWork
 from app.db.models import (
     Role,
@@ -17,84 +23,166 @@ from app.db.models import (
 )
 from app.schemas.evaluation.evaluation import EvaluationCreate, CompetencyScoreCreate
 from app.services.evaluation_service import EvaluationService
-from app.integrations.ai_skills_client import AISkillsClient
-from app.integrations.ai_career_client import AICareerClient
-
-
-async def _get_or_create_role(uow: UnitOfWork, name: str, job_family: str, seniority: str) -> Role:
-    role = await uow.roles.get_by_name(name)
-    if role:
-        return role
-    role = Role(
-        id=uuid4(),
-        name=name,
-        job_family=job_family,
-        seniority_level=seniority,
-        is_active=True,
+from app.services.dependencies import close_ai_clients, shared_ai_skills_client
+from app.utils.ids import uuid4_batch
+
+
+async def _get_or_create_by_name(
+    uow: UnitOfWork,
+    model: type[Role | Skill],
+    rows: list[dict],
+) -> dict:
+    """Return ``model`` rows keyed by name, creating missing ones in one statement (no commit).
+
+    A data-modifying CTE inserts the rows (ON CONFLICT (name) DO NOTHING);
+    the outer query unions what it returned with the rows that already
+    existed. Warm re-seeds and cold seeds both take a single round-trip.
+    """
+    table = model.__table__
+    inserted = (
+        insert(table)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=[table.c.name])
+        .returning(*table.c)
+        .cte("inserted")
+    )
+    existing = select(table).where(table.c.name.in_([row["name"] for row in rows]))
+    stmt = select(model).from_statement(union_all(select(inserted), existing))
+    return {obj.name: obj for obj in await uow.session.scalars(stmt)}
+
+
+async def _get_or_create_roles(
+    uow: UnitOfWork,
+    specs: Sequence[tuple[str, str, str]],
+) -> dict[str, Role]:
+    """Resolve (name, job_family, seniority) roles, creating the missing ones (no commit)."""
+    return await _get_or_create_by_name(
+        uow,
+        Role,
+        [
+            {
+                "id": role_id,
+                "name": name,
+                "job_family": job_family,
+                "seniority_level": seniority,
+                "is_active": True,
+            }
+            for role_id, (name, job_family, seniority) in zip(uuid4_batch(len(specs)), specs)
+        ],
     )
-    await uow.roles.create(role)
-    await uow.commit()
-    return role
-
-
-async def _get_or_create_skill(uow: UnitOfWork, name: str, category: str) -> Skill:
-    skill = await uow.skills.get_by_name(name)
-    if skill:
-        return skill
-    skill = Skill(
-        id=uuid4(),
-        name=name,
-        category=category,
-        is_global=True,
-        is_active=True,
+
+
+async def _get_or_create_skills(
+    uow: UnitOfWork,
+    specs: Sequence[tuple[str, str]],
+) -> dict[str, Skill]:
+    """Resolve (name, category) skills, creating the missing ones (no commit)."""
+    return await _get_or_create_by_name(
+        uow,
+        Skill,
+        [
+            {
+                "id": skill_id,
+                "name": name,
+                "category": category,
+                "is_global": True,
+                "is_active": True,
+            }
+            for skill_id, (name, category) in zip(uuid4_batch(len(specs)), specs)
+        ],
     )
-    await uow.skills.create(skill)
-    await uow.commit()
-    return skill
 
 
-async def _get_or_create_user(
+async def _get_or_create_users(
     uow: UnitOfWork,
-    email: str,
-    full_name: str,
-    role_id,
-    manager_id=None,
-) -> User:
-    user = await uow.users.get_by_email(email)
-    if user:
-        if user.role_id != role_id or user.manager_id != manager_id:
-            user.role_id = role_id
-            user.manager_id = manager_id
-            await uow.users.update(user)
-            await uow.commit()
-        return user
-
-    user = User(
-        id=uuid4(),
-        email=email,
-        full_name=full_name,
-        role_id=role_id,
-        manager_id=manager_id,
-        hire_date=date.today() - timedelta(days=365 * 5),
-        is_active=True,
+    specs: Sequence[tuple[str, str, UUID, Optional[UUID]]],
+) -> dict[str, User]:
+    """Upsert (email, full_name, role_id, manager_id) users in one statement (no commit).
+
+    New emails are inserted. Existing users are only updated when their
+    role or manager actually differ (ON CONFLICT (email) DO UPDATE ... WHERE
+    ... IS DISTINCT FROM), so an idempotent re-seed writes nothing; users
+    left untouched are read back in the same statement.
+    """
+    hire_date = date.today() - timedelta(days=365 * 5)
+    table = User.__table__
+    stmt = insert(table).values(
+        [
+            {
+                "id": user_id,
+                "email": email,
+                "full_name": full_name,
+                "role_id": role_id,
+                "manager_id": manager_id,
+                "hire_date": hire_date,
+                "is_active": True,
+            }
+            for user_id, (email, full_name, role_id, manager_id) in zip(
+                uuid4_batch(len(specs)), specs
+            )
+        ]
+    )
+    upserted = (
+        stmt.on_conflict_do_update(
+            index_elements=[table.c.email],
+            set_={
+                "role_id": stmt.excluded.role_id,
+                "manager_id": stmt.excluded.manager_id,
+                "updated_at": func.now(),
+            },
+            where=or_(
+                table.c.role_id.is_distinct_from(stmt.excluded.role_id),
+                table.c.manager_id.is_distinct_from(stmt.excluded.manager_id),
+            ),
+        )
+        .returning(*table.c)
+        .cte("upserted")
     )
-    await uow.users.create(user)
-    await uow.commit()
-    return user
+    unchanged = select(table).where(
+        table.c.email.in_([email for email, _, _, _ in specs]),
+        table.c.email.not_in(select(upserted.c.email)),
+    )
+    query = (
+        select(User)
+        .from_statement(union_all(select(upserted), unchanged))
+        .execution_options(populate_existing=True)
+    )
+    return {user.email: user for user in await uow.session.scalars(query)}
 
 
 async def seed(process_pipeline: bool = False) -> None:
     """Create roles, skills, users, evaluations and optionally run the full AI pipeline."""
-    async with AsyncSessionLocal() as session:
+    # Seeder-local engine with the app's configuration; synchronous_commit is
+    # set per connection, so every pooled connection (and every commit,
+    # including the --process pipeline's) gets it. Same rationale as
+    # scripts/seed_test_data.py.
+    engine = create_async_engine(
+        str(get_settings().database_url),
+        **engine_kwargs,
+        connect_args={"server_settings": {"synchronous_commit": "off"}},
+    )
+    session_factory = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
+    )
+    async with session_factory() as session:
         uow = UnitOfWork(session)
-        ai_skills_client = AISkillsClient()
-        ai_career_client = AICareerClient()
+        ai_skills_client = shared_ai_skills_client()
 
         try:
-            # Catalog data
-            manager_role = await _get_or_create_role(uow, "Gerente de Sucursal", "Operaciones", "Senior")
-            regional_role = await _get_or_create_role(uow, "Gerente Regional", "Operaciones", "Director")
-            peer_role = await _get_or_create_role(uow, "Especialista Senior en Operaciones", "Operaciones", "Senior")
+            # Catalog data: one lookup per catalog instead of one per row.
+            # (A single AsyncSession can't run statements concurrently, so
+            # batching is what removes the round-trips, not asyncio.gather.)
+            roles = await _get_or_create_roles(
+                uow,
+                [
+                    ("Gerente de Sucursal", "Operaciones", "Senior"),
+                    ("Gerente Regional", "Operaciones", "Director"),
+                    ("Especialista Senior en Operaciones", "Operaciones", "Senior"),
+                ],
+            )
+            manager_role = roles["Gerente de Sucursal"]
+            regional_role = roles["Gerente Regional"]
+            peer_role = roles["Especialista Senior en Operaciones"]
 
             skill_names = [
                 ("Liderazgo", "soft"),
@@ -102,34 +190,27 @@ async def seed(process_pipeline: bool = False) -> None:
                 ("Pensamiento Estratégico", "leadership"),
                 ("Gestión de P&L", "finance"),
             ]
-            skills = {name: await _get_or_create_skill(uow, name, category) for name, category in skill_names}
+            skills = await _get_or_create_skills(uow, skill_names)
 
-            # Users
-            manager_user = await _get_or_create_user(
-                uow,
-                email="manager.demo@example.com",
-                full_name="Manager Demo",
-                role_id=regional_role.id,
-            )
-            evaluated_user = await _get_or_create_user(
-                uow,
-                email="colaborador.demo@example.com",
-                full_name="Colaborador Demo",
-                role_id=manager_role.id,
-                manager_id=manager_user.id,
-            )
-            peer_one = await _get_or_create_user(
-                uow,
-                email="peer.one@example.com",
-                full_name="Peer Uno",
-                role_id=peer_role.id,
-            )
-            peer_two = await _get_or_create_user(
+            # Users: the manager first (the evaluated user reports to it),
+            # then everyone else in one batch
+            manager_user = (
+                await _get_or_create_users(
+                    uow,
+                    [("manager.demo@example.com", "Manager Demo", regional_role.id, None)],
+                )
+            )["manager.demo@example.com"]
+            users = await _get_or_create_users(
                 uow,
-                email="peer.two@example.com",
-                full_name="Peer Dos",
-                role_id=peer_role.id,
+                [
+                    ("colaborador.demo@example.com", "Colaborador Demo", manager_role.id, manager_user.id),
+                    ("peer.one@example.com", "Peer Uno", peer_role.id, None),
+                    ("peer.two@example.com", "Peer Dos", peer_role.id, None),
+                ],
             )
+            evaluated_user = users["colaborador.demo@example.com"]
+            peer_one = users["peer.one@example.com"]
+            peer_two = users["peer.two@example.com"]
 
             # Evaluation cycle
             cycle_name = f"Dummy Cycle {date.today().isoformat()}"
@@ -142,7 +223,6 @@ async def seed(process_pipeline: bool = False) -> None:
                 status="active",
             )
             await uow.evaluation_cycles.create(cycle)
-            await uow.commit()
 
             eval_service = EvaluationService(
                 uow=uow,
@@ -156,24 +236,33 @@ async def seed(process_pipeline: bool = False) -> None:
                 CompetencyScoreCreate(competency_name="Gestión de P&L", score=6.5, comments=""),
             ]
 
-            # Create evaluations (self, manager, peers)
-            created_eval_ids: list = []
+            # Create evaluations (self, manager, peers): one batched write,
+            # whose commit also persists everything flushed above (the whole
+            # setup is a single transaction)
             relationships = [
                 ("self", evaluated_user.id),
                 ("manager", manager_user.id),
                 ("peer", peer_one.id),
                 ("peer", peer_two.id),
             ]
-            for relationship, evaluator_id in relationships:
-                evaluation = EvaluationCreate(
-                    user_id=evaluated_user.id,
-                    evaluation_cycle_id=cycle.id,
-                    evaluator_id=evaluator_id,
-                    evaluator_relationship=relationship,
-                    competencies=list(base_competencies),
-                )
-                created = await eval_service.create_evaluation(evaluation)
-                created_eval_ids.append(created.id)
+            # Validated once; each copy only swaps two already-typed fields
+            # (model_copy skips validation and shares the competency list)
+            template = EvaluationCreate(
+                user_id=evaluated_user.id,
+                evaluation_cycle_id=cycle.id,
+                evaluator_id=evaluated_user.id,
+                evaluator_relationship="self",
+                competencies=base_competencies,
+            )
+            created = await eval_service.create_evaluations_bulk(
+                [
+                    template.model_copy(
+                        update={"evaluator_id": evaluator_id, "evaluator_relationship": relationship}
+                    )
+                    for relationship, evaluator_id in relationships
+                ]
+            )
+            created_eval_ids = [evaluation.id for evaluation in created]
 
             print(f"Created cycle '{cycle.name}' with {len(created_eval_ids)} evaluations.")
 
@@ -185,8 +274,8 @@ async def seed(process_pipeline: bool = False) -> None:
                 print("Pipeline not executed. Run with --process to trigger AI steps.")
 
         finally:
-            await ai_skills_client.close()
-            await ai_career_client.close()
+            await close_ai_clients()
+    await engine.dispose()
 
 
 def _parse_args() -> argparse.Namespace:
@@ -23,9 +23,14 @@ Usage:
     
     # Clean and reseed
     python scripts/seed_test_data.py --clean
+
+The seeder's connections run with synchronous_commit=off: commits don't wait
+for the WAL flush. A crash can lose the last seed, which is simply rerun.
+This is intentional for seeding only; never do it in application code.
 """
 import asyncio
 import sys
+from collections import defaultdict
 from pathlib import Path
 from typing import Optional
 from uuid import UUID
@@ -40,18 +45,28 @@ from sqlalchemy import text
 from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.db.base import Base
+from app.db.session import engine_kwargs
 from app.db.unit_of_work import UnitOfWork
 from tests.helpers.e2e_setup import create_evaluation_scenario, EvaluationScenario
 from app.services.evaluation_service import EvaluationService
 from app.services.skills_assessment_service import SkillsAssessmentService
 from app.services.career_path_service import CareerPathService
-from app.integrations.ai_skills_client import AISkillsClient
-from app.integrations.ai_career_client import AICareerClient
+from app.services.dependencies import (
+    close_ai_clients,
+    shared_ai_career_client,
+    shared_ai_skills_client,
+)
 from app.schemas.evaluation.evaluation import EvaluationCreate
 
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Aggregated skill score table (process_evaluations)
+_SHOWN_SCORES = 5
+_DIVIDER = "   " + "─" * 76
+_SCORE_HEADER = f"   {'Skill':<30} {'Score':<10} {'Confidence':<12} {'Source':<20}"
+_SCORE_ROW = "   {:<30} {:<10.2f} {:<12.2f} {:<20}"
+
 
 class DataSeeder:
     """Handles database seeding for testing."""
@@ -59,8 +74,8 @@ class DataSeeder:
     def __init__(self, session: AsyncSession):
         self.session = session
         self.uow = UnitOfWork(session)
-        self.ai_skills_client = AISkillsClient()
-        self.ai_career_client = AICareerClient()
+        self.ai_skills_client = shared_ai_skills_client()
+        self.ai_career_client = shared_ai_career_client()
         
         self.eval_service = EvaluationService(self.uow, self.ai_skills_client)
         self.skills_service = SkillsAssessmentService(self.uow, self.ai_skills_client)
@@ -72,7 +87,8 @@ class DataSeeder:
         """Clean all test data from database."""
         print("\n🧹 Cleaning existing test data...")
         
-        # Order matters due to foreign key constraints
+        # A single TRUNCATE covers every table (one round-trip, one lock
+        # pass); with CASCADE the order of the list does not matter
         tables = [
             "development_actions",
             "career_path_steps",
@@ -88,34 +104,35 @@ class DataSeeder:
             "roles",
         ]
         
-        for table in tables:
-            await self.session.execute(text(f"TRUNCATE TABLE {table} CASCADE"))
+        await self.session.execute(text(f"TRUNCATE TABLE {', '.join(tables)} CASCADE"))
         
         await self.session.commit()
         print("   ✅ All tables cleaned")
     
     async def seed_base_scenario(self) -> EvaluationScenario:
         """Create base evaluation scenario with users, roles, skills, and cycle."""
-        print("\n📊 Creating base scenario...")
-        print("   ├─ Roles (Employee, Manager, Director, VP)")
-        print("   ├─ Skills (Leadership, Communication, Strategic Thinking, etc.)")
-        print("   ├─ Users (Evaluated user + evaluators)")
-        print("   └─ Evaluation Cycle (2024-Q1)")
+        print(
+            "\n📊 Creating base scenario...\n"
+            "   ├─ Roles (Employee, Manager, Director, VP)\n"
+            "   ├─ Skills (Leadership, Communication, Strategic Thinking, etc.)\n"
+            "   ├─ Users (Evaluated user + evaluators)\n"
+            "   └─ Evaluation Cycle (2024-Q1)"
+        )
         
         scenario = await create_evaluation_scenario(self.uow)
         self.scenario = scenario
         
-        await self.session.commit()
-        
-        print("\n✅ Base scenario created:")
-        print(f"   • Evaluated User: {scenario.evaluated_user.full_name} ({scenario.evaluated_user.email})")
-        print(f"     ID: {scenario.evaluated_user.id}")
-        print(f"   • Manager: {scenario.manager_user.full_name} ({scenario.manager_user.email})")
-        print(f"   • Peer 1: {scenario.peer_one.full_name} ({scenario.peer_one.email})")
-        print(f"   • Peer 2: {scenario.peer_two.full_name} ({scenario.peer_two.email})")
-        print(f"   • Cycle: {scenario.cycle.name} (ID: {scenario.cycle.id})")
-        print(f"   • Skills: {len(scenario.skills)} skills created")
-        print(f"   • Roles: Employee → Manager → Director → VP")
+        print(
+            "\n✅ Base scenario created:\n"
+            f"   • Evaluated User: {scenario.evaluated_user.full_name} ({scenario.evaluated_user.email})\n"
+            f"     ID: {scenario.evaluated_user.id}\n"
+            f"   • Manager: {scenario.manager_user.full_name} ({scenario.manager_user.email})\n"
+            f"   • Peer 1: {scenario.peer_one.full_name} ({scenario.peer_one.email})\n"
+            f"   • Peer 2: {scenario.peer_two.full_name} ({scenario.peer_two.email})\n"
+            f"   • Cycle: {scenario.cycle.name} (ID: {scenario.cycle.id})\n"
+            f"   • Skills: {len(scenario.skills)} skills created\n"
+            f"   • Roles: Employee → Manager → Director → VP"
+        )
         
         return scenario
     
@@ -133,24 +150,31 @@ class DataSeeder:
             ("peer", self.scenario.peer_two.id, self.scenario.peer_two.full_name),
         ]
         
-        evaluation_ids = []
-        for idx, (relationship, evaluator_id, evaluator_name) in enumerate(relationships_and_evaluators, 1):
-            print(f"   [{idx}/4] Creating {relationship.upper()} evaluation from {evaluator_name}...")
-            
-            evaluation_data = EvaluationCreate(
-                user_id=self.scenario.evaluated_user.id,
-                evaluation_cycle_id=self.scenario.cycle.id,
-                evaluator_id=evaluator_id,
-                evaluator_relationship=relationship,
-                competencies=list(self.scenario.base_competencies),
-            )
-            
-            created_eval = await self.eval_service.create_evaluation(evaluation_data)
-            evaluation_ids.append(created_eval.id)
-            
-            print(f"         ✅ Evaluation ID: {created_eval.id}")
+        print(f"   Creating {len(relationships_and_evaluators)} evaluations in one batch...")
+        # Validated once; each copy only swaps two already-typed fields
+        # (model_copy skips validation and shares the competency list)
+        template = EvaluationCreate(
+            user_id=self.scenario.evaluated_user.id,
+            evaluation_cycle_id=self.scenario.cycle.id,
+            evaluator_id=self.scenario.evaluated_user.id,
+            evaluator_relationship="self",
+            competencies=self.scenario.base_competencies,
+        )
+        created_evals = await self.eval_service.create_evaluations_bulk(
+            [
+                template.model_copy(
+                    update={"evaluator_id": evaluator_id, "evaluator_relationship": relationship}
+                )
+                for relationship, evaluator_id, _ in relationships_and_evaluators
+            ]
+        )
+        evaluation_ids = [created_eval.id for created_eval in created_evals]
         
-        await self.session.commit()
+        for idx, ((relationship, _, evaluator_name), evaluation_id) in enumerate(
+            zip(relationships_and_evaluators, evaluation_ids), 1
+        ):
+            print(f"   [{idx}/4] {relationship.upper()} evaluation from {evaluator_name}")
+            print(f"         ✅ Evaluation ID: {evaluation_id}")
         
         print(f"\n✅ Created {len(evaluation_ids)} evaluations")
         print(f"   Total competency scores: {len(evaluation_ids) * len(self.scenario.base_competencies)}")
@@ -162,18 +186,21 @@ class DataSeeder:
         if not evaluation_ids:
             raise ValueError("No evaluations to process")
         
-        print("\n⚙️  Processing evaluations...")
-        print("   ├─ Checking cycle completeness")
-        print("   ├─ Aggregating skill scores")
-        print("   └─ Calculating confidence levels")
+        print(
+            "\n⚙️  Processing evaluations...\n"
+            "   ├─ Checking cycle completeness\n"
+            "   ├─ Aggregating skill scores\n"
+            "   └─ Calculating confidence levels"
+        )
         
         result = await self.eval_service.process_evaluation(evaluation_ids[0])
-        await self.session.commit()
         
-        print(f"\n✅ Evaluations processed:")
-        print(f"   • Cycle Complete: {result['cycle_complete']}")
-        print(f"   • User ID: {result['user_id']}")
-        print(f"   • Cycle ID: {result['cycle_id']}")
+        print(
+            f"\n✅ Evaluations processed:\n"
+            f"   • Cycle Complete: {result['cycle_complete']}\n"
+            f"   • User ID: {result['user_id']}\n"
+            f"   • Cycle ID: {result['cycle_id']}"
+        )
         
         # Load and display aggregated scores
         user_skill_scores = await self.uow.user_skill_scores.get_by_user_and_cycle(
@@ -181,19 +208,33 @@ class DataSeeder:
             cycle_id=result['cycle_id'],
         )
         
-        print(f"\n📊 Aggregated {len(user_skill_scores)} skill scores:")
-        print("   " + "─"*76)
-        print(f"   {'Skill':<30} {'Score':<10} {'Confidence':<12} {'Source':<20}")
-        print("   " + "─"*76)
-        
-        for score in user_skill_scores[:5]:  # Show first 5
-            skill = await self.uow.skills.get_by_id(score.skill_id)
-            if skill:
-                print(f"   {skill.name:<30} {float(score.score):<10.2f} {score.confidence:<12.2f} {score.source:<20}")
+        shown_scores = user_skill_scores[:_SHOWN_SCORES]
+        # Names of the shown skills in one query instead of one per row
+        skill_names = await self.uow.skills.get_names_by_ids(
+            [score.skill_id for score in shown_scores],
+            active_only=False,
+        )
         
-        if len(user_skill_scores) > 5:
-            print(f"   ... and {len(user_skill_scores) - 5} more")
-        print("   " + "─"*76)
+        table = [
+            f"\n📊 Aggregated {len(user_skill_scores)} skill scores:",
+            _DIVIDER,
+            _SCORE_HEADER,
+            _DIVIDER,
+        ]
+        table.extend(
+            _SCORE_ROW.format(
+                skill_names[score.skill_id],
+                float(score.score),
+                score.confidence,
+                score.source,
+            )
+            for score in shown_scores
+            if score.skill_id in skill_names
+        )
+        if len(user_skill_scores) > _SHOWN_SCORES:
+            table.append(f"   ... and {len(user_skill_scores) - _SHOWN_SCORES} more")
+        table.append(_DIVIDER)
+        print("\n".join(table))
         
         return result
     
@@ -202,19 +243,22 @@ class DataSeeder:
         if not self.scenario:
             raise ValueError("Must call seed_base_scenario first")
         
-        print("\n🤖 Generating Skills Assessment...")
-        print("   Note: Using real AI service (may fail if not configured)")
+        print(
+            "\n🤖 Generating Skills Assessment...\n"
+            "   Note: Using real AI service (may fail if not configured)"
+        )
         
         try:
             assessment = await self.skills_service.generate_assessment(
                 user_id=self.scenario.evaluated_user.id,
                 cycle_id=self.scenario.cycle.id,
             )
-            await self.session.commit()
             
-            print(f"\n✅ Skills Assessment created:")
-            print(f"   • Assessment ID: {assessment.id}")
-            print(f"   • Status: {assessment.status}")
+            print(
+                f"\n✅ Skills Assessment created:\n"
+                f"   • Assessment ID: {assessment.id}\n"
+                f"   • Status: {assessment.status}"
+            )
             
             # Load items
             items = await self.uow.skills_assessment_items.get_by_assessment_id(assessment.id)
@@ -230,8 +274,10 @@ class DataSeeder:
             return assessment
         
         except Exception as e:
-            print(f"\n⚠️  Skills Assessment failed: {e}")
-            print("   This is expected if AI service is not configured")
+            print(
+                f"\n⚠️  Skills Assessment failed: {e}\n"
+                "   This is expected if AI service is not configured"
+            )
             return None
     
     async def generate_career_paths(self, assessment_id: Optional[UUID] = None):
@@ -239,8 +285,10 @@ class DataSeeder:
         if not self.scenario:
             raise ValueError("Must call seed_base_scenario first")
         
-        print("\n🎯 Generating Career Paths...")
-        print("   Note: Using real AI service (may fail if not configured)")
+        print(
+            "\n🎯 Generating Career Paths...\n"
+            "   Note: Using real AI service (may fail if not configured)"
+        )
         
         try:
             career_paths = await self.career_service.generate_career_paths(
@@ -249,16 +297,21 @@ class DataSeeder:
                 career_interests=[self.scenario.regional_role.name],  # Next level up
                 time_horizon_years=3,
             )
-            await self.session.commit()
             
             print(f"\n✅ Generated {len(career_paths)} career path(s):")
             
+            # Steps of every path in one query (actions are not displayed)
+            steps_by_path: dict[UUID, list] = defaultdict(list)
+            for step in await self.uow.career_path_steps.get_by_path_ids(
+                [path.id for path in career_paths]
+            ):
+                steps_by_path[step.career_path_id].append(step)
+            
             for path in career_paths:
                 print(f"\n   • Career Path ID: {path.id}")
                 print(f"     Status: {path.status}")
                 
-                # Load steps
-                steps = await self.uow.career_path_steps.get_by_path_id(path.id, load_actions=True)
+                steps = steps_by_path[path.id]
                 print(f"     Steps: {len(steps)}")
                 
                 for step in steps[:2]:  # Show first 2 steps
@@ -271,8 +324,10 @@ class DataSeeder:
             return career_paths
         
         except Exception as e:
-            print(f"\n⚠️  Career Path generation failed: {e}")
-            print("   This is expected if AI service is not configured")
+            print(
+                f"\n⚠️  Career Path generation failed: {e}\n"
+                "   This is expected if AI service is not configured"
+            )
             return None
 
 
@@ -285,11 +340,14 @@ async def main(clean: bool = False, scenario: str = "complete"):
     print(f"Scenario: {scenario}")
     print(f"Clean first: {clean}")
     
-    # Create async engine
+    # Create async engine with the application's engine configuration
+    # (pool sizing/recycling from settings, pydantic-core JSON columns); a
+    # seeder-local engine so dispose() below does not touch the app's pool
     engine = create_async_engine(
         str(settings.database_url),
-        echo=False,
-        pool_pre_ping=True,
+        **{**engine_kwargs, "echo": False},
+        # Seed data is disposable (see module docstring)
+        connect_args={"server_settings": {"synchronous_commit": "off"}},
     )
     
     async_session_factory = async_sessionmaker(
@@ -328,35 +386,41 @@ async def main(clean: bool = False, scenario: str = "complete"):
             print("✅ SEEDING COMPLETED SUCCESSFULLY")
             print("="*80)
             
-            print("\n📋 QUICK REFERENCE - User Credentials:")
-            print(f"   Evaluated User: {scenario_data.evaluated_user.email}")
-            print(f"                   ID: {scenario_data.evaluated_user.id}")
-            print(f"   Manager:        {scenario_data.manager_user.email}")
-            print(f"   Peer 1:         {scenario_data.peer_one.email}")
-            print(f"   Peer 2:         {scenario_data.peer_two.email}")
+            print(
+                "\n📋 QUICK REFERENCE - User Credentials:\n"
+                f"   Evaluated User: {scenario_data.evaluated_user.email}\n"
+                f"                   ID: {scenario_data.evaluated_user.id}\n"
+                f"   Manager:        {scenario_data.manager_user.email}\n"
+                f"   Peer 1:         {scenario_data.peer_one.email}\n"
+                f"   Peer 2:         {scenario_data.peer_two.email}"
+            )
             
-            print("\n📋 QUICK REFERENCE - Evaluation Cycle:")
-            print(f"   Cycle Name: {scenario_data.cycle.name}")
-            print(f"   Cycle ID:   {scenario_data.cycle.id}")
+            print(
+                "\n📋 QUICK REFERENCE - Evaluation Cycle:\n"
+                f"   Cycle Name: {scenario_data.cycle.name}\n"
+                f"   Cycle ID:   {scenario_data.cycle.id}"
+            )
             
-            print("\n📋 TEST ENDPOINTS:")
-            print("   # Health Check")
-            print("   curl http://localhost:8000/health")
-            print()
-            print("   # Get User Evaluations")
-            print(f"   curl http://localhost:8000/api/v1/evaluations?user_id={scenario_data.evaluated_user.id}")
-            print()
-            print("   # Get Cycle Evaluations")
-            print(f"   curl http://localhost:8000/api/v1/evaluations?cycle_id={scenario_data.cycle.id}")
-            print()
-            print("   # Get Skills Assessment")
-            print(f"   curl http://localhost:8000/api/v1/skills-assessments?user_id={scenario_data.evaluated_user.id}")
-            print()
-            print("   # Get Career Paths")
-            print(f"   curl http://localhost:8000/api/v1/career-paths?user_id={scenario_data.evaluated_user.id}")
-            print()
-            print("   # Swagger UI")
-            print("   http://localhost:8000/docs")
+            print(
+                "\n📋 TEST ENDPOINTS:\n"
+                "   # Health Check\n"
+                "   curl http://localhost:8000/health\n"
+                "\n"
+                "   # Get User Evaluations\n"
+                f"   curl http://localhost:8000/api/v1/evaluations?user_id={scenario_data.evaluated_user.id}\n"
+                "\n"
+                "   # Get Cycle Evaluations\n"
+                f"   curl http://localhost:8000/api/v1/evaluations?cycle_id={scenario_data.cycle.id}\n"
+                "\n"
+                "   # Get Skills Assessment\n"
+                f"   curl http://localhost:8000/api/v1/skills-assessments?user_id={scenario_data.evaluated_user.id}\n"
+                "\n"
+                "   # Get Career Paths\n"
+                f"   curl http://localhost:8000/api/v1/career-paths?user_id={scenario_data.evaluated_user.id}\n"
+                "\n"
+                "   # Swagger UI\n"
+                "   http://localhost:8000/docs"
+            )
             print("\n" + "="*80 + "\n")
         
         except Exception as e:
@@ -364,6 +428,7 @@ async def main(clean: bool = False, scenario: str = "complete"):
             print(f"\n❌ SEEDING FAILED: {e}")
             sys.exit(1)
         finally:
+            await close_ai_clients()
             await engine.dispose()
 
 
@@ -3,16 +3,20 @@ Pytest configuration - Mock fixtures only.
 
 Database fixtures moved to tests/integration/conftest.py and tests/e2e/conftest.py
 """
-import asyncio
 from typing import Generator
 from uuid import uuid4
 import pytest
 
-@pytest.fixture(scope="session")
-def event_loop() -> Generator:
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+@pytest.fixture(autouse=True)
+def clear_service_caches() -> Generator:
+    """Keep process-wide service caches from leaking between tests."""
+    from app.services.caches import role_catalog_cache, skill_id_cache
+
+    role_catalog_cache.invalidate()
+    skill_id_cache.invalidate()
+    yield
+    role_catalog_cache.invalidate()
+    skill_id_cache.invalidate()
 
 @pytest.fixture
 def mock_ai_skills_assessment_response():
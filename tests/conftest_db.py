@@ -5,19 +5,18 @@ These fixtures are imported by tests/integration/conftest.py and tests/e2e/conft
 to avoid duplication.
 """
 
-import asyncio
 import os
-from typing import AsyncGenerator, Generator
+from typing import AsyncGenerator
 
-import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import NullPool
+from sqlalchemy.sql.dml import UpdateBase
 
 from app.db.base import Base
-from app.db.session import get_db
+from app.db.session import engine_kwargs, get_db
 from app.db.unit_of_work import UnitOfWork
 from app.main import app
 from tests.factories.evaluation_cycles import create_active_cycle, create_closed_cycle
@@ -35,17 +34,20 @@ TEST_DATABASE_URL = os.getenv(
 )
 
 
-@pytest.fixture(scope="session")
-def event_loop() -> Generator:
-    """
-    Create an instance of the default event loop for the test session.
-    
-    This fixture ensures all async tests share the same event loop,
-    preventing issues with multiple event loops.
+# Tables written since the last cleanup, recorded by _track_written_tables
+_written_tables: set[str] = set()
+
+
+def _track_written_tables(
+    conn, clauseelement, multiparams, params, execution_options, result
+) -> None:
+    """Record the target table of every INSERT/UPDATE/DELETE run on the test engine.
+
+    Listens on the engine (not the session) so Core statements such as
+    executemany inserts and upserts are seen as well as ORM flushes.
     """
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+    if isinstance(clauseelement, UpdateBase):
+        _written_tables.add(clauseelement.table.name)
 
 
 @pytest_asyncio.fixture(scope="session")
@@ -53,13 +55,16 @@ async def db_engine():
     """
     Create async database engine for test session.
     
-    Uses NullPool to avoid connection pool issues in tests.
+    Uses NullPool to avoid connection pool issues in tests and the app's
+    JSON (de)serializers, so JSONB columns behave as in the app engine.
     Creates all tables at session start, drops at session end.
     """
     engine = create_async_engine(
         TEST_DATABASE_URL,
         echo=False,
         poolclass=NullPool,
+        json_serializer=engine_kwargs["json_serializer"],
+        json_deserializer=engine_kwargs["json_deserializer"],
     )
     
     # Create all tables
@@ -67,6 +72,8 @@ async def db_engine():
         await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
     
+    event.listen(engine.sync_engine, "after_execute", _track_written_tables)
+    
     yield engine
     
     # Drop all tables after tests
@@ -102,26 +109,20 @@ async def cleanup_db(db_engine):
     """
     Clean database between integration/E2E tests.
     
-    Truncates all tables after each test to ensure isolation.
+    Truncates the tables written during the test (see _track_written_tables)
+    in a single statement; tests that only read skip the round-trip.
     Auto-used for all tests that import from this module.
     """
     yield  # Test runs here
     
-    # Cleanup after test
+    if not _written_tables:
+        return
+    
+    # CASCADE also empties tables whose foreign keys point at these
+    tables = ", ".join(sorted(_written_tables))
+    _written_tables.clear()
     async with db_engine.begin() as conn:
-        # Disable foreign key checks temporarily
-        await conn.execute(text("SET session_replication_role = 'replica';"))
-        
-        # Get all table names
-        table_names = [table.name for table in Base.metadata.sorted_tables]
-        
-        # Truncate all tables
-        for table_name in table_names:
-            if table_name != "alembic_version":
-                await conn.execute(text(f"TRUNCATE TABLE {table_name} CASCADE;"))
-        
-        # Re-enable foreign key checks
-        await conn.execute(text("SET session_replication_role = 'origin';"))
+        await conn.execute(text(f"TRUNCATE TABLE {tables} CASCADE"))
 
 
 @pytest_asyncio.fixture
@@ -28,7 +28,6 @@ async def create_active_cycle(
     )
     db_session.add(cycle)
     await db_session.flush()
-    await db_session.refresh(cycle)
     return cycle
 
 
@@ -53,5 +52,4 @@ async def create_closed_cycle(
     )
     db_session.add(cycle)
     await db_session.flush()
-    await db_session.refresh(cycle)
     return cycle
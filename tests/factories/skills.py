@@ -78,7 +78,4 @@ async def ensure_skills_catalog(
 
     await db_session.flush()
 
-    for skill in skills:
-        await db_session.refresh(skill)
-
     return skills
@@ -22,7 +22,6 @@ async def create_user(
     )
     db_session.add(user)
     await db_session.flush()
-    await db_session.refresh(user)
     return user
 
 
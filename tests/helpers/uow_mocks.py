@@ -31,10 +31,15 @@ class UowMockBuilder:
         self.uow.skills.get_by_id = AsyncMock()
         self.uow.skills.get_by_ids = AsyncMock()
         self.uow.evaluations.get_by_id = AsyncMock()
+        self.uow.evaluations.get_creation_context = AsyncMock()
+        self.uow.evaluations.get_creation_contexts = AsyncMock()
         self.uow.evaluations.get_by_user_and_cycle = AsyncMock()
-        self.uow.competency_scores.create_bulk = AsyncMock()
-        self.uow.user_skill_scores.delete_by_user_and_cycle = AsyncMock()
-        self.uow.user_skill_scores.create_bulk = AsyncMock()
+        self.uow.evaluations.get_with_cycle_siblings = AsyncMock(return_value=[])
+        self.uow.competency_scores.insert_many = AsyncMock()
+        self.uow.competency_scores.get_grouped_submitted = AsyncMock(return_value=[])
+        self.uow.user_skill_scores.delete_stale = AsyncMock()
+        self.uow.user_skill_scores.upsert_bulk = AsyncMock()
+        self.uow.user_skill_scores.replace_aggregated = AsyncMock()
 
         # commit / session
         self.uow.commit = AsyncMock()
@@ -54,6 +59,31 @@ class UowMockBuilder:
         self.uow.evaluation_cycles.get_by_id = AsyncMock(return_value=cycle)
         return self
 
+    def with_creation_context(
+        self,
+        *,
+        user_exists: bool = True,
+        evaluator_exists: bool = True,
+        cycle_status: str | None = "active",
+    ) -> UowMockBuilder:
+        """
+        Configura evaluations.get_creation_context (validación de user,
+        evaluator y ciclo en una sola consulta) y su variante por lotes
+        get_creation_contexts, con el mismo resultado para cada id pedido.
+        """
+        self.uow.evaluations.get_creation_context = AsyncMock(
+            return_value=(user_exists, evaluator_exists, cycle_status)
+        )
+
+        def _contexts(user_ids, cycle_ids):
+            # Sin distinguir user de evaluator: basta con que ambos flags coincidan
+            existing = set(user_ids) if user_exists and evaluator_exists else set()
+            statuses = {} if cycle_status is None else dict.fromkeys(cycle_ids, cycle_status)
+            return existing, statuses
+
+        self.uow.evaluations.get_creation_contexts = AsyncMock(side_effect=_contexts)
+        return self
+
     def with_skill(self, skill) -> UowMockBuilder:
         self.uow.skills.get_by_name = AsyncMock(return_value=skill)
         return self
@@ -82,7 +112,7 @@ class UowMockBuilder:
         self,
         deleted_count: int = 0,
     ) -> UowMockBuilder:
-        self.uow.user_skill_scores.delete_by_user_and_cycle = AsyncMock(
+        self.uow.user_skill_scores.delete_stale = AsyncMock(
             return_value=deleted_count
         )
         return self
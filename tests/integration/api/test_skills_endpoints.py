@@ -0,0 +1,69 @@
+"""
+Integration tests for Skill endpoints.
+
+These tests verify the complete flow from HTTP request to database,
+using a real test database.
+
+Tests cover keyset pagination of the skills catalog (after_id).
+"""
+
+from uuid import uuid4
+
+import pytest
+
+
+# ============================================================================
+# GET /api/v1/skills - Keyset pagination (after_id)
+# ============================================================================
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_list_skills_keyset_pages_cover_listing(async_client, sample_skills):
+    """Following after_id page by page yields the full catalog, in order, without repeats."""
+    full_listing = (await async_client.get("/api/v1/skills", params={"limit": 1000})).json()
+    assert len(full_listing) == len(sample_skills)
+
+    pages = []
+    params = {"limit": 2}
+    while True:
+        response = await async_client.get("/api/v1/skills", params=params)
+        assert response.status_code == 200, response.text
+        page = response.json()
+        pages.append(page)
+        if len(page) < 2:
+            break
+        params["after_id"] = page[-1]["id"]
+
+    # 5 skills: 2 + 2 + 1, the last page is short and ends the iteration
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert [skill["id"] for page in pages for skill in page] == [skill["id"] for skill in full_listing]
+
+    # Past the last skill there is nothing left
+    after_last = await async_client.get(
+        "/api/v1/skills", params={"after_id": full_listing[-1]["id"]}
+    )
+    assert after_last.status_code == 200
+    assert after_last.json() == []
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_list_skills_unknown_after_id_returns_empty_page(async_client, sample_skills):
+    """An after_id that matches no skill yields an empty page, not page 1."""
+    response = await async_client.get("/api/v1/skills", params={"after_id": str(uuid4())})
+
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_list_skills_after_id_with_filter_returns_422(async_client, sample_skills):
+    """after_id is rejected with category/global_only instead of being ignored."""
+    after_id = str(sample_skills[0].id)
+    for params in (
+        {"after_id": after_id, "category": "soft_skills"},
+        {"after_id": after_id, "global_only": "true"},
+    ):
+        response = await async_client.get("/api/v1/skills", params=params)
+        assert response.status_code == 422, f"Expected 422 for {params}, got {response.status_code}"
@@ -0,0 +1,214 @@
+"""
+Integration tests for User endpoints.
+
+These tests verify the complete flow from HTTP request to database,
+using a real test database.
+
+Tests cover the single-statement write paths and keyset listing:
+- POST creates with INSERT ... ON CONFLICT (email) DO NOTHING
+- PATCH updates with a conditional UPDATE (email NOT EXISTS) ... RETURNING
+- GET pages with the after_id keyset cursor
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from tests.factories.users import create_user
+
+
+# ============================================================================
+# POST /api/v1/users - Create User
+# ============================================================================
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_create_user_returns_201(async_client, sample_manager):
+    """POST /users should create the user and return it with server defaults."""
+    payload = {
+        "email": "new.user@example.com",
+        "full_name": "New User",
+        "manager_id": str(sample_manager.id),
+    }
+
+    response = await async_client.post("/api/v1/users", json=payload)
+
+    assert response.status_code == 201, f"Expected 201, got {response.status_code}: {response.text}"
+    data = response.json()
+    assert data["email"] == "new.user@example.com"
+    assert data["manager_id"] == str(sample_manager.id)
+    assert data["is_active"] is True
+    assert data["created_at"] and data["updated_at"], "Server timestamps should be returned"
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_create_user_with_taken_email_returns_409(async_client, sample_user):
+    """POST /users with an existing email should return 409 and not insert."""
+    payload = {"email": sample_user.email, "full_name": "Duplicate"}
+
+    response = await async_client.post("/api/v1/users", json=payload)
+
+    assert response.status_code == 409, f"Expected 409, got {response.status_code}: {response.text}"
+
+    listing = await async_client.get("/api/v1/users")
+    assert [user["email"] for user in listing.json()] == [sample_user.email]
+
+
+# ============================================================================
+# PATCH /api/v1/users/{user_id} - Update User
+# ============================================================================
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_update_user_returns_updated_fields(async_client, sample_user):
+    """PATCH should write the given fields and bump updated_at."""
+    response = await async_client.patch(
+        f"/api/v1/users/{sample_user.id}",
+        json={"email": "renamed@example.com", "full_name": "Renamed User"},
+    )
+
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
+    data = response.json()
+    assert data["email"] == "renamed@example.com"
+    assert data["full_name"] == "Renamed User"
+    assert data["updated_at"] >= data["created_at"]
+
+    fetched = await async_client.get(f"/api/v1/users/{sample_user.id}")
+    assert fetched.json()["email"] == "renamed@example.com"
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_update_user_keeping_own_email_is_not_a_conflict(async_client, sample_user):
+    """The email NOT EXISTS check ignores the user being updated."""
+    response = await async_client.patch(
+        f"/api/v1/users/{sample_user.id}",
+        json={"email": sample_user.email, "full_name": "Same Email"},
+    )
+
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
+    assert response.json()["full_name"] == "Same Email"
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_update_user_with_taken_email_returns_409(async_client, sample_user, sample_manager):
+    """PATCH to another user's email should return 409 and leave the user unchanged."""
+    response = await async_client.patch(
+        f"/api/v1/users/{sample_user.id}",
+        json={"email": sample_manager.email, "full_name": "Should Not Apply"},
+    )
+
+    assert response.status_code == 409, f"Expected 409, got {response.status_code}: {response.text}"
+
+    fetched = await async_client.get(f"/api/v1/users/{sample_user.id}")
+    assert fetched.json()["email"] == sample_user.email
+    assert fetched.json()["full_name"] == sample_user.full_name
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_update_nonexistent_user_returns_404(async_client):
+    """PATCH to an unknown user should return 404."""
+    response = await async_client.patch(
+        f"/api/v1/users/{uuid4()}",
+        json={"full_name": "Nobody"},
+    )
+
+    assert response.status_code == 404, f"Expected 404, got {response.status_code}"
+    assert response.json()["message"] == "User not found"
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_update_nonexistent_user_reports_user_before_references(async_client):
+    """A missing user is reported before an unknown role or a self-reference."""
+    user_id = uuid4()
+
+    bad_role = await async_client.patch(
+        f"/api/v1/users/{user_id}",
+        json={"role_id": str(uuid4())},
+    )
+    self_manager = await async_client.patch(
+        f"/api/v1/users/{user_id}",
+        json={"manager_id": str(user_id)},
+    )
+
+    assert bad_role.status_code == 404
+    assert bad_role.json()["message"] == "User not found"
+    assert self_manager.status_code == 404
+    assert self_manager.json()["message"] == "User not found"
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_update_user_with_unknown_role_returns_404(async_client, sample_user):
+    """PATCH with an unknown role_id on an existing user should return 404 for the role."""
+    response = await async_client.patch(
+        f"/api/v1/users/{sample_user.id}",
+        json={"role_id": str(uuid4())},
+    )
+
+    assert response.status_code == 404, f"Expected 404, got {response.status_code}"
+    assert response.json()["message"] == "Role not found"
+
+
+# ============================================================================
+# GET /api/v1/users - Keyset pagination (after_id)
+# ============================================================================
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_list_users_keyset_pages_cover_listing(async_client, db_session):
+    """Following after_id page by page yields the full listing, in order, without repeats."""
+    for index, full_name in enumerate(["Ana", "Bruno", "Bruno", "Carla", "Diego"]):
+        await create_user(db_session, email=f"keyset.{index}@example.com", full_name=full_name)
+    await db_session.commit()
+
+    full_listing = (await async_client.get("/api/v1/users", params={"limit": 1000})).json()
+    assert len(full_listing) == 5
+
+    pages = []
+    params = {"limit": 2}
+    while True:
+        response = await async_client.get("/api/v1/users", params=params)
+        assert response.status_code == 200, response.text
+        page = response.json()
+        pages.append(page)
+        if len(page) < 2:
+            break
+        params["after_id"] = page[-1]["id"]
+
+    # 2 + 2 + 1: the last page is short and ends the iteration
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert [user["id"] for page in pages for user in page] == [user["id"] for user in full_listing]
+
+    # Past the last user there is nothing left
+    after_last = await async_client.get(
+        "/api/v1/users", params={"after_id": full_listing[-1]["id"]}
+    )
+    assert after_last.status_code == 200
+    assert after_last.json() == []
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_list_users_unknown_after_id_returns_empty_page(async_client, sample_user):
+    """An after_id that matches no user yields an empty page, not page 1."""
+    response = await async_client.get("/api/v1/users", params={"after_id": str(uuid4())})
+
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_list_users_after_id_with_filter_returns_422(async_client, sample_user, sample_manager):
+    """after_id is rejected with role_id/manager_id instead of being ignored."""
+    for params in (
+        {"after_id": str(sample_user.id), "role_id": str(uuid4())},
+        {"after_id": str(sample_user.id), "manager_id": str(sample_manager.id)},
+    ):
+        response = await async_client.get("/api/v1/users", params=params)
+        assert response.status_code == 422, f"Expected 422 for {params}, got {response.status_code}"
@@ -0,0 +1 @@
+"""Repository integration tests."""
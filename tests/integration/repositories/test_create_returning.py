@@ -0,0 +1,126 @@
+"""
+Integration tests for repository create methods.
+
+create()/create_bulk() flush without a follow-up session.refresh(): on
+Postgres the mappers fetch server-generated columns through the INSERT's
+RETURNING (eager_defaults="auto"). These tests check that the defaulted
+columns are loaded after the flush and that no SELECT is issued for it.
+"""
+
+from contextlib import contextmanager
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, inspect
+
+from app.db.models import (
+    AICallsLog,
+    Evaluation,
+    EvaluationCompetencyScore,
+    Role,
+    UserSkillScore,
+)
+
+
+@contextmanager
+def recorded_statements(db_engine):
+    """Collect the SQL statements sent to the database inside the block."""
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(db_engine.sync_engine, "before_cursor_execute", _record)
+
+
+def assert_loaded(instance, keys: set[str]) -> None:
+    """The defaulted columns ``keys`` are loaded and not expired (reading them needs no SELECT)."""
+    state = inspect(instance)
+    assert keys <= state.dict.keys(), f"Not loaded: {keys - state.dict.keys()}"
+    assert not keys & state.expired_attributes, f"Expired: {keys & state.expired_attributes}"
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_create_role_loads_defaults_with_a_single_insert(uow, db_engine):
+    """Role.create issues one INSERT and leaves id and timestamps loaded."""
+    role = Role(name="Analista de Datos", job_family="Tecnología")
+
+    with recorded_statements(db_engine) as statements:
+        created = await uow.roles.create(role)
+
+    assert [s.split()[0] for s in statements] == ["INSERT"]
+    assert_loaded(created, {"id", "is_active", "created_at", "updated_at"})
+    assert created.id is not None
+    assert created.created_at is not None and created.updated_at is not None
+    assert created.is_active is True
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_create_ai_log_loads_defaults_with_a_single_insert(uow, db_engine, sample_user):
+    """AICallsLog.create issues one INSERT; JSONB payloads need no reload."""
+    log = AICallsLog(
+        service_name="career_paths",
+        user_id=sample_user.id,
+        request_payload={"user_id": str(sample_user.id)},
+        status="success",
+    )
+
+    with recorded_statements(db_engine) as statements:
+        created = await uow.ai_calls_log.create(log)
+
+    assert [s.split()[0] for s in statements] == ["INSERT"]
+    assert_loaded(created, {"id", "created_at"})
+    assert created.created_at is not None
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_create_bulk_scores_returns_server_generated_ids(
+    uow,
+    db_engine,
+    sample_user,
+    sample_evaluator,
+    sample_cycle,
+    sample_skills,
+):
+    """Score rows without an id get the gen_random_uuid() value from RETURNING."""
+    evaluation = await uow.evaluations.create(
+        Evaluation(
+            id=uuid4(),
+            user_id=sample_user.id,
+            evaluator_id=sample_evaluator.id,
+            evaluation_cycle_id=sample_cycle.id,
+            evaluator_relationship="manager",
+            status="submitted",
+        )
+    )
+    competency_scores = [
+        EvaluationCompetencyScore(evaluation_id=evaluation.id, skill_id=skill.id, score=7.5)
+        for skill in sample_skills[:2]
+    ]
+    user_skill_scores = [
+        UserSkillScore(
+            user_id=sample_user.id,
+            evaluation_cycle_id=sample_cycle.id,
+            skill_id=skill.id,
+            source="360_aggregated",
+            score=7.5,
+        )
+        for skill in sample_skills[:2]
+    ]
+
+    with recorded_statements(db_engine) as statements:
+        await uow.competency_scores.create_bulk(competency_scores)
+        await uow.user_skill_scores.create_bulk(user_skill_scores)
+
+    assert not any(s.lstrip().upper().startswith("SELECT") for s in statements)
+    for score in [*competency_scores, *user_skill_scores]:
+        assert_loaded(score, {"id", "created_at", "updated_at"})
+        assert score.id is not None
+    assert len({score.id for score in competency_scores}) == 2
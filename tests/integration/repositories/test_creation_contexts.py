@@ -0,0 +1,37 @@
+"""
+Integration tests for EvaluationRepository.get_creation_contexts.
+
+The batched prerequisite check of create_evaluations_bulk: users and cycles
+of the whole batch are looked up in one UNION ALL query.
+"""
+
+from uuid import uuid4
+
+import pytest
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_get_creation_contexts_reports_existing_users_and_cycle_statuses(
+    uow, sample_user, sample_evaluator, sample_cycle, sample_closed_cycle
+):
+    """Only existing ids come back; each cycle with its status."""
+    unknown_user, unknown_cycle = uuid4(), uuid4()
+
+    existing_user_ids, cycle_statuses = await uow.evaluations.get_creation_contexts(
+        {sample_user.id, sample_evaluator.id, unknown_user},
+        {sample_cycle.id, sample_closed_cycle.id, unknown_cycle},
+    )
+
+    assert existing_user_ids == {sample_user.id, sample_evaluator.id}
+    assert cycle_statuses == {
+        sample_cycle.id: sample_cycle.status,
+        sample_closed_cycle.id: sample_closed_cycle.status,
+    }
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_get_creation_contexts_with_unknown_ids_only(uow):
+    """Nothing matches: empty results, not an error."""
+    assert await uow.evaluations.get_creation_contexts({uuid4()}, {uuid4()}) == (set(), {})
@@ -0,0 +1,128 @@
+"""
+Integration tests for UserSkillScoreRepository.
+
+replace_aggregated sends WITH stale AS (DELETE ...) INSERT ... ON CONFLICT
+DO UPDATE as one statement; these tests run it against Postgres.
+"""
+
+import pytest
+from sqlalchemy import select
+
+from app.db.models import UserSkillScore
+
+
+def make_row(user, cycle, skill, score: float) -> dict:
+    """Aggregated score row as built by EvaluationService."""
+    return {
+        "user_id": user.id,
+        "evaluation_cycle_id": cycle.id,
+        "skill_id": skill.id,
+        "source": "360_aggregated",
+        "score": score,
+        "confidence": 0.5,
+        "raw_stats": {"overall_avg": score},
+    }
+
+
+async def fetch_scores(db_session, user, cycle) -> dict:
+    """Current rows by (skill_id, source), read as columns (bypasses the identity map)."""
+    result = await db_session.execute(
+        select(
+            UserSkillScore.skill_id,
+            UserSkillScore.source,
+            UserSkillScore.id,
+            UserSkillScore.score,
+            UserSkillScore.created_at,
+            UserSkillScore.updated_at,
+        ).where(
+            UserSkillScore.user_id == user.id,
+            UserSkillScore.evaluation_cycle_id == cycle.id,
+        )
+    )
+    return {(row.skill_id, row.source): row for row in result}
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_replace_aggregated_inserts_rows_with_timestamps(
+    uow, db_session, sample_user, sample_cycle, sample_skills
+):
+    """First aggregation inserts every row, timestamps included."""
+    skills = sample_skills[:2]
+
+    await uow.user_skill_scores.replace_aggregated(
+        user_id=sample_user.id,
+        cycle_id=sample_cycle.id,
+        source="360_aggregated",
+        rows=[make_row(sample_user, sample_cycle, skill, 7.0) for skill in skills],
+    )
+    await db_session.commit()
+
+    scores = await fetch_scores(db_session, sample_user, sample_cycle)
+    assert set(scores) == {(skill.id, "360_aggregated") for skill in skills}
+    for row in scores.values():
+        assert row.score == 7.0
+        assert row.created_at is not None and row.updated_at is not None
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_replace_aggregated_updates_in_place_and_deletes_stale(
+    uow, db_session, sample_user, sample_cycle, sample_skills
+):
+    """Re-aggregation updates kept skills in place and drops everything else."""
+    kept, dropped, added = sample_skills[:3]
+    await uow.user_skill_scores.replace_aggregated(
+        user_id=sample_user.id,
+        cycle_id=sample_cycle.id,
+        source="360_aggregated",
+        rows=[make_row(sample_user, sample_cycle, skill, 6.0) for skill in (kept, dropped)],
+    )
+    # A row from another source for the kept skill is stale too
+    await uow.user_skill_scores.upsert_bulk(
+        [{**make_row(sample_user, sample_cycle, kept, 9.0), "source": "self_only"}]
+    )
+    await db_session.commit()
+    before = await fetch_scores(db_session, sample_user, sample_cycle)
+
+    await uow.user_skill_scores.replace_aggregated(
+        user_id=sample_user.id,
+        cycle_id=sample_cycle.id,
+        source="360_aggregated",
+        rows=[make_row(sample_user, sample_cycle, skill, 8.0) for skill in (kept, added)],
+    )
+    await db_session.commit()
+
+    after = await fetch_scores(db_session, sample_user, sample_cycle)
+    assert set(after) == {(kept.id, "360_aggregated"), (added.id, "360_aggregated")}
+    updated = after[(kept.id, "360_aggregated")]
+    original = before[(kept.id, "360_aggregated")]
+    assert updated.score == 8.0
+    assert updated.id == original.id, "Upsert should keep the existing row"
+    assert updated.created_at == original.created_at
+    assert after[(added.id, "360_aggregated")].created_at is not None
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_replace_aggregated_without_rows_clears_scores(
+    uow, db_session, sample_user, sample_cycle, sample_skills
+):
+    """An empty aggregation reduces to the DELETE of every score of the user in the cycle."""
+    await uow.user_skill_scores.replace_aggregated(
+        user_id=sample_user.id,
+        cycle_id=sample_cycle.id,
+        source="360_aggregated",
+        rows=[make_row(sample_user, sample_cycle, sample_skills[0], 5.0)],
+    )
+    await db_session.commit()
+
+    await uow.user_skill_scores.replace_aggregated(
+        user_id=sample_user.id,
+        cycle_id=sample_cycle.id,
+        source="360_aggregated",
+        rows=[],
+    )
+    await db_session.commit()
+
+    assert await fetch_scores(db_session, sample_user, sample_cycle) == {}
@@ -8,6 +8,7 @@ import pytest
 from app.domain.evaluation_logic import (
     is_cycle_complete_for_user,
     aggregate_competency_scores,
+    aggregate_grouped_competency_scores,
 )
 from app.domain.entities.evaluation import EvaluationEntity, CompetencyScore
 
@@ -511,3 +512,41 @@ def test_aggregate_scores_includes_raw_stats():
     assert raw_stats.get("self_avg") == 8.0
     assert raw_stats.get("manager_avg") == 7.0
     assert raw_stats.get("peer_avg") == 7.5
+
+
+@pytest.mark.unit
+def test_aggregate_grouped_scores_matches_entity_aggregation():
+    """
+    Pre-grouped (skill, relationship, scores) rows should aggregate exactly
+    like the evaluation entities they come from.
+    """
+    skill_a = uuid4()
+    skill_b = uuid4()
+    user_id = uuid4()
+    cycle_id = uuid4()
+
+    scored = [
+        ("self", skill_a, 8.0),
+        ("manager", skill_a, 7.0),
+        ("peer", skill_a, 6.5),
+        ("peer", skill_a, 9.0),
+        ("peer", skill_b, 5.0),
+    ]
+    evaluations = [
+        make_eval_with_score(
+            user_id=user_id,
+            cycle_id=cycle_id,
+            relationship=relationship,
+            skill_id=skill_id,
+            score=score,
+        )
+        for relationship, skill_id, score in scored
+    ]
+    groups = [
+        (skill_a, "self", [8.0]),
+        (skill_a, "manager", [7.0]),
+        (skill_a, "peer", [6.5, 9.0]),
+        (skill_b, "peer", [5.0]),
+    ]
+
+    assert aggregate_grouped_competency_scores(groups) == aggregate_competency_scores(evaluations)
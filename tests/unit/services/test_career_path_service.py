@@ -0,0 +1,62 @@
+"""Unit tests for CareerPathService helpers.
+
+Pure functions only; no UoW or AI client involved.
+"""
+
+import pytest
+
+from app.services.career_path_service import _classify_action_type
+
+
+# ============================================================================
+# Tests for _classify_action_type
+# ============================================================================
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "title, expected",
+    [
+        # Keywords as the AI usually writes them (ES/EN)
+        ("Curso de Liderazgo Avanzado", "course"),
+        ("Advanced Strategy Course", "course"),
+        ("Proyecto de expansión regional", "project"),
+        ("Mentoría con un Director", "mentoring"),
+        ("Shadowing del Gerente Regional", "shadowing"),
+        ("Certificación PMP", "certification"),
+        # Case-insensitive, plural and unaccented forms
+        ("curso online de finanzas", "course"),
+        ("Cursos de negociación", "course"),
+        ("Mentoria con pares", "mentoring"),
+        ("Certificaciones en gestión de riesgos", "certification"),
+        # Punctuation and hyphenated compounds
+        ("Curso-taller de comunicación", "course"),
+        ("Programa: proyecto piloto.", "project"),
+    ],
+)
+def test_classify_action_type_matches_keywords(title, expected):
+    """Whole keywords are matched regardless of case, plural or accents."""
+    assert _classify_action_type(title) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "title",
+    [
+        "Coursera: Data Analysis",  # Keyword inside another word
+        "Proyección financiera",
+        "Lectura recomendada",
+        "",
+    ],
+)
+def test_classify_action_type_defaults_to_other(title):
+    """Titles without a whole keyword are classified as "other"."""
+    assert _classify_action_type(title) == "other"
+
+
+@pytest.mark.unit
+def test_classify_action_type_prefers_highest_priority_type():
+    """When several types appear, course > project > mentoring > shadowing > certification."""
+    assert _classify_action_type("Certificación tras el curso") == "course"
+    assert _classify_action_type("Mentoría dentro del proyecto") == "project"
+    assert _classify_action_type("Shadowing y certificación") == "shadowing"
@@ -51,21 +51,6 @@ def make_evaluation_create(
     )
 
 
-def setup_session_execute_for_evaluations(mock_uow, evaluations: list):
-    """
-    Configura mock_uow.session.execute para que _aggregate_user_skill_scores()
-    devuelva exactamente la lista de evaluaciones proporcionada.
-    """
-    mock_result = MagicMock()
-    mock_scalars = MagicMock()
-    mock_scalars.unique.return_value.all.return_value = evaluations
-    mock_result.scalars.return_value = mock_scalars
-
-    mock_uow.session = MagicMock()
-    mock_uow.session.execute = AsyncMock(return_value=mock_result)
-    mock_uow.session.commit = AsyncMock()
-
-
 # ============================================================================
 # Tests for create_evaluation
 # ============================================================================
@@ -86,10 +71,6 @@ async def test_create_evaluation_success():
     cycle_id = uuid4()
     skill_id = uuid4()
 
-    mock_user = MagicMock(id=user_id, full_name="Test User")
-    mock_evaluator = MagicMock(id=evaluator_id, full_name="Test Evaluator")
-    mock_cycle = MagicMock(id=cycle_id, status="active")
-    
     # Configure skill mock properly - 'name' is special in MagicMock
     mock_skill = MagicMock()
     mock_skill.id = skill_id
@@ -109,14 +90,13 @@ async def test_create_evaluation_success():
 
     mock_uow = (
         builder
-        .with_users(mock_user, mock_evaluator)
-        .with_cycle(mock_cycle)
+        .with_creation_context()  # user, evaluator and active cycle exist
         .with_skills(mock_skill)  # Changed to with_skills for get_by_names
         .build()
     )
 
     mock_uow.evaluations.create = AsyncMock(return_value=mock_evaluation)
-    mock_uow.competency_scores.create_bulk = AsyncMock()
+    mock_uow.competency_scores.insert_many = AsyncMock()
     mock_uow.commit = AsyncMock()
 
     service = EvaluationService(mock_uow, mock_ai_client)
@@ -138,12 +118,16 @@ async def test_create_evaluation_success():
     assert result is not None, "Should return evaluation"
     assert result.id == mock_evaluation.id, "Should return created evaluation"
 
-    assert mock_uow.users.get_by_id.call_count == 2, "Should validate user and evaluator"
-    mock_uow.evaluation_cycles.get_by_id.assert_called_once_with(cycle_id)
+    # User, evaluator and cycle are validated together in one query
+    mock_uow.evaluations.get_creation_context.assert_called_once_with(
+        user_id, evaluator_id, cycle_id
+    )
     mock_uow.skills.get_by_names.assert_called_once_with(["Liderazgo"])
 
     mock_uow.evaluations.create.assert_called_once()
-    mock_uow.competency_scores.create_bulk.assert_called_once()
+    mock_uow.competency_scores.insert_many.assert_called_once()
+    score_rows = mock_uow.competency_scores.insert_many.call_args[0][0]
+    assert [(row["skill_id"], row["score"]) for row in score_rows] == [(skill_id, 8.5)]
     mock_uow.commit.assert_called_once()
 
 
@@ -156,10 +140,9 @@ async def test_create_evaluation_user_not_found():
     """
     builder = UowMockBuilder()
     mock_ai_client = AsyncMock()
-    mock_uow = builder.build()
 
     # User no existe
-    mock_uow.users.get_by_id = AsyncMock(return_value=None)
+    mock_uow = builder.with_creation_context(user_exists=False).build()
     mock_uow.commit = AsyncMock()
 
     service = EvaluationService(mock_uow, mock_ai_client)
@@ -197,16 +180,7 @@ async def test_create_evaluation_cycle_not_active():
     evaluator_id = uuid4()
     cycle_id = uuid4()
 
-    mock_user = MagicMock(id=user_id)
-    mock_evaluator = MagicMock(id=evaluator_id)
-    mock_cycle = MagicMock(id=cycle_id, status="closed")
-
-    mock_uow = (
-        builder
-        .with_users(mock_user, mock_evaluator)
-        .with_cycle(mock_cycle)
-        .build()
-    )
+    mock_uow = builder.with_creation_context(cycle_status="closed").build()
 
     service = EvaluationService(mock_uow, mock_ai_client)
 
@@ -240,16 +214,7 @@ async def test_create_evaluation_skill_not_found():
     evaluator_id = uuid4()
     cycle_id = uuid4()
 
-    mock_user = MagicMock(id=user_id)
-    mock_evaluator = MagicMock(id=evaluator_id)
-    mock_cycle = MagicMock(id=cycle_id, status="active")
-
-    mock_uow = (
-        builder
-        .with_users(mock_user, mock_evaluator)
-        .with_cycle(mock_cycle)
-        .build()
-    )
+    mock_uow = builder.with_creation_context().build()
 
     # Skill no encontrado - get_by_names returns empty list
     mock_uow.skills.get_by_names = AsyncMock(return_value=[])
@@ -271,8 +236,145 @@ async def test_create_evaluation_skill_not_found():
 
     error_msg = str(exc_info.value).lower()
     assert "skill" in error_msg or "competency" in error_msg, "Error should mention skill not found"
-    # Current service creates the Evaluation object but does not persist it (no commit)
-    mock_uow.evaluations.create.assert_called_once()
+    # Competencies are resolved before the evaluation is inserted
+    mock_uow.evaluations.create.assert_not_called()
+    mock_uow.commit.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_create_evaluation_reuses_resolved_skill_ids():
+    """
+    Should resolve a competency name against the catalog only once.
+    Later evaluations with the same competencies skip the skills query.
+    """
+    skill_id = uuid4()
+    mock_skill = MagicMock()
+    mock_skill.id = skill_id
+    mock_skill.name = "Liderazgo"
+
+    mock_uow = UowMockBuilder().with_creation_context().with_skills(mock_skill).build()
+    mock_evaluation = MagicMock(
+        id=uuid4(),
+        user_id=uuid4(),
+        evaluator_id=uuid4(),
+        evaluation_cycle_id=uuid4(),
+        evaluator_relationship="manager",
+        status="submitted",
+        submitted_at=datetime.now(),
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+    mock_uow.evaluations.create = AsyncMock(return_value=mock_evaluation)
+    mock_uow.commit = AsyncMock()
+
+    service = EvaluationService(mock_uow, AsyncMock())
+
+    for _ in range(2):
+        await service.create_evaluation(
+            make_evaluation_create(
+                user_id=mock_evaluation.user_id,
+                evaluator_id=mock_evaluation.evaluator_id,
+                cycle_id=mock_evaluation.evaluation_cycle_id,
+                competency_name="Liderazgo",
+            )
+        )
+
+    mock_uow.skills.get_by_names.assert_called_once_with(["Liderazgo"])
+    score_rows = mock_uow.competency_scores.insert_many.call_args[0][0]
+    assert [row["skill_id"] for row in score_rows] == [skill_id]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_create_evaluations_bulk_writes_once():
+    """
+    Should validate every evaluation, then insert all evaluations and all
+    their scores in one batch each, with a single commit.
+    """
+    skill_id = uuid4()
+    mock_skill = MagicMock()
+    mock_skill.id = skill_id
+    mock_skill.name = "Liderazgo"
+
+    mock_uow = UowMockBuilder().with_creation_context().with_skills(mock_skill).build()
+
+    def _flush(evaluations):
+        # Stand-in for the client-side timestamp defaults applied on flush
+        for evaluation in evaluations:
+            evaluation.created_at = evaluation.updated_at = datetime.now()
+
+    mock_uow.evaluations.create_many = AsyncMock(side_effect=_flush)
+    mock_uow.commit = AsyncMock()
+
+    service = EvaluationService(mock_uow, AsyncMock())
+
+    user_id = uuid4()
+    cycle_id = uuid4()
+    evaluator_ids = [uuid4(), uuid4(), uuid4()]
+
+    results = await service.create_evaluations_bulk(
+        [
+            make_evaluation_create(
+                user_id=user_id,
+                evaluator_id=evaluator_id,
+                cycle_id=cycle_id,
+                relationship="peer",
+                competency_name="Liderazgo",
+            )
+            for evaluator_id in evaluator_ids
+        ]
+    )
+
+    assert [result.evaluator_id for result in results] == evaluator_ids
+    # One query for the whole batch, with the ids deduplicated
+    mock_uow.evaluations.get_creation_contexts.assert_awaited_once_with(
+        {user_id, *evaluator_ids}, {cycle_id}
+    )
+    mock_uow.evaluations.get_creation_context.assert_not_called()
+    mock_uow.skills.get_by_names.assert_called_once_with(["Liderazgo"])
+    mock_uow.evaluations.create_many.assert_called_once()
+    score_rows = mock_uow.competency_scores.insert_many.call_args[0][0]
+    assert [row["evaluation_id"] for row in score_rows] == [result.id for result in results]
+    assert {row["skill_id"] for row in score_rows} == {skill_id}
+    mock_uow.commit.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_create_evaluations_bulk_missing_evaluator_writes_nothing():
+    """
+    Should raise NotFoundError for an evaluator missing from the batched
+    check, before any evaluation is written.
+    """
+    user_id = uuid4()
+    cycle_id = uuid4()
+    known_evaluator, missing_evaluator = uuid4(), uuid4()
+
+    mock_uow = UowMockBuilder().build()
+    mock_uow.evaluations.get_creation_contexts = AsyncMock(
+        return_value=({user_id, known_evaluator}, {cycle_id: "active"})
+    )
+    mock_uow.commit = AsyncMock()
+
+    service = EvaluationService(mock_uow, AsyncMock())
+
+    with pytest.raises(NotFoundError) as exc_info:
+        await service.create_evaluations_bulk(
+            [
+                make_evaluation_create(
+                    user_id=user_id,
+                    evaluator_id=evaluator_id,
+                    cycle_id=cycle_id,
+                    relationship="peer",
+                    competency_name="Liderazgo",
+                )
+                for evaluator_id in (known_evaluator, missing_evaluator)
+            ]
+        )
+
+    assert str(missing_evaluator) in str(exc_info.value)
+    mock_uow.evaluations.create_many.assert_not_called()
     mock_uow.commit.assert_not_called()
 
 
@@ -295,21 +397,17 @@ async def test_process_evaluation_cycle_incomplete():
     user_id = uuid4()
     cycle_id = uuid4()
 
-    # Evaluación raíz
-    mock_evaluation = MagicMock(
-        id=evaluation_id,
-        user_id=user_id,
-        evaluation_cycle_id=cycle_id,
-    )
-    mock_uow.evaluations.get_by_id = AsyncMock(return_value=mock_evaluation)
-
     # Faltan evaluaciones de manager
     mock_evaluations = [
         MagicMock(evaluator_relationship="self", status="submitted"),
         MagicMock(evaluator_relationship="peer", status="submitted"),
         MagicMock(evaluator_relationship="peer", status="submitted"),
     ]
-    mock_uow.evaluations.get_by_user_and_cycle = AsyncMock(return_value=mock_evaluations)
+    # La evaluación procesada es una de las del usuario en el ciclo
+    mock_evaluations[0].configure_mock(
+        id=evaluation_id, user_id=user_id, evaluation_cycle_id=cycle_id
+    )
+    mock_uow.evaluations.get_with_cycle_siblings = AsyncMock(return_value=mock_evaluations)
 
     service = EvaluationService(mock_uow, mock_ai_client)
 
@@ -321,6 +419,25 @@ async def test_process_evaluation_cycle_incomplete():
     mock_ai_client.assess_skills.assert_not_called()
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_process_evaluation_not_found():
+    """
+    Should raise NotFoundError when the evaluation does not exist.
+    """
+    mock_uow = UowMockBuilder().build()
+    evaluation_id = uuid4()
+
+    service = EvaluationService(mock_uow, AsyncMock())
+
+    with pytest.raises(NotFoundError):
+        await service.process_evaluation(evaluation_id)
+
+    mock_uow.evaluations.get_with_cycle_siblings.assert_called_once_with(evaluation_id)
+    mock_uow.user_skill_scores.replace_aggregated.assert_not_called()
+    mock_uow.commit.assert_not_called()
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_process_evaluation_aggregates_scores():
@@ -336,44 +453,41 @@ async def test_process_evaluation_aggregates_scores():
     cycle_id = uuid4()
     skill_id = uuid4()
 
-    mock_evaluation = MagicMock(
-        id=evaluation_id,
-        user_id=user_id,
-        evaluation_cycle_id=cycle_id,
-    )
-    mock_uow.evaluations.get_by_id = AsyncMock(return_value=mock_evaluation)
-
     # Podemos usar MagicMocks o el helper create_evaluation_with_scores si ya lo tienes.
     # Aquí mantengo MagicMock para no asumir la firma de tu helper.
     mock_evaluations = [
         MagicMock(
             evaluator_relationship="self",
             status="submitted",
-            competency_scores=[MagicMock(skill_id=skill_id, score=9.0)],
         ),
         MagicMock(
             evaluator_relationship="manager",
             status="submitted",
-            competency_scores=[MagicMock(skill_id=skill_id, score=8.0)],
         ),
         MagicMock(
             evaluator_relationship="peer",
             status="submitted",
-            competency_scores=[MagicMock(skill_id=skill_id, score=7.0)],
         ),
         MagicMock(
             evaluator_relationship="peer",
             status="submitted",
-            competency_scores=[MagicMock(skill_id=skill_id, score=8.0)],
         ),
     ]
-    mock_uow.evaluations.get_by_user_and_cycle = AsyncMock(return_value=mock_evaluations)
-
-    mock_uow.user_skill_scores.delete_by_user_and_cycle = AsyncMock()
-    mock_uow.user_skill_scores.create_bulk = AsyncMock()
-
-    # Reutilizamos la misma lista para la agregación interna
-    setup_session_execute_for_evaluations(mock_uow, mock_evaluations)
+    # La evaluación procesada es una de las del usuario en el ciclo
+    mock_evaluations[0].configure_mock(
+        id=evaluation_id, user_id=user_id, evaluation_cycle_id=cycle_id
+    )
+    mock_uow.evaluations.get_with_cycle_siblings = AsyncMock(return_value=mock_evaluations)
+
+    # Scores agrupados por (skill, relación), como los devuelve el GROUP BY
+    mock_uow.competency_scores.get_grouped_submitted = AsyncMock(
+        return_value=[
+            (skill_id, "self", [9.0]),
+            (skill_id, "manager", [8.0]),
+            (skill_id, "peer", [7.0, 8.0]),
+        ]
+    )
+    mock_uow.user_skill_scores.replace_aggregated = AsyncMock()
 
     mock_uow.commit = AsyncMock()
 
@@ -381,14 +495,17 @@ async def test_process_evaluation_aggregates_scores():
 
     result = await service.process_evaluation(evaluation_id)
 
-    mock_uow.user_skill_scores.delete_by_user_and_cycle.assert_called_once_with(
-        user_id=user_id,
-        cycle_id=cycle_id,
-    )
-    mock_uow.user_skill_scores.create_bulk.assert_called_once()
+    mock_uow.user_skill_scores.replace_aggregated.assert_called_once()
+    replace_kwargs = mock_uow.user_skill_scores.replace_aggregated.call_args.kwargs
+    assert replace_kwargs["user_id"] == user_id
+    assert replace_kwargs["cycle_id"] == cycle_id
+    assert replace_kwargs["source"] == "360_aggregated"
 
-    create_args = mock_uow.user_skill_scores.create_bulk.call_args[0][0]
-    assert len(create_args) > 0, "Should create at least one user skill score"
+    upsert_rows = replace_kwargs["rows"]
+    assert len(upsert_rows) > 0, "Should upsert at least one user skill score"
+    assert upsert_rows[0]["skill_id"] == skill_id
+    assert upsert_rows[0]["score"] == pytest.approx(8.0), "Should average all submitted scores"
+    mock_uow.competency_scores.get_grouped_submitted.assert_called_once_with(user_id, cycle_id)
 
     assert result["cycle_complete"] is True
     assert result["user_id"] == user_id
@@ -414,13 +531,6 @@ async def test_process_evaluation_calls_ai_skills_client():
     cycle_id = uuid4()
     skill_id = uuid4()
 
-    mock_evaluation = MagicMock(
-        id=evaluation_id,
-        user_id=user_id,
-        evaluation_cycle_id=cycle_id,
-    )
-    mock_uow.evaluations.get_by_id = AsyncMock(return_value=mock_evaluation)
-
     mock_user = MagicMock(
         id=user_id,
         position="Software Engineer",
@@ -432,38 +542,36 @@ async def test_process_evaluation_calls_ai_skills_client():
         MagicMock(
             evaluator_relationship="self",
             status="submitted",
-            competency_scores=[
-                MagicMock(skill_id=skill_id, score=8.0, skill=MagicMock(name="Liderazgo"))
-            ],
         ),
         MagicMock(
             evaluator_relationship="manager",
             status="submitted",
-            competency_scores=[
-                MagicMock(skill_id=skill_id, score=7.0, skill=MagicMock(name="Liderazgo"))
-            ],
         ),
         MagicMock(
             evaluator_relationship="peer",
             status="submitted",
-            competency_scores=[
-                MagicMock(skill_id=skill_id, score=7.5, skill=MagicMock(name="Liderazgo"))
-            ],
         ),
         MagicMock(
             evaluator_relationship="peer",
             status="submitted",
-            competency_scores=[
-                MagicMock(skill_id=skill_id, score=8.0, skill=MagicMock(name="Liderazgo"))
-            ],
         ),
     ]
-    mock_uow.evaluations.get_by_user_and_cycle = AsyncMock(return_value=mock_evaluations)
-
-    mock_uow.user_skill_scores.delete_by_user_and_cycle = AsyncMock(return_value=0)
-    mock_uow.user_skill_scores.create_bulk = AsyncMock()
+    # La evaluación procesada es una de las del usuario en el ciclo
+    mock_evaluations[0].configure_mock(
+        id=evaluation_id, user_id=user_id, evaluation_cycle_id=cycle_id
+    )
+    mock_uow.evaluations.get_with_cycle_siblings = AsyncMock(return_value=mock_evaluations)
+
+    # Scores agrupados por (skill, relación), como los devuelve el GROUP BY
+    mock_uow.competency_scores.get_grouped_submitted = AsyncMock(
+        return_value=[
+            (skill_id, "self", [8.0]),
+            (skill_id, "manager", [7.0]),
+            (skill_id, "peer", [7.5, 8.0]),
+        ]
+    )
+    mock_uow.user_skill_scores.replace_aggregated = AsyncMock()
 
-    setup_session_execute_for_evaluations(mock_uow, mock_evaluations)
     mock_uow.commit = AsyncMock()
 
     service = EvaluationService(mock_uow, mock_ai_client)
@@ -474,8 +582,7 @@ async def test_process_evaluation_calls_ai_skills_client():
     assert result["user_id"] == user_id
     assert "Ready for Skills Assessment" in result["message"]
 
-    mock_uow.user_skill_scores.delete_by_user_and_cycle.assert_called_once()
-    mock_uow.user_skill_scores.create_bulk.assert_called_once()
+    mock_uow.user_skill_scores.replace_aggregated.assert_called_once()
     # No afirmamos llamada al AI client: ese flujo vive en otro servicio.
 
 
@@ -495,41 +602,40 @@ async def test_process_evaluation_completes_successfully():
     cycle_id = uuid4()
     skill_id = uuid4()
 
-    mock_evaluation = MagicMock(
-        id=evaluation_id,
-        user_id=user_id,
-        evaluation_cycle_id=cycle_id,
-    )
-    mock_uow.evaluations.get_by_id = AsyncMock(return_value=mock_evaluation)
-
     mock_evaluations = [
         MagicMock(
             evaluator_relationship="self",
             status="submitted",
-            competency_scores=[MagicMock(skill_id=skill_id, score=8.0)],
         ),
         MagicMock(
             evaluator_relationship="manager",
             status="submitted",
-            competency_scores=[MagicMock(skill_id=skill_id, score=7.0)],
         ),
         MagicMock(
             evaluator_relationship="peer",
             status="submitted",
-            competency_scores=[MagicMock(skill_id=skill_id, score=7.5)],
         ),
         MagicMock(
             evaluator_relationship="peer",
             status="submitted",
-            competency_scores=[MagicMock(skill_id=skill_id, score=8.0)],
         ),
     ]
-    mock_uow.evaluations.get_by_user_and_cycle = AsyncMock(return_value=mock_evaluations)
-
-    mock_uow.user_skill_scores.delete_by_user_and_cycle = AsyncMock(return_value=0)
-    mock_uow.user_skill_scores.create_bulk = AsyncMock()
+    # La evaluación procesada es una de las del usuario en el ciclo
+    mock_evaluations[0].configure_mock(
+        id=evaluation_id, user_id=user_id, evaluation_cycle_id=cycle_id
+    )
+    mock_uow.evaluations.get_with_cycle_siblings = AsyncMock(return_value=mock_evaluations)
+
+    # Scores agrupados por (skill, relación), como los devuelve el GROUP BY
+    mock_uow.competency_scores.get_grouped_submitted = AsyncMock(
+        return_value=[
+            (skill_id, "self", [8.0]),
+            (skill_id, "manager", [7.0]),
+            (skill_id, "peer", [7.5, 8.0]),
+        ]
+    )
+    mock_uow.user_skill_scores.replace_aggregated = AsyncMock()
 
-    setup_session_execute_for_evaluations(mock_uow, mock_evaluations)
     mock_uow.commit = AsyncMock()
 
     service = EvaluationService(mock_uow, mock_ai_client)
@@ -541,8 +647,7 @@ async def test_process_evaluation_completes_successfully():
     assert result["user_id"] == user_id
     assert result["cycle_id"] == cycle_id
 
-    mock_uow.user_skill_scores.delete_by_user_and_cycle.assert_called_once_with(
-        user_id=user_id,
-        cycle_id=cycle_id,
-    )
-    mock_uow.user_skill_scores.create_bulk.assert_called_once()
+    mock_uow.user_skill_scores.replace_aggregated.assert_called_once()
+    replace_kwargs = mock_uow.user_skill_scores.replace_aggregated.call_args.kwargs
+    assert [row["skill_id"] for row in replace_kwargs["rows"]] == [skill_id]
+    mock_uow.commit.assert_called_once()